@@ -131,6 +131,13 @@ class RobotClientConfig:
     chunk_size_threshold: float = field(default=0.5, metadata={"help": "Threshold for chunk size control"})
     fps: int = field(default=DEFAULT_FPS, metadata={"help": "Frames per second"})
 
+    # Observations whose state is closer than this (in joint space) to the last sent observation are not sent,
+    # unless the action queue is empty. The server would filter them out anyway, this saves serializing and
+    # sending their images.
+    obs_similarity_atol: float = field(
+        default=1.0, metadata={"help": "Joint-space distance under which observations are not sent"}
+    )
+
     # Aggregate function configuration (CLI-compatible)
     aggregate_fn_name: str = field(
         default="weighted_average",
@@ -167,6 +174,9 @@ class RobotClientConfig:
         if self.fps <= 0:
             raise ValueError(f"fps must be positive, got {self.fps}")
 
+        if self.obs_similarity_atol < 0:
+            raise ValueError(f"obs_similarity_atol must be non-negative, got {self.obs_similarity_atol}")
+
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
@@ -190,4 +200,5 @@ class RobotClientConfig:
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
+            "obs_similarity_atol": self.obs_similarity_atol,
         }
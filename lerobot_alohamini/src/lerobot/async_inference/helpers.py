@@ -15,10 +15,14 @@
 import logging
 import logging.handlers
 import os
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from queue import Empty
 
+import numpy as np
 import torch
 
 from lerobot.configs.types import PolicyFeature
@@ -224,6 +228,181 @@ class TimedAction(TimedData):
         return self.action
 
 
+class TimedActionQueue:
+    """Thread-safe, timestep-indexed ring buffer of actions.
+
+    Actions are stored in a preallocated (capacity, action_dim) tensor where the slot of an action is
+    `timestep % capacity`. A boolean mask flags which slots hold a queued action, and the timestep stored in
+    each slot disambiguates wrap-around. This makes popping the next action and querying the queue size O(1),
+    and lets an incoming chunk be aggregated with the queued actions in a single vectorised blend over the
+    overlapping timesteps, instead of rebuilding a `Queue` of `TimedAction` objects one element at a time.
+
+    Buffers are allocated lazily from the first action seen, and grown when a chunk longer than the current
+    capacity arrives.
+
+    Args:
+        capacity: Initial number of slots. Typically the number of actions per chunk.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self.lock = threading.Lock()
+        self._capacity = capacity
+        self._actions: torch.Tensor | None = None  # (capacity, action_dim)
+        self._timesteps: torch.Tensor | None = None  # (capacity,) timestep held by each slot
+        self._timestamps: torch.Tensor | None = None  # (capacity,) float64
+        self._valid: torch.Tensor | None = None  # (capacity,) bool
+        self._head = 0  # timestep of the next action to pop
+        self._tail = 0  # one past the timestep of the last queued action
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def qsize(self) -> int:
+        """Number of queued actions."""
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def first_and_last_timestep(self) -> tuple[int, int] | None:
+        """Timesteps of the first and last queued actions, or None if the queue is empty."""
+        with self.lock:
+            if self._size == 0:
+                return None
+            return self._head, self._tail - 1
+
+    def timesteps(self) -> list[int]:
+        """Sorted list of the queued timesteps. O(n), intended for logging and debugging only."""
+        with self.lock:
+            if self._size == 0:
+                return []
+            steps = torch.arange(self._head, self._tail)
+            slots = steps % self._capacity
+            keep = self._valid[slots] & (self._timesteps[slots] == steps)
+            return steps[keep].tolist()
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def get_nowait(self) -> TimedAction:
+        """Pop the action with the smallest queued timestep.
+
+        Raises:
+            queue.Empty: If there are no queued actions.
+        """
+        with self.lock:
+            while self._size > 0 and self._head < self._tail:
+                timestep = self._head
+                slot = timestep % self._capacity
+                self._head += 1
+                if not self._valid[slot] or self._timesteps[slot] != timestep:
+                    continue  # gap in the queued timesteps
+
+                self._valid[slot] = False
+                self._size -= 1
+                return TimedAction(
+                    timestamp=self._timestamps[slot].item(),
+                    timestep=timestep,
+                    action=self._actions[slot].clone(),
+                )
+
+        raise Empty
+
+    def put(self, timed_action: TimedAction):
+        """Queue a single action, overwriting any action already queued for the same timestep."""
+        timestep = timed_action.get_timestep()
+        action = timed_action.get_action()
+        with self.lock:
+            head = timestep if self._size == 0 else min(self._head, timestep)
+            tail = timestep + 1 if self._size == 0 else max(self._tail, timestep + 1)
+            self._ensure_storage(action, span=tail - head)
+
+            slot = timestep % self._capacity
+            if not (self._valid[slot] and self._timesteps[slot] == timestep):
+                self._size += 1
+            self._actions[slot] = action
+            self._timesteps[slot] = timestep
+            self._timestamps[slot] = timed_action.get_timestamp()
+            self._valid[slot] = True
+            self._head, self._tail = head, tail
+
+    def aggregate(
+        self,
+        incoming_actions: list[TimedAction],
+        latest_action: int,
+        aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor],
+    ):
+        """Replace the queue contents with `incoming_actions`, blending the ones that overlap with queued
+        actions through `aggregate_fn(queued, incoming)`.
+
+        Incoming actions whose timestep is not greater than `latest_action` (i.e. already executed) are
+        discarded, as are queued actions not covered by the incoming chunk.
+        """
+        fresh = [action for action in incoming_actions if action.get_timestep() > latest_action]
+        if not fresh:
+            self.clear()
+            return
+
+        # Stacking happens outside of the lock so that the control loop is only blocked by the blend
+        new_actions = torch.stack([action.get_action() for action in fresh])
+        new_timesteps = torch.tensor([action.get_timestep() for action in fresh], dtype=torch.long)
+        new_timestamps = torch.tensor([action.get_timestamp() for action in fresh], dtype=torch.float64)
+        head = int(new_timesteps.min())
+        tail = int(new_timesteps.max()) + 1
+
+        with self.lock:
+            self._ensure_storage(new_actions[0], span=tail - head)
+            new_actions = new_actions.to(device=self._actions.device, dtype=self._actions.dtype)
+
+            slots = new_timesteps % self._capacity
+            overlap = self._valid[slots] & (self._timesteps[slots] == new_timesteps)
+            if overlap.any():
+                blended = aggregate_fn(self._actions[slots], new_actions)
+                overlap = overlap.view(-1, *([1] * (new_actions.ndim - 1)))
+                new_actions = torch.where(overlap, blended, new_actions)
+
+            self._valid.zero_()
+            self._actions[slots] = new_actions
+            self._timesteps[slots] = new_timesteps
+            self._timestamps[slots] = new_timestamps
+            self._valid[slots] = True
+            self._head, self._tail = head, tail
+            self._size = int(self._valid.sum())
+
+    def _clear(self):
+        if self._valid is not None:
+            self._valid.zero_()
+        self._head = self._tail = self._size = 0
+
+    def _ensure_storage(self, action: torch.Tensor, span: int):
+        """Allocate the ring buffers, or grow them so that `span` consecutive timesteps fit. Must be called
+        with the lock held."""
+        if self._actions is not None and span <= self._capacity:
+            return
+
+        capacity = max(self._capacity, span, 1)
+        actions = torch.zeros((capacity, *action.shape), dtype=action.dtype, device=action.device)
+        timesteps = torch.full((capacity,), -1, dtype=torch.long)
+        timestamps = torch.zeros(capacity, dtype=torch.float64)
+        valid = torch.zeros(capacity, dtype=torch.bool)
+
+        if self._actions is not None and self._size > 0:
+            # Re-insert the queued actions at their slot in the larger buffer
+            old_slots = self._valid.nonzero().squeeze(-1)
+            steps = self._timesteps[old_slots]
+            new_slots = steps % capacity
+            actions[new_slots] = self._actions[old_slots]
+            timesteps[new_slots] = steps
+            timestamps[new_slots] = self._timestamps[old_slots]
+            valid[new_slots] = True
+
+        self._capacity = capacity
+        self._actions, self._timesteps, self._timestamps, self._valid = actions, timesteps, timestamps, valid
+
+
 @dataclass
 class TimedObservation(TimedData):
     observation: RawObservation
@@ -294,3 +473,76 @@ def observations_similar(
     )
 
     return _compare_observation_states(obs1_state, obs2_state, atol=atol)
+
+
+class ObservationStateTracker:
+    """Joint-space distance between the observations captured by the client and the last one the server
+    processed.
+
+    The state of every observation is gathered into a preallocated buffer following the fixed order of
+    `state_keys`, so that tracking it doesn't allocate. The distance is the one used by `observations_similar`.
+    The server compares the observations it receives with the last one it ran inference on, so the state of a
+    sent observation only becomes the reference once an action chunk comes back for its timestep.
+
+    Args:
+        state_keys: Keys of the raw observation making up the state, in the order of the `observation.state`
+            feature.
+        atol: Observations closer than this to the reference are similar. 0 makes every observation
+            dissimilar.
+        max_pending: Number of sent observations waiting for their action chunk that are kept track of.
+    """
+
+    def __init__(self, state_keys: list[str], atol: float = 1, max_pending: int = 8):
+        self.state_keys = list(state_keys)
+        self.atol = atol
+        self._state = np.zeros(len(self.state_keys), dtype=np.float32)
+        self._reference = np.zeros_like(self._state)
+        self._delta = np.zeros_like(self._state)
+        self._has_reference = False
+        # States of the sent observations, by timestep (-1 for a free entry)
+        self._pending_states = np.zeros((max_pending, len(self.state_keys)), dtype=np.float32)
+        self._pending_timesteps = [-1] * max_pending
+        self._next_pending = 0
+        # `mark_processed` is called from the thread receiving the actions
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> np.ndarray:
+        """State of the last observation passed to `update`. The buffer is overwritten by the next update."""
+        return self._state
+
+    def update(self, raw_observation: RawObservation) -> bool:
+        """Read the state of `raw_observation`. Returns True if it is similar to the reference."""
+        for i, key in enumerate(self.state_keys):
+            self._state[i] = raw_observation[key]
+        with self._lock:
+            if not self._has_reference:
+                return False
+            np.subtract(self._state, self._reference, out=self._delta)
+        return bool(np.linalg.norm(self._delta) < self.atol)
+
+    def mark_sent(self, timestep: int):
+        """Remember the last updated state as the one of the observation sent for `timestep`. The server runs
+        inference at most once per timestep, on the first observation it gets for it."""
+        with self._lock:
+            if timestep in self._pending_timesteps:
+                return
+            np.copyto(self._pending_states[self._next_pending], self._state)
+            self._pending_timesteps[self._next_pending] = timestep
+            self._next_pending = (self._next_pending + 1) % len(self._pending_timesteps)
+
+    def mark_processed(self, timestep: int):
+        """Make the state sent for `timestep` the reference, once an action chunk came back for it. Observations
+        sent for earlier timesteps won't be processed anymore and are forgotten."""
+        with self._lock:
+            for i, pending_timestep in enumerate(self._pending_timesteps):
+                if pending_timestep == timestep:
+                    np.copyto(self._reference, self._pending_states[i])
+                    self._has_reference = True
+                if pending_timestep <= timestep:
+                    self._pending_timesteps[i] = -1
+
+    def reset(self):
+        with self._lock:
+            self._has_reference = False
+            self._pending_timesteps = [-1] * len(self._pending_timesteps)
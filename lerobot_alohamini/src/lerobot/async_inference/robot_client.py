@@ -39,7 +39,6 @@ import time
 from collections.abc import Callable
 from dataclasses import asdict
 from pprint import pformat
-from queue import Queue
 from typing import Any
 
 import draccus
@@ -62,6 +61,8 @@ from lerobot.transport import (
     services_pb2_grpc,  # type: ignore
 )
 from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_STATE
+from lerobot.utils.robot_utils import RateScheduler
 
 from .configs import RobotClientConfig
 from .constants import SUPPORTED_ROBOTS
@@ -69,9 +70,11 @@ from .helpers import (
     Action,
     FPSTracker,
     Observation,
+    ObservationStateTracker,
     RawObservation,
     RemotePolicyConfig,
     TimedAction,
+    TimedActionQueue,
     TimedObservation,
     get_logger,
     map_robot_keys_to_lerobot_features,
@@ -121,14 +124,22 @@ class RobotClient:
 
         self._chunk_size_threshold = config.chunk_size_threshold
 
-        self.action_queue = Queue()
-        self.action_queue_lock = threading.Lock()  # Protect queue operations
+        # Timestep-indexed ring buffer, guarded by its own lock
+        self.action_queue = TimedActionQueue(capacity=config.actions_per_chunk)
         self.action_queue_size = []
         self.start_barrier = threading.Barrier(2)  # 2 threads: action receiver, control loop
 
         # FPS measurement
         self.fps_tracker = FPSTracker(target_fps=self.config.fps)
 
+        # The schema of the observations and actions is fixed, the control loop reuses the same buffers
+        # every tick instead of rebuilding them from the feature names
+        self._observation_buffer: RawObservation = {}
+        state_keys = lerobot_features[OBS_STATE]["names"] if OBS_STATE in lerobot_features else []
+        self.state_tracker = ObservationStateTracker(state_keys, atol=config.obs_similarity_atol)
+        self._action_keys = list(self.robot.action_features)
+        self._action_buffer = dict.fromkeys(self._action_keys, 0.0)
+
         self.logger.info("Robot connected and ready")
 
         # Use an event for thread-safe coordination
@@ -214,9 +225,8 @@ class RobotClient:
             return False
 
     def _inspect_action_queue(self):
-        with self.action_queue_lock:
-            queue_size = self.action_queue.qsize()
-            timestamps = sorted([action.get_timestep() for action in self.action_queue.queue])
+        queue_size = self.action_queue.qsize()
+        timestamps = self.action_queue.timesteps()
         self.logger.debug(f"Queue size: {queue_size}, Queue contents: {timestamps}")
         return queue_size, timestamps
 
@@ -231,39 +241,11 @@ class RobotClient:
             def aggregate_fn(x1, x2):
                 return x2
 
-        future_action_queue = Queue()
-        with self.action_queue_lock:
-            internal_queue = self.action_queue.queue
-
-        current_action_queue = {action.get_timestep(): action.get_action() for action in internal_queue}
-
-        for new_action in incoming_actions:
-            with self.latest_action_lock:
-                latest_action = self.latest_action
-
-            # New action is older than the latest action in the queue, skip it
-            if new_action.get_timestep() <= latest_action:
-                continue
-
-            # If the new action's timestep is not in the current action queue, add it directly
-            elif new_action.get_timestep() not in current_action_queue:
-                future_action_queue.put(new_action)
-                continue
-
-            # If the new action's timestep is in the current action queue, aggregate it
-            # TODO: There is probably a way to do this with broadcasting of the two action tensors
-            future_action_queue.put(
-                TimedAction(
-                    timestamp=new_action.get_timestamp(),
-                    timestep=new_action.get_timestep(),
-                    action=aggregate_fn(
-                        current_action_queue[new_action.get_timestep()], new_action.get_action()
-                    ),
-                )
-            )
+        with self.latest_action_lock:
+            latest_action = self.latest_action
 
-        with self.action_queue_lock:
-            self.action_queue = future_action_queue
+        # New actions older than the latest performed action are skipped, overlapping ones are blended
+        self.action_queue.aggregate(incoming_actions, latest_action, aggregate_fn)
 
     def receive_actions(self, verbose: bool = False):
         """Receive actions from the policy server"""
@@ -318,6 +300,11 @@ class RobotClient:
                 self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
                 queue_update_time = time.perf_counter() - start_time
 
+                if len(timed_actions) > 0:
+                    # The chunk starts at the timestep of the observation the server ran inference on, which
+                    # becomes the reference the server compares the next observations with
+                    self.state_tracker.mark_processed(timed_actions[0].get_timestep())
+
                 self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
 
                 if verbose:
@@ -344,22 +331,22 @@ class RobotClient:
 
     def actions_available(self):
         """Check if there are actions available in the queue"""
-        with self.action_queue_lock:
-            return not self.action_queue.empty()
+        return not self.action_queue.empty()
 
     def _action_tensor_to_action_dict(self, action_tensor: torch.Tensor) -> dict[str, float]:
-        action = {key: action_tensor[i].item() for i, key in enumerate(self.robot.action_features)}
-        return action
+        """Write the values of `action_tensor` in the action dict reused every tick, with a single
+        conversion of the tensor instead of one per robot key."""
+        for key, value in zip(self._action_keys, action_tensor.tolist(), strict=True):
+            self._action_buffer[key] = value
+        return self._action_buffer
 
     def control_loop_action(self, verbose: bool = False) -> dict[str, Any]:
         """Reading and performing actions in local queue"""
 
-        # Lock only for queue operations
         get_start = time.perf_counter()
-        with self.action_queue_lock:
-            self.action_queue_size.append(self.action_queue.qsize())
-            # Get action from queue
-            timed_action = self.action_queue.get_nowait()
+        self.action_queue_size.append(self.action_queue.qsize())
+        # Get action from queue
+        timed_action = self.action_queue.get_nowait()
         get_end = time.perf_counter() - get_start
 
         _performed_action = self.robot.send_action(
@@ -369,8 +356,7 @@ class RobotClient:
             self.latest_action = timed_action.get_timestep()
 
         if verbose:
-            with self.action_queue_lock:
-                current_queue_size = self.action_queue.qsize()
+            current_queue_size = self.action_queue.qsize()
 
             self.logger.debug(
                 f"Ts={timed_action.get_timestamp()} | "
@@ -386,16 +372,19 @@ class RobotClient:
 
     def _ready_to_send_observation(self):
         """Flags when the client is ready to send an observation"""
-        with self.action_queue_lock:
-            return self.action_queue.qsize() / self.action_chunk_size <= self._chunk_size_threshold
+        return self.action_queue.qsize() / self.action_chunk_size <= self._chunk_size_threshold
 
     def control_loop_observation(self, task: str, verbose: bool = False) -> RawObservation:
         try:
             # Get serialized observation bytes from the function
             start_time = time.perf_counter()
 
-            raw_observation: RawObservation = self.robot.get_observation()
+            # The robot returns the same keys every tick, updating the buffer doesn't resize it. The robot
+            # still builds a new dict for every observation.
+            raw_observation = self._observation_buffer
+            raw_observation.update(self.robot.get_observation())
             raw_observation["task"] = task
+            similar = self.state_tracker.update(raw_observation)
 
             with self.latest_action_lock:
                 latest_action = self.latest_action
@@ -409,11 +398,18 @@ class RobotClient:
             obs_capture_time = time.perf_counter() - start_time
 
             # If there are no actions left in the queue, the observation must go through processing!
-            with self.action_queue_lock:
-                observation.must_go = self.must_go.is_set() and self.action_queue.empty()
-                current_queue_size = self.action_queue.qsize()
+            current_queue_size = self.action_queue.qsize()
+            observation.must_go = self.must_go.is_set() and current_queue_size == 0
+
+            if similar and not observation.must_go:
+                self.logger.debug(
+                    f"Not sending observation #{observation.get_timestep()} - "
+                    "too similar to the last one the server processed"
+                )
+                return raw_observation
 
-            _ = self.send_observation(observation)
+            if self.send_observation(observation):
+                self.state_tracker.mark_sent(observation.get_timestep())
 
             self.logger.debug(f"QUEUE SIZE: {current_queue_size} (Must go: {observation.must_go})")
             if observation.must_go:
@@ -448,6 +444,8 @@ class RobotClient:
         _performed_action = None
         _captured_observation = None
 
+        scheduler = RateScheduler(self.config.fps)
+        scheduler.start()
         while self.running:
             control_loop_start = time.perf_counter()
             """Control loop: (1) Performing actions, when available"""
@@ -459,8 +457,8 @@ class RobotClient:
                 _captured_observation = self.control_loop_observation(task, verbose)
 
             self.logger.debug(f"Control loop (ms): {(time.perf_counter() - control_loop_start) * 1000:.2f}")
-            # Dynamically adjust sleep time to maintain the desired control frequency
-            time.sleep(max(0, self.config.environment_dt - (time.perf_counter() - control_loop_start)))
+            # Wait for the next tick of the fixed rate schedule
+            scheduler.sleep()
 
         return _captured_observation, _performed_action
 
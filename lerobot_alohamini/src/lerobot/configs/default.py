@@ -35,6 +35,10 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Frames read ahead by each shard when streaming (0 disables prefetching), and maximum number of video
+    # decodes in flight
+    streaming_prefetch_size: int = 8
+    streaming_decode_workers: int = 4
 
 
 @dataclass
@@ -56,6 +60,13 @@ class EvalConfig:
     batch_size: int = 50
     # `use_async_envs` specifies whether to use asynchronous environments (multiprocessing).
     use_async_envs: bool = False
+    # Number of worker processes evaluating the tasks in parallel, each loading the policy once. 0 evaluates in
+    # the main process. With workers, the results are saved incrementally in the output directory and an
+    # interrupted evaluation resumes when relaunched with the same `output_dir`.
+    num_workers: int = 0
+    # Whether to transfer the camera images to the policy device as uint8 (through pinned memory on GPU), and
+    # convert them to float32 there, instead of converting them on the CPU and transferring 4 times more data.
+    uint8_image_transfer: bool = False
 
     def __post_init__(self) -> None:
         if self.batch_size > self.n_episodes:
@@ -15,11 +15,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
 import logging
+import multiprocessing as mp
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import tqdm
 
 from lerobot.datasets.compute_stats import aggregate_stats
@@ -33,13 +41,18 @@ from lerobot.datasets.utils import (
     DEFAULT_VIDEO_PATH,
     get_file_size_in_mb,
     get_parquet_file_size_in_mb,
-    to_parquet_with_hf_images,
     update_chunk_file_indices,
     write_info,
     write_stats,
     write_tasks,
 )
 from lerobot.datasets.video_utils import concatenate_video_files, get_video_duration_in_s
+from lerobot.utils.constants import HF_LEROBOT_HOME
+from lerobot.utils.recording_utils import remap_recording_stats
+
+# Journal of the destination files written by an aggregation, removed once it completes. A crashed
+# aggregation relaunched with the same arguments only writes the files which are missing.
+AGGREGATE_PROGRESS_PATH = "meta/aggregate_progress.jsonl"
 
 
 def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
@@ -78,111 +91,271 @@ def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
     return fps, robot_type, features
 
 
-def update_data_df(df, src_meta, dst_meta):
-    """Updates a data DataFrame with new indices and task mappings for aggregation.
+def assign_destination_files(
+    sizes_in_mb: list[float], max_mb: float, chunk_size: int
+) -> list[tuple[int, int]]:
+    """Assigns consecutive source files to destination (chunk, file) indices.
 
-    Adjusts episode indices, frame indices, and task indices to account for
-    previously aggregated data in the destination dataset.
+    Source files are appended to the current destination file until the next one would make it reach
+    `max_mb`, at which point a new destination file is started.
 
     Args:
-        df: DataFrame containing the data to be updated.
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
+        sizes_in_mb: Sizes of the source files, in the order they are aggregated.
+        max_mb: Maximum size of a destination file in MB.
+        chunk_size: Maximum number of files per chunk.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices.
+        list[tuple[int, int]]: The destination (chunk, file) indices of each source file.
     """
+    chunk_idx, file_idx = 0, 0
+    current_mb = None
+    assignments = []
+    for size in sizes_in_mb:
+        if current_mb is None:
+            current_mb = size
+        elif current_mb + size >= max_mb:
+            chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
+            current_mb = size
+        else:
+            current_mb += size
+        assignments.append((chunk_idx, file_idx))
+    return assignments
 
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
-    df["index"] = df["index"] + dst_meta.info["total_frames"]
 
-    src_task_names = src_meta.tasks.index.take(df["task_index"].to_numpy())
-    df["task_index"] = dst_meta.tasks.loc[src_task_names, "task_index"].to_numpy()
+def _unique_chunk_file_pairs(src_meta, prefix: str) -> list[tuple[int, int]]:
+    pairs = zip(
+        src_meta.episodes[f"{prefix}/chunk_index"], src_meta.episodes[f"{prefix}/file_index"], strict=True
+    )
+    return sorted({(int(chunk), int(file)) for chunk, file in pairs})
 
-    return df
 
+def _group_jobs(kind: str, path_format: str, sources: list[dict], assignments: list[tuple[int, int]], **fmt):
+    """Groups `sources` by destination file into jobs, preserving their order."""
+    jobs: dict[tuple[int, int], dict] = {}
+    for source, (chunk_idx, file_idx) in zip(sources, assignments, strict=True):
+        dst = path_format.format(chunk_index=chunk_idx, file_index=file_idx, **fmt)
+        job = jobs.setdefault((chunk_idx, file_idx), {"kind": kind, "dst": dst, "sources": []})
+        job["sources"].append(source)
+    return list(jobs.values())
 
-def update_meta_data(
-    df,
-    dst_meta,
-    meta_idx,
-    data_idx,
-    videos_idx,
-):
-    """Updates metadata DataFrame with new chunk, file, and timestamp indices.
 
-    Adjusts all indices and timestamps to account for previously aggregated
-    data and videos in the destination dataset.
+def plan_aggregation(
+    all_metadata: list[LeRobotDatasetMetadata],
+    dst_tasks: pd.DataFrame,
+    video_keys: list[str],
+    data_files_size_in_mb: float,
+    video_files_size_in_mb: float,
+    chunk_size: int,
+) -> list[dict]:
+    """Computes every file of the aggregated dataset without reading the frames or decoding the videos.
+
+    The destination (chunk, file) of every source file, the index offsets of every source dataset and the
+    timestamp offset of every source video in its destination video are derived from the metadata, the file
+    sizes and the video headers. Each destination file is then described by an independent job (see
+    `execute_aggregation_job`) listing its sources in order.
 
     Args:
-        df: DataFrame containing the metadata to be updated.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary containing current metadata chunk and file indices.
-        data_idx: Dictionary containing current data chunk and file indices.
-        videos_idx: Dictionary containing current video indices and timestamps.
+        all_metadata: Metadata of the source datasets, in aggregation order.
+        dst_tasks: Tasks of the aggregated dataset.
+        video_keys: Video features of the datasets.
+        data_files_size_in_mb: Maximum size for data files in MB.
+        video_files_size_in_mb: Maximum size for video files in MB.
+        chunk_size: Maximum number of files per chunk.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices and timestamps.
+        list[dict]: JSON serializable jobs, videos first, then data, then episodes metadata.
     """
-
-    df["meta/episodes/chunk_index"] = df["meta/episodes/chunk_index"] + meta_idx["chunk"]
-    df["meta/episodes/file_index"] = df["meta/episodes/file_index"] + meta_idx["file"]
-    df["data/chunk_index"] = df["data/chunk_index"] + data_idx["chunk"]
-    df["data/file_index"] = df["data/file_index"] + data_idx["file"]
-    for key, video_idx in videos_idx.items():
-        # Store original video file indices before updating
-        orig_chunk_col = f"videos/{key}/chunk_index"
-        orig_file_col = f"videos/{key}/file_index"
-        df["_orig_chunk"] = df[orig_chunk_col].copy()
-        df["_orig_file"] = df[orig_file_col].copy()
-
-        # Get mappings for this video key
-        src_to_offset = video_idx.get("src_to_offset", {})
-        src_to_dst = video_idx.get("src_to_dst", {})
-
-        # Apply per-source-file mappings
-        if src_to_dst:
-            # Map each episode to its correct destination file and apply offset
-            for idx in df.index:
-                # Convert to Python int to avoid numpy type mismatch in dict lookup
-                src_key = (int(df.at[idx, "_orig_chunk"]), int(df.at[idx, "_orig_file"]))
-
-                # Get destination chunk/file for this source file
-                dst_chunk, dst_file = src_to_dst.get(src_key, (video_idx["chunk"], video_idx["file"]))
-                df.at[idx, orig_chunk_col] = dst_chunk
-                df.at[idx, orig_file_col] = dst_file
-
-                # Apply timestamp offset
-                offset = src_to_offset.get(src_key, 0)
-                df.at[idx, f"videos/{key}/from_timestamp"] += offset
-                df.at[idx, f"videos/{key}/to_timestamp"] += offset
-        elif src_to_offset:
-            # Fallback: use same destination for all, but apply per-file offsets
-            df[orig_chunk_col] = video_idx["chunk"]
-            df[orig_file_col] = video_idx["file"]
-            for idx in df.index:
-                # Convert to Python int to avoid numpy type mismatch in dict lookup
-                src_key = (int(df.at[idx, "_orig_chunk"]), int(df.at[idx, "_orig_file"]))
-                offset = src_to_offset.get(src_key, 0)
-                df.at[idx, f"videos/{key}/from_timestamp"] += offset
-                df.at[idx, f"videos/{key}/to_timestamp"] += offset
-        else:
-            # Fallback to simple offset (for backward compatibility)
-            df[orig_chunk_col] = video_idx["chunk"]
-            df[orig_file_col] = video_idx["file"]
-            df[f"videos/{key}/from_timestamp"] = (
-                df[f"videos/{key}/from_timestamp"] + video_idx["latest_duration"]
+    jobs = []
+
+    # Videos: destination file and timestamp offset of every source video
+    video_maps = [{key: [] for key in video_keys} for _ in all_metadata]
+    for key in video_keys:
+        sources, sizes, durations = [], [], []
+        for src_meta in all_metadata:
+            for chunk_idx, file_idx in _unique_chunk_file_pairs(src_meta, f"videos/{key}"):
+                src_path = src_meta.root / DEFAULT_VIDEO_PATH.format(
+                    video_key=key, chunk_index=chunk_idx, file_index=file_idx
+                )
+                sources.append({"path": str(src_path)})
+                sizes.append(get_file_size_in_mb(src_path))
+                durations.append(get_video_duration_in_s(src_path))
+
+        assignments = assign_destination_files(sizes, video_files_size_in_mb, chunk_size)
+        dst_durations: dict[tuple[int, int], float] = {}
+        i = 0
+        for dataset_idx, src_meta in enumerate(all_metadata):
+            for chunk_idx, file_idx in _unique_chunk_file_pairs(src_meta, f"videos/{key}"):
+                dst_key = assignments[i]
+                offset = dst_durations.get(dst_key, 0.0)
+                video_maps[dataset_idx][key].append([chunk_idx, file_idx, *dst_key, offset])
+                dst_durations[dst_key] = offset + durations[i]
+                i += 1
+        jobs.extend(_group_jobs("video", DEFAULT_VIDEO_PATH, sources, assignments, video_key=key))
+
+    # Data: destination file of every source data file, index offsets and task mapping of every dataset
+    sources, sizes, data_maps = [], [], [[] for _ in all_metadata]
+    episode_offset = frame_offset = 0
+    for dataset_idx, src_meta in enumerate(all_metadata):
+        # Source task indices are the positions of the tasks in the source tasks table
+        task_map = dst_tasks.loc[src_meta.tasks.index, "task_index"].tolist()
+        for chunk_idx, file_idx in _unique_chunk_file_pairs(src_meta, "data"):
+            src_path = src_meta.root / DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+            sources.append(
+                {
+                    "path": str(src_path),
+                    "dataset": dataset_idx,
+                    "chunk_file": [chunk_idx, file_idx],
+                    "episode_offset": episode_offset,
+                    "frame_offset": frame_offset,
+                    "task_map": task_map,
+                }
+            )
+            sizes.append(get_parquet_file_size_in_mb(src_path))
+        episode_offset += src_meta.total_episodes
+        frame_offset += src_meta.total_frames
+
+    assignments = assign_destination_files(sizes, data_files_size_in_mb, chunk_size)
+    for source, dst_key in zip(sources, assignments, strict=True):
+        data_maps[source.pop("dataset")].append([*source.pop("chunk_file"), *dst_key])
+    jobs.extend(_group_jobs("data", DEFAULT_DATA_PATH, sources, assignments))
+
+    # Episodes metadata: everything above is known, the episodes files can be rewritten independently
+    sources, sizes = [], []
+    episode_offset = frame_offset = 0
+    for dataset_idx, src_meta in enumerate(all_metadata):
+        for chunk_idx, file_idx in _unique_chunk_file_pairs(src_meta, "meta/episodes"):
+            src_path = src_meta.root / DEFAULT_EPISODES_PATH.format(
+                chunk_index=chunk_idx, file_index=file_idx
+            )
+            sources.append(
+                {
+                    "path": str(src_path),
+                    "episode_offset": episode_offset,
+                    "frame_offset": frame_offset,
+                    "data_map": data_maps[dataset_idx],
+                    "video_maps": video_maps[dataset_idx],
+                }
             )
-            df[f"videos/{key}/to_timestamp"] = df[f"videos/{key}/to_timestamp"] + video_idx["latest_duration"]
+            sizes.append(get_parquet_file_size_in_mb(src_path))
+        episode_offset += src_meta.total_episodes
+        frame_offset += src_meta.total_frames
+
+    assignments = assign_destination_files(sizes, DEFAULT_DATA_FILE_SIZE_IN_MB, DEFAULT_CHUNK_SIZE)
+    for source, dst_key in zip(sources, assignments, strict=True):
+        source["meta_chunk_file"] = list(dst_key)
+    jobs.extend(_group_jobs("episodes", DEFAULT_EPISODES_PATH, sources, assignments))
+
+    return jobs
+
+
+def _replace_column(table: pa.Table, name: str, values: np.ndarray) -> pa.Table:
+    field = table.schema.field(name)
+    return table.set_column(table.schema.get_field_index(name), field, pa.array(values, type=field.type))
+
+
+def _map_chunk_file_columns(table: pa.Table, prefix: str, mapping: list[list]) -> tuple[pa.Table, np.ndarray]:
+    """Replaces the source (chunk, file) indices in the `{prefix}/chunk_index` and `{prefix}/file_index`
+    columns by their destination. `mapping` rows are `[src_chunk, src_file, dst_chunk, dst_file, *extra]`.
+    Returns the updated table and the first extra value of each row (0 when there is none)."""
+    src_chunks = table[f"{prefix}/chunk_index"].to_numpy()
+    src_files = table[f"{prefix}/file_index"].to_numpy()
+    dst_chunks, dst_files = src_chunks.copy(), src_files.copy()
+    extra = np.zeros(len(table))
+    for src_chunk, src_file, dst_chunk, dst_file, *rest in mapping:
+        rows = (src_chunks == src_chunk) & (src_files == src_file)
+        dst_chunks[rows] = dst_chunk
+        dst_files[rows] = dst_file
+        if rest:
+            extra[rows] = rest[0]
+    table = _replace_column(table, f"{prefix}/chunk_index", dst_chunks)
+    table = _replace_column(table, f"{prefix}/file_index", dst_files)
+    return table, extra
+
+
+def _update_data_table(table: pa.Table, source: dict) -> pa.Table:
+    """Offsets the episode and frame indices of a data table and maps its tasks to the aggregated ones."""
+    table = _replace_column(
+        table, "episode_index", table["episode_index"].to_numpy() + source["episode_offset"]
+    )
+    table = _replace_column(table, "index", table["index"].to_numpy() + source["frame_offset"])
+    task_map = np.asarray(source["task_map"], dtype=np.int64)
+    return _replace_column(table, "task_index", task_map[table["task_index"].to_numpy()])
+
 
-        # Clean up temporary columns
-        df = df.drop(columns=["_orig_chunk", "_orig_file"])
+def _update_episodes_table(table: pa.Table, source: dict) -> pa.Table:
+    """Points the episodes of a source episodes table to their files and timestamps in the aggregated
+    dataset."""
+    table = _replace_column(
+        table, "episode_index", table["episode_index"].to_numpy() + source["episode_offset"]
+    )
+    for column in ["dataset_from_index", "dataset_to_index"]:
+        table = _replace_column(table, column, table[column].to_numpy() + source["frame_offset"])
 
-    df["dataset_from_index"] = df["dataset_from_index"] + dst_meta.info["total_frames"]
-    df["dataset_to_index"] = df["dataset_to_index"] + dst_meta.info["total_frames"]
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
+    meta_chunk, meta_file = source["meta_chunk_file"]
+    table = _replace_column(table, "meta/episodes/chunk_index", np.full(len(table), meta_chunk))
+    table = _replace_column(table, "meta/episodes/file_index", np.full(len(table), meta_file))
 
-    return df
+    table, _ = _map_chunk_file_columns(table, "data", source["data_map"])
+    for key, mapping in source["video_maps"].items():
+        table, offsets = _map_chunk_file_columns(table, f"videos/{key}", mapping)
+        for column in [f"videos/{key}/from_timestamp", f"videos/{key}/to_timestamp"]:
+            table = _replace_column(table, column, table[column].to_numpy() + offsets)
+    return table
+
+
+def _temporary_path(dst_path: Path) -> Path:
+    # Keep the extension, the video muxer infers the container from it
+    return dst_path.with_name(f"{dst_path.stem}.tmp{dst_path.suffix}")
+
+
+def execute_aggregation_job(job: dict, aggr_root: Path) -> str:
+    """Writes the destination file of a job computed by `plan_aggregation`.
+
+    Videos are concatenated with a stream copy. Parquet sources are read as Arrow tables, updated column
+    by column and appended as row groups of the destination file, without going through pandas. The file is
+    written to a temporary path and moved in place once complete, so that a crash never leaves a partial
+    file behind.
+
+    Returns:
+        str: The destination path of the job, relative to `aggr_root`.
+    """
+    dst_path = Path(aggr_root) / job["dst"]
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temporary_path(dst_path)
+    src_paths = [Path(source["path"]) for source in job["sources"]]
+
+    if job["kind"] == "video":
+        if len(src_paths) == 1:
+            shutil.copy(src_paths[0], tmp_path)
+        else:
+            concatenate_video_files(src_paths, tmp_path)
+    else:
+        update_fn = _update_data_table if job["kind"] == "data" else _update_episodes_table
+        writer = None
+        try:
+            for source, src_path in zip(job["sources"], src_paths, strict=True):
+                table = update_fn(pq.read_table(src_path), source)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, schema=table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    os.replace(tmp_path, dst_path)
+    return job["dst"]
+
+
+def _load_completed_jobs(progress_path: Path, plan_hash: str) -> set[str]:
+    """Destination files already written by a previous run of the same aggregation."""
+    with open(progress_path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("plan") != plan_hash:
+        raise ValueError(
+            f"The aggregation in progress in {progress_path.parent.parent} was started with other source datasets "
+            "or file sizes. Remove the directory to start over."
+        )
+    return {line["dst"] for line in lines[1:]}
 
 
 def aggregate_datasets(
@@ -193,14 +366,19 @@ def aggregate_datasets(
     data_files_size_in_mb: float | None = None,
     video_files_size_in_mb: float | None = None,
     chunk_size: int | None = None,
+    num_workers: int | None = None,
 ):
     """Aggregates multiple LeRobot datasets into a single unified dataset.
 
     This is the main function that orchestrates the aggregation process by:
     1. Loading and validating all source dataset metadata
     2. Creating a new destination dataset with unified tasks
-    3. Aggregating videos, data, and metadata from all source datasets
-    4. Finalizing the aggregated dataset with proper statistics
+    3. Planning every destination file from the metadata (see `plan_aggregation`)
+    4. Writing the destination videos, data and metadata files in parallel
+    5. Finalizing the aggregated dataset with proper statistics
+
+    The written files are journaled in the destination dataset. If the aggregation crashes, calling this
+    function again with the same arguments resumes it.
 
     Args:
         repo_ids: List of repository IDs for the datasets to aggregate.
@@ -210,6 +388,8 @@ def aggregate_datasets(
         data_files_size_in_mb: Maximum size for data files in MB (defaults to DEFAULT_DATA_FILE_SIZE_IN_MB)
         video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
         chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        num_workers: Number of processes writing the destination files (defaults to the number of CPUs). 0 or
+            1 writes them in the current process.
     """
     logging.info("Start aggregate_datasets")
 
@@ -219,6 +399,8 @@ def aggregate_datasets(
         video_files_size_in_mb = DEFAULT_VIDEO_FILE_SIZE_IN_MB
     if chunk_size is None:
         chunk_size = DEFAULT_CHUNK_SIZE
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
 
     all_metadata = (
         [LeRobotDatasetMetadata(repo_id) for repo_id in repo_ids]
@@ -230,6 +412,33 @@ def aggregate_datasets(
     fps, robot_type, features = validate_all_metadata(all_metadata)
     video_keys = [key for key in features if features[key]["dtype"] == "video"]
 
+    aggr_root = Path(aggr_root) if aggr_root is not None else HF_LEROBOT_HOME / aggr_repo_id
+    progress_path = aggr_root / AGGREGATE_PROGRESS_PATH
+    resuming = progress_path.exists()
+    if not resuming and aggr_root.exists():
+        raise FileExistsError(f"The destination of the aggregation {aggr_root} already exists.")
+
+    logging.info("Find all tasks")
+    unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
+    dst_tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
+
+    logging.info("Plan the aggregated files")
+    jobs = plan_aggregation(
+        all_metadata, dst_tasks, video_keys, data_files_size_in_mb, video_files_size_in_mb, chunk_size
+    )
+    plan_hash = hashlib.sha256(json.dumps(jobs, sort_keys=True).encode()).hexdigest()
+
+    if not resuming:
+        # The journal is started before anything else is written, so that an aggregation interrupted at any
+        # point can be resumed
+        progress_path.parent.mkdir(parents=True)
+        with open(progress_path, "w") as f:
+            f.write(json.dumps({"plan": plan_hash}) + "\n")
+    completed = _load_completed_jobs(progress_path, plan_hash)
+    if resuming:
+        logging.info(f"Resuming aggregation, {len(completed)}/{len(jobs)} files already written")
+
+    # When resuming, the info written by the interrupted run is written again, identically
     dst_meta = LeRobotDatasetMetadata.create(
         repo_id=aggr_repo_id,
         fps=fps,
@@ -240,305 +449,36 @@ def aggregate_datasets(
         chunks_size=chunk_size,
         data_files_size_in_mb=data_files_size_in_mb,
         video_files_size_in_mb=video_files_size_in_mb,
+        exist_ok=True,
     )
+    dst_meta.tasks = dst_tasks
 
-    logging.info("Find all tasks")
-    unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
-    dst_meta.tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
-
-    meta_idx = {"chunk": 0, "file": 0}
-    data_idx = {"chunk": 0, "file": 0}
-    videos_idx = {
-        key: {"chunk": 0, "file": 0, "latest_duration": 0, "episode_duration": 0} for key in video_keys
-    }
+    todo = [job for job in jobs if job["dst"] not in completed]
 
-    dst_meta.episodes = {}
+    with open(progress_path, "a") as progress, tqdm.tqdm(total=len(todo), desc="Copy data and videos") as bar:
 
-    for src_meta in tqdm.tqdm(all_metadata, desc="Copy data and videos"):
-        videos_idx = aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size)
-        data_idx = aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size)
+        def _record(dst: str):
+            progress.write(json.dumps({"dst": dst}) + "\n")
+            progress.flush()
+            bar.update()
 
-        meta_idx = aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx)
-
-        dst_meta.info["total_episodes"] += src_meta.total_episodes
-        dst_meta.info["total_frames"] += src_meta.total_frames
+        if num_workers <= 1 or len(todo) <= 1:
+            for job in todo:
+                _record(execute_aggregation_job(job, dst_meta.root))
+        else:
+            # Jobs are independent, each one writes its own destination file
+            with ProcessPoolExecutor(
+                max_workers=min(num_workers, len(todo)), mp_context=mp.get_context("spawn")
+            ) as executor:
+                futures = [executor.submit(execute_aggregation_job, job, dst_meta.root) for job in todo]
+                for future in as_completed(futures):
+                    _record(future.result())
 
     finalize_aggregation(dst_meta, all_metadata)
+    progress_path.unlink()
     logging.info("Aggregation complete.")
 
 
-def aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size):
-    """Aggregates video chunks from a source dataset into the destination dataset.
-
-    Handles video file concatenation and rotation based on file size limits.
-    Creates new video files when size limits are exceeded.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        videos_idx: Dictionary tracking video chunk and file indices.
-        video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
-        chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
-
-    Returns:
-        dict: Updated videos_idx with current chunk and file indices.
-    """
-    for key in videos_idx:
-        videos_idx[key]["episode_duration"] = 0
-        # Track offset for each source (chunk, file) pair
-        videos_idx[key]["src_to_offset"] = {}
-        # Track destination (chunk, file) for each source (chunk, file) pair
-        videos_idx[key]["src_to_dst"] = {}
-        # Initialize dst_file_durations if not present
-        # dst_file_durations tracks duration of each destination file
-        if "dst_file_durations" not in videos_idx[key]:
-            videos_idx[key]["dst_file_durations"] = {}
-
-    for key, video_idx in videos_idx.items():
-        unique_chunk_file_pairs = {
-            (chunk, file)
-            for chunk, file in zip(
-                src_meta.episodes[f"videos/{key}/chunk_index"],
-                src_meta.episodes[f"videos/{key}/file_index"],
-                strict=False,
-            )
-        }
-        unique_chunk_file_pairs = sorted(unique_chunk_file_pairs)
-
-        chunk_idx = video_idx["chunk"]
-        file_idx = video_idx["file"]
-        dst_file_durations = video_idx["dst_file_durations"]
-
-        for src_chunk_idx, src_file_idx in unique_chunk_file_pairs:
-            # Convert to Python int to ensure consistent dict keys
-            src_chunk_idx = int(src_chunk_idx)
-            src_file_idx = int(src_file_idx)
-
-            src_path = src_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=src_chunk_idx,
-                file_index=src_file_idx,
-            )
-
-            dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=chunk_idx,
-                file_index=file_idx,
-            )
-
-            src_duration = get_video_duration_in_s(src_path)
-            dst_key = (chunk_idx, file_idx)
-
-            if not dst_path.exists():
-                # New destination file: offset is 0
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = 0
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                # Track duration of this destination file
-                dst_file_durations[dst_key] = src_duration
-                videos_idx[key]["episode_duration"] += src_duration
-                continue
-
-            # Check file sizes before appending
-            src_size = get_file_size_in_mb(src_path)
-            dst_size = get_file_size_in_mb(dst_path)
-
-            if dst_size + src_size >= video_files_size_in_mb:
-                # Rotate to a new file - offset is 0
-                chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
-                dst_key = (chunk_idx, file_idx)
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = 0
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                    video_key=key,
-                    chunk_index=chunk_idx,
-                    file_index=file_idx,
-                )
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                # Track duration of this new destination file
-                dst_file_durations[dst_key] = src_duration
-            else:
-                # Append to existing destination file
-                # Offset is the current duration of this destination file
-                current_dst_duration = dst_file_durations.get(dst_key, 0)
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = current_dst_duration
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                concatenate_video_files(
-                    [dst_path, src_path],
-                    dst_path,
-                )
-                # Update duration of this destination file
-                dst_file_durations[dst_key] = current_dst_duration + src_duration
-
-            videos_idx[key]["episode_duration"] += src_duration
-
-        videos_idx[key]["chunk"] = chunk_idx
-        videos_idx[key]["file"] = file_idx
-
-    return videos_idx
-
-
-def aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size):
-    """Aggregates data chunks from a source dataset into the destination dataset.
-
-    Reads source data files, updates indices to match the aggregated dataset,
-    and writes them to the destination with proper file rotation.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        data_idx: Dictionary tracking data chunk and file indices.
-
-    Returns:
-        dict: Updated data_idx with current chunk and file indices.
-    """
-    unique_chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["data/chunk_index"], src_meta.episodes["data/file_index"], strict=False
-        )
-    }
-
-    unique_chunk_file_ids = sorted(unique_chunk_file_ids)
-
-    for src_chunk_idx, src_file_idx in unique_chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_DATA_PATH.format(
-            chunk_index=src_chunk_idx, file_index=src_file_idx
-        )
-        df = pd.read_parquet(src_path)
-        df = update_data_df(df, src_meta, dst_meta)
-
-        data_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            data_idx,
-            data_files_size_in_mb,
-            chunk_size,
-            DEFAULT_DATA_PATH,
-            contains_images=len(dst_meta.image_keys) > 0,
-            aggr_root=dst_meta.root,
-        )
-
-    return data_idx
-
-
-def aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx):
-    """Aggregates metadata from a source dataset into the destination dataset.
-
-    Reads source metadata files, updates all indices and timestamps,
-    and writes them to the destination with proper file rotation.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary tracking metadata chunk and file indices.
-        data_idx: Dictionary tracking data chunk and file indices.
-        videos_idx: Dictionary tracking video indices and timestamps.
-
-    Returns:
-        dict: Updated meta_idx with current chunk and file indices.
-    """
-    chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["meta/episodes/chunk_index"],
-            src_meta.episodes["meta/episodes/file_index"],
-            strict=False,
-        )
-    }
-
-    chunk_file_ids = sorted(chunk_file_ids)
-    for chunk_idx, file_idx in chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        df = pd.read_parquet(src_path)
-        df = update_meta_data(
-            df,
-            dst_meta,
-            meta_idx,
-            data_idx,
-            videos_idx,
-        )
-
-        meta_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            meta_idx,
-            DEFAULT_DATA_FILE_SIZE_IN_MB,
-            DEFAULT_CHUNK_SIZE,
-            DEFAULT_EPISODES_PATH,
-            contains_images=False,
-            aggr_root=dst_meta.root,
-        )
-
-    # Increment latest_duration by the total duration added from this source dataset
-    for k in videos_idx:
-        videos_idx[k]["latest_duration"] += videos_idx[k]["episode_duration"]
-
-    return meta_idx
-
-
-def append_or_create_parquet_file(
-    df: pd.DataFrame,
-    src_path: Path,
-    idx: dict[str, int],
-    max_mb: float,
-    chunk_size: int,
-    default_path: str,
-    contains_images: bool = False,
-    aggr_root: Path = None,
-):
-    """Appends data to an existing parquet file or creates a new one based on size constraints.
-
-    Manages file rotation when size limits are exceeded to prevent individual files
-    from becoming too large. Handles both regular parquet files and those containing images.
-
-    Args:
-        df: DataFrame to write to the parquet file.
-        src_path: Path to the source file (used for size estimation).
-        idx: Dictionary containing current 'chunk' and 'file' indices.
-        max_mb: Maximum allowed file size in MB before rotation.
-        chunk_size: Maximum number of files per chunk before incrementing chunk index.
-        default_path: Format string for generating file paths.
-        contains_images: Whether the data contains images requiring special handling.
-        aggr_root: Root path for the aggregated dataset.
-
-    Returns:
-        dict: Updated index dictionary with current chunk and file indices.
-    """
-    dst_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-
-    if not dst_path.exists():
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        if contains_images:
-            to_parquet_with_hf_images(df, dst_path)
-        else:
-            df.to_parquet(dst_path)
-        return idx
-
-    src_size = get_parquet_file_size_in_mb(src_path)
-    dst_size = get_parquet_file_size_in_mb(dst_path)
-
-    if dst_size + src_size >= max_mb:
-        idx["chunk"], idx["file"] = update_chunk_file_indices(idx["chunk"], idx["file"], chunk_size)
-        new_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-        final_df = df
-        target_path = new_path
-    else:
-        existing_df = pd.read_parquet(dst_path)
-        final_df = pd.concat([existing_df, df], ignore_index=True)
-        target_path = dst_path
-
-    if contains_images:
-        to_parquet_with_hf_images(final_df, target_path)
-    else:
-        final_df.to_parquet(target_path)
-
-    return idx
-
-
 def finalize_aggregation(aggr_meta, all_metadata):
     """Finalizes the dataset aggregation by writing summary files and statistics.
 
@@ -566,3 +506,10 @@ def finalize_aggregation(aggr_meta, all_metadata):
     logging.info("write stats")
     aggr_meta.stats = aggregate_stats([m.stats for m in all_metadata])
     write_stats(aggr_meta.stats, aggr_meta.root)
+
+    episode_mappings = []
+    episode_offset = 0
+    for m in all_metadata:
+        episode_mappings.append({ep_idx: episode_offset + ep_idx for ep_idx in range(m.total_episodes)})
+        episode_offset += m.total_episodes
+    remap_recording_stats([m.root for m in all_metadata], episode_mappings, aggr_meta.root)
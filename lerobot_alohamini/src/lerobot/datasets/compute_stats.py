@@ -624,3 +624,78 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
         aggregated_stats[key] = aggregate_feature_stats(stats_with_key)
 
     return aggregated_stats
+
+
+class StatsAccumulator:
+    """Merges stats one at a time, giving the same result as `aggregate_stats` on all of them at once.
+
+    For each feature, it keeps the running count, mean and sum of squared deviations (merged with the parallel
+    algorithm), min and max, and the count weighted sums of the quantiles. Adding stats costs the same however
+    many were added before, and the merged stats are only assembled by `get_stats`.
+
+    Args:
+        stats: Optional stats to start from, e.g. the stats of the episodes already in the dataset.
+    """
+
+    def __init__(self, stats: dict[str, dict] | None = None):
+        self._features: dict[str, dict[str, np.ndarray]] = {}
+        if stats is not None:
+            self.add(stats)
+
+    def add(self, stats: dict[str, dict]) -> None:
+        _assert_type_and_shape([stats])
+
+        for key, ft_stats in stats.items():
+            count = ft_stats["count"].astype(np.float64)
+            mean = ft_stats["mean"].astype(np.float64)
+            # Match the number of dimensions of the stats
+            weight = count.reshape(count.shape + (1,) * (mean.ndim - count.ndim))
+            quantile_keys = [k for k in ft_stats if k.startswith("q") and k[1:].isdigit()]
+
+            acc = self._features.get(key)
+            if acc is None:
+                self._features[key] = {
+                    "count": count,
+                    "mean": mean,
+                    "m2": ft_stats["std"].astype(np.float64) ** 2 * weight,
+                    "min": ft_stats["min"],
+                    "max": ft_stats["max"],
+                    **{q_key: ft_stats[q_key] * weight for q_key in quantile_keys},
+                }
+                continue
+
+            acc_weight = acc["count"].reshape(weight.shape)
+            total_weight = acc_weight + weight
+            delta = mean - acc["mean"]
+            acc["mean"] = acc["mean"] + delta * weight / total_weight
+            acc["m2"] = (
+                acc["m2"] + ft_stats["std"] ** 2 * weight + delta**2 * acc_weight * weight / total_weight
+            )
+            acc["count"] = acc["count"] + count
+            acc["min"] = np.minimum(acc["min"], ft_stats["min"])
+            acc["max"] = np.maximum(acc["max"], ft_stats["max"])
+            # Like `aggregate_stats`, only keep the quantiles that all the stats have
+            for q_key in [k for k in acc if k.startswith("q") and k[1:].isdigit()]:
+                if q_key in ft_stats:
+                    acc[q_key] = acc[q_key] + ft_stats[q_key] * weight
+                else:
+                    del acc[q_key]
+
+    def get_stats(self) -> dict[str, dict[str, np.ndarray]] | None:
+        """Return the merged stats, or None if no stats were added."""
+        if len(self._features) == 0:
+            return None
+
+        merged_stats = {}
+        for key, acc in self._features.items():
+            weight = acc["count"].reshape(acc["count"].shape + (1,) * (acc["mean"].ndim - acc["count"].ndim))
+            merged_stats[key] = {
+                "min": acc["min"],
+                "max": acc["max"],
+                "mean": acc["mean"],
+                "std": np.sqrt(acc["m2"] / weight),
+                "count": acc["count"].astype(np.int64),
+            }
+            for q_key in [k for k in acc if k.startswith("q") and k[1:].isdigit()]:
+                merged_stats[key][q_key] = acc[q_key] / weight
+        return merged_stats
@@ -23,9 +23,14 @@ This module provides utilities for:
 - Merging datasets (wrapper around aggregate functionality)
 """
 
+import bisect
 import logging
+import multiprocessing as mp
+import os
 import shutil
+import tempfile
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import datasets
@@ -51,7 +56,13 @@ from lerobot.datasets.utils import (
     write_stats,
     write_tasks,
 )
+from lerobot.datasets.video_utils import (
+    concatenate_video_files,
+    get_video_encoding_options,
+    get_video_pix_fmt,
+)
 from lerobot.utils.constants import HF_LEROBOT_HOME
+from lerobot.utils.recording_utils import remap_recording_stats
 
 
 def _load_episode_with_stats(src_dataset: LeRobotDataset, episode_idx: int) -> dict:
@@ -562,7 +573,178 @@ def _copy_and_reindex_data(
     return episode_data_metadata
 
 
-def _keep_episodes_from_video_with_av(
+def _plan_video_cuts(
+    frame_ranges: list[tuple[int, int]], keyframes: list[int], num_frames: int
+) -> list[tuple[str, int, int]]:
+    """Split the frame ranges to keep into segments that can be stream copied and segments to re-encode.
+
+    A GOP (the frames from a keyframe up to the next one) can be copied packet by packet when it lies entirely
+    in a kept range. Only the partial GOPs at the boundaries of the ranges need to be decoded and re-encoded.
+
+    Args:
+        frame_ranges: Sorted (start, end) frame ranges to keep, end excluded.
+        keyframes: Frame indices of the keyframes of the video.
+        num_frames: Number of frames of the video.
+
+    Returns:
+        Ordered ("copy" | "encode", start, end) segments covering the ranges. Contiguous segments of the same
+        kind are merged.
+    """
+    keyframes = sorted(set(keyframes))
+    gop_bounds = [*keyframes, num_frames]
+    segments: list[tuple[str, int, int]] = []
+
+    def _append(kind: str, start: int, end: int):
+        if start >= end:
+            return
+        if segments and segments[-1][0] == kind and segments[-1][2] == start:
+            segments[-1] = (kind, segments[-1][1], end)
+        else:
+            segments.append((kind, start, end))
+
+    for start, end in frame_ranges:
+        # First GOP starting in the range, and end of the last GOP ending in it
+        i = bisect.bisect_left(keyframes, start)
+        copy_start = keyframes[i] if i < len(keyframes) else num_frames
+        j = bisect.bisect_right(gop_bounds, end) - 1
+        copy_end = gop_bounds[j] if j >= 0 else 0
+
+        if copy_start < copy_end:
+            _append("encode", start, copy_start)
+            _append("copy", copy_start, copy_end)
+            _append("encode", copy_end, end)
+        else:
+            _append("encode", start, end)
+
+    return segments
+
+
+def _frame_index(pts: int, time_base, fps: float) -> int:
+    return round(float(pts * time_base) * fps)
+
+
+def _video_stream_format(v_stream) -> dict:
+    """The properties of a video stream that must match for its packets to be concatenated with another's."""
+    codec_context = v_stream.codec_context
+    return {
+        "codec_id": codec_context.codec.id,
+        "pix_fmt": codec_context.pix_fmt,
+        "width": codec_context.width,
+        "height": codec_context.height,
+        "profile": codec_context.profile,
+    }
+
+
+def _read_video_stream_format(video_path: Path) -> dict:
+    import av
+
+    with av.open(str(video_path)) as container:
+        return _video_stream_format(container.streams.video[0])
+
+
+def _index_video_keyframes(input_path: Path, fps: float) -> tuple[list[int], int, dict]:
+    """Read the keyframes and the number of frames of a video from its packets, without decoding them.
+
+    Returns:
+        The frame indices of the keyframes, the number of frames and the format of the video stream (see
+        `_video_stream_format`).
+    """
+    import av
+
+    with av.open(str(input_path)) as in_container:
+        if not in_container.streams.video:
+            raise ValueError(
+                f"No video streams found in {input_path}. "
+                "The video file may be corrupted or empty. "
+                "Try re-downloading the dataset or checking the video file."
+            )
+        v_in = in_container.streams.video[0]
+        keyframes = []
+        num_frames = 0
+        for packet in in_container.demux(v_in):
+            if packet.pts is None:
+                continue
+            frame_idx = _frame_index(packet.pts, v_in.time_base, fps)
+            if packet.is_keyframe:
+                keyframes.append(frame_idx)
+            num_frames = max(num_frames, frame_idx + 1)
+        return keyframes, num_frames, _video_stream_format(v_in)
+
+
+def _seek_to_frame(in_container, v_in, frame_idx: int, fps: float):
+    """Seek to the last keyframe at or before `frame_idx`."""
+    in_container.seek(int(frame_idx / fps / v_in.time_base), stream=v_in, backward=True)
+
+
+def _stream_copy_frames(input_path: Path, output_path: Path, start: int, end: int, fps: float) -> None:
+    """Copy the packets of the frames [start, end) of a video, `start` being a keyframe, without decoding."""
+    import av
+
+    with av.open(str(input_path)) as in_container, av.open(str(output_path), mode="w") as out:
+        v_in = in_container.streams.video[0]
+        v_out = out.add_stream_from_template(template=v_in, opaque=True)
+        v_out.time_base = v_in.time_base
+
+        _seek_to_frame(in_container, v_in, start, fps)
+        pts_offset = None
+        for packet in in_container.demux(v_in):
+            if packet.pts is None or packet.dts is None:
+                continue
+            frame_idx = _frame_index(packet.pts, v_in.time_base, fps)
+            if frame_idx >= end and packet.is_keyframe:
+                break
+            if not start <= frame_idx < end:
+                continue
+            # The first packet is the keyframe starting the segment, the segment starts at 0
+            if pts_offset is None:
+                pts_offset = packet.pts
+            packet.pts -= pts_offset
+            packet.dts -= pts_offset
+            packet.stream = v_out
+            out.mux(packet)
+
+
+def _encode_frames(
+    input_path: Path, output_path: Path, start: int, end: int, fps: float, vcodec: str, pix_fmt: str
+) -> None:
+    """Decode the frames [start, end) of a video, from the keyframe preceding `start`, and re-encode them
+    with the settings of `encode_video_frames`."""
+    from fractions import Fraction
+
+    import av
+
+    with av.open(str(input_path)) as in_container, av.open(str(output_path), mode="w") as out:
+        v_in = in_container.streams.video[0]
+        v_out = out.add_stream(
+            vcodec, rate=Fraction(fps).limit_denominator(1000), options=get_video_encoding_options(vcodec)
+        )
+        v_out.width = v_in.codec_context.width
+        v_out.height = v_in.codec_context.height
+        v_out.pix_fmt = get_video_pix_fmt(vcodec, pix_fmt)
+        v_out.time_base = Fraction(1, int(fps))
+
+        _seek_to_frame(in_container, v_in, start, fps)
+        frame_count = 0
+        for frame in in_container.decode(v_in):
+            if frame.pts is None:
+                continue
+            frame_idx = _frame_index(frame.pts, frame.time_base, fps)
+            if frame_idx >= end:
+                break
+            if frame_idx < start:
+                continue
+            new_frame = frame.reformat(width=v_out.width, height=v_out.height, format=v_out.pix_fmt)
+            new_frame.pts = frame_count
+            new_frame.time_base = Fraction(1, int(fps))
+            for pkt in v_out.encode(new_frame):
+                out.mux(pkt)
+            frame_count += 1
+
+        for pkt in v_out.encode():
+            out.mux(pkt)
+
+
+def _reencode_episodes_from_video(
     input_path: Path,
     output_path: Path,
     episodes_to_keep: list[tuple[float, float]],
@@ -570,48 +752,26 @@ def _keep_episodes_from_video_with_av(
     vcodec: str = "libsvtav1",
     pix_fmt: str = "yuv420p",
 ) -> None:
-    """Keep only specified episodes from a video file using PyAV.
-
-    This function decodes frames from specified time ranges and re-encodes them with
-    properly reset timestamps to ensure monotonic progression.
-
-    Args:
-        input_path: Source video file path.
-        output_path: Destination video file path.
-        episodes_to_keep: List of (start_time, end_time) tuples for episodes to keep.
-        fps: Frame rate of the video.
-        vcodec: Video codec to use for encoding.
-        pix_fmt: Pixel format for output video.
+    """Decode frames from specified time ranges and re-encode them with properly reset timestamps to ensure
+    monotonic progression. Used when the video codec differs from `vcodec`, so that packets can't be copied.
     """
     from fractions import Fraction
 
     import av
 
-    if not episodes_to_keep:
-        raise ValueError("No episodes to keep")
-
     in_container = av.open(str(input_path))
-
-    # Check if video stream exists.
-    if not in_container.streams.video:
-        raise ValueError(
-            f"No video streams found in {input_path}. "
-            "The video file may be corrupted or empty. "
-            "Try re-downloading the dataset or checking the video file."
-        )
-
     v_in = in_container.streams.video[0]
 
     out = av.open(str(output_path), mode="w")
 
     # Convert fps to Fraction for PyAV compatibility.
     fps_fraction = Fraction(fps).limit_denominator(1000)
-    v_out = out.add_stream(vcodec, rate=fps_fraction)
+    v_out = out.add_stream(vcodec, rate=fps_fraction, options=get_video_encoding_options(vcodec))
 
     # PyAV type stubs don't distinguish video streams from audio/subtitle streams.
     v_out.width = v_in.codec_context.width
     v_out.height = v_in.codec_context.height
-    v_out.pix_fmt = pix_fmt
+    v_out.pix_fmt = get_video_pix_fmt(vcodec, pix_fmt)
 
     # Set time_base to match the frame rate for proper timestamp handling.
     v_out.time_base = Fraction(1, int(fps))
@@ -669,23 +829,109 @@ def _keep_episodes_from_video_with_av(
     in_container.close()
 
 
+def _keep_episodes_from_video_with_av(
+    input_path: Path,
+    output_path: Path,
+    episodes_to_keep: list[tuple[float, float]],
+    fps: float,
+    vcodec: str = "libsvtav1",
+    pix_fmt: str = "yuv420p",
+) -> None:
+    """Keep only specified episodes from a video file using PyAV.
+
+    The GOPs lying entirely within the kept episodes are stream copied, packet by packet. Only the partial
+    GOPs at the boundaries of the episodes are decoded and re-encoded with `vcodec`. The segments are then
+    concatenated with `concatenate_video_files`. If the video was not encoded with `vcodec`, or if the
+    re-encoded segments don't have the pixel format, size and profile of the copied ones, every kept frame is
+    re-encoded instead.
+
+    Args:
+        input_path: Source video file path.
+        output_path: Destination video file path.
+        episodes_to_keep: List of (start_time, end_time) tuples for episodes to keep.
+        fps: Frame rate of the video.
+        vcodec: Video codec to use for encoding.
+        pix_fmt: Pixel format for output video.
+    """
+    import av
+
+    if not episodes_to_keep:
+        raise ValueError("No episodes to keep")
+
+    input_path, output_path = Path(input_path), Path(output_path)
+    keyframes, num_frames, video_format = _index_video_keyframes(input_path, fps)
+    if video_format["codec_id"] != av.Codec(vcodec, "w").id:
+        _reencode_episodes_from_video(input_path, output_path, episodes_to_keep, fps, vcodec, pix_fmt)
+        return
+
+    frame_ranges = [(round(from_ts * fps), round(to_ts * fps)) for from_ts, to_ts in sorted(episodes_to_keep)]
+    segments = _plan_video_cuts(frame_ranges, keyframes, num_frames)
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as tmp_dir:
+        segment_paths = []
+        for i, (kind, start, end) in enumerate(segments):
+            segment_path = Path(tmp_dir) / f"segment_{i:05d}{output_path.suffix}"
+            if kind == "copy":
+                _stream_copy_frames(input_path, segment_path, start, end, fps)
+            else:
+                _encode_frames(input_path, segment_path, start, end, fps, vcodec, pix_fmt)
+                encoded_format = _read_video_stream_format(segment_path)
+                if encoded_format != video_format:
+                    logging.info(
+                        f"Re-encoding every kept frame of {input_path}, its format {video_format} differs from "
+                        f"the re-encoded frames' {encoded_format}."
+                    )
+                    _reencode_episodes_from_video(
+                        input_path, output_path, episodes_to_keep, fps, vcodec, pix_fmt
+                    )
+                    return
+            segment_paths.append(segment_path)
+
+        if len(segment_paths) == 1:
+            shutil.move(segment_paths[0], output_path)
+        else:
+            concatenate_video_files(segment_paths, output_path)
+
+
+def _write_video_file(
+    src_video_path: Path,
+    dst_video_path: Path,
+    episodes_to_keep: list[tuple[float, float]] | None,
+    fps: float,
+    vcodec: str,
+    pix_fmt: str,
+) -> None:
+    """Copy a video file, or keep only some of its episodes when `episodes_to_keep` is given."""
+    dst_video_path.parent.mkdir(parents=True, exist_ok=True)
+    if episodes_to_keep is None:
+        shutil.copy(src_video_path, dst_video_path)
+    else:
+        _keep_episodes_from_video_with_av(
+            src_video_path, dst_video_path, episodes_to_keep, fps, vcodec, pix_fmt
+        )
+
+
 def _copy_and_reindex_videos(
     src_dataset: LeRobotDataset,
     dst_meta: LeRobotDatasetMetadata,
     episode_mapping: dict[int, int],
     vcodec: str = "libsvtav1",
     pix_fmt: str = "yuv420p",
+    num_workers: int | None = None,
 ) -> dict[int, dict]:
     """Copy and filter video files, only re-encoding files with deleted episodes.
 
     For video files that only contain kept episodes, we copy them directly.
-    For files with mixed kept/deleted episodes, we use PyAV filters to efficiently
-    re-encode only the desired segments.
+    For files with mixed kept/deleted episodes, we stream copy the GOPs of the kept episodes and only
+    re-encode the partial GOPs at their boundaries (see `_keep_episodes_from_video_with_av`).
+    Files are written in parallel, across video keys.
 
     Args:
         src_dataset: Source dataset to copy from
         dst_meta: Destination metadata object
         episode_mapping: Mapping from old episode indices to new indices
+        num_workers: Number of processes writing the video files. Defaults to the number of CPUs, 0 writes
+            them in the current process.
 
     Returns:
         dict mapping episode index to its video metadata (chunk_index, file_index, timestamps)
@@ -694,6 +940,8 @@ def _copy_and_reindex_videos(
         src_dataset.meta.episodes = load_episodes(src_dataset.meta.root)
 
     episodes_video_metadata: dict[int, dict] = {new_idx: {} for new_idx in episode_mapping.values()}
+    # (src_video_path, dst_video_path, episodes_to_keep) with None to copy the whole file
+    video_jobs: list[tuple[Path, Path, list[tuple[float, float]] | None]] = []
 
     for video_key in src_dataset.meta.video_keys:
         logging.info(f"Processing videos for {video_key}")
@@ -711,9 +959,7 @@ def _copy_and_reindex_videos(
                 file_to_episodes[file_key] = []
             file_to_episodes[file_key].append(old_idx)
 
-        for (src_chunk_idx, src_file_idx), episodes_in_file in tqdm(
-            sorted(file_to_episodes.items()), desc=f"Processing {video_key} video files"
-        ):
+        for (src_chunk_idx, src_file_idx), episodes_in_file in sorted(file_to_episodes.items()):
             all_episodes_in_file = [
                 ep_idx
                 for ep_idx in range(src_dataset.meta.total_episodes)
@@ -724,16 +970,16 @@ def _copy_and_reindex_videos(
             episodes_to_keep_set = set(episodes_in_file)
             all_in_file_set = set(all_episodes_in_file)
 
+            assert src_dataset.meta.video_path is not None
+            src_video_path = src_dataset.root / src_dataset.meta.video_path.format(
+                video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
+            )
+            dst_video_path = dst_meta.root / dst_meta.video_path.format(
+                video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
+            )
+
             if all_in_file_set == episodes_to_keep_set:
-                assert src_dataset.meta.video_path is not None
-                src_video_path = src_dataset.root / src_dataset.meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path = dst_meta.root / dst_meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(src_video_path, dst_video_path)
+                video_jobs.append((src_video_path, dst_video_path, None))
 
                 for old_idx in episodes_in_file:
                     new_idx = episode_mapping[old_idx]
@@ -757,28 +1003,7 @@ def _copy_and_reindex_videos(
                     to_ts = src_ep[f"videos/{video_key}/to_timestamp"]
                     episodes_to_keep_ranges.append((from_ts, to_ts))
 
-                # Use PyAV filters to efficiently re-encode only the desired segments.
-                assert src_dataset.meta.video_path is not None
-                src_video_path = src_dataset.root / src_dataset.meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path = dst_meta.root / dst_meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path.parent.mkdir(parents=True, exist_ok=True)
-
-                logging.info(
-                    f"Re-encoding {video_key} (chunk {src_chunk_idx}, file {src_file_idx}) "
-                    f"with {len(episodes_to_keep_ranges)} episodes"
-                )
-                _keep_episodes_from_video_with_av(
-                    src_video_path,
-                    dst_video_path,
-                    episodes_to_keep_ranges,
-                    src_dataset.meta.fps,
-                    vcodec,
-                    pix_fmt,
-                )
+                video_jobs.append((src_video_path, dst_video_path, episodes_to_keep_ranges))
 
                 cumulative_ts = 0.0
                 for old_idx in sorted_keep_episodes:
@@ -796,6 +1021,20 @@ def _copy_and_reindex_videos(
 
                     cumulative_ts += ep_duration
 
+    fps = src_dataset.meta.fps
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, len(video_jobs))
+
+    if num_workers <= 1:
+        for src_video_path, dst_video_path, episodes_to_keep in tqdm(video_jobs, desc="Writing video files"):
+            _write_video_file(src_video_path, dst_video_path, episodes_to_keep, fps, vcodec, pix_fmt)
+    else:
+        # Spawn rather than fork, the codecs are not fork safe
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp.get_context("spawn")) as executor:
+            futures = [executor.submit(_write_video_file, *job, fps, vcodec, pix_fmt) for job in video_jobs]
+            for future in tqdm(futures, desc="Writing video files"):
+                future.result()
+
     return episodes_video_metadata
 
 
@@ -882,6 +1121,7 @@ def _copy_and_reindex_episodes_metadata(
         total_frames += src_episode["length"]
 
     dst_meta._close_writer()
+    remap_recording_stats([src_dataset.root], [episode_mapping], dst_meta.root)
 
     dst_meta.info.update(
         {
@@ -1053,6 +1293,11 @@ def _copy_episodes_metadata_and_stats(
     dst_episodes_dir = dst_meta.root / "meta/episodes"
     if episodes_dir.exists():
         shutil.copytree(episodes_dir, dst_episodes_dir, dirs_exist_ok=True)
+    remap_recording_stats(
+        [src_dataset.root],
+        [{ep_idx: ep_idx for ep_idx in range(src_dataset.meta.total_episodes)}],
+        dst_meta.root,
+    )
 
     dst_meta.info.update(
         {
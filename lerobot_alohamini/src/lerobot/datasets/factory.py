@@ -80,8 +80,11 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
     Returns:
         LeRobotDataset | MultiLeRobotDataset
     """
+    # Transforms applied on device are applied to the collated batches by the training loop
     image_transforms = (
-        ImageTransforms(cfg.dataset.image_transforms) if cfg.dataset.image_transforms.enable else None
+        ImageTransforms(cfg.dataset.image_transforms)
+        if cfg.dataset.image_transforms.enable and not cfg.dataset.image_transforms.on_device
+        else None
     )
 
     if isinstance(cfg.dataset.repo_id, str):
@@ -108,6 +111,8 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 image_transforms=image_transforms,
                 revision=cfg.dataset.revision,
                 max_num_shards=cfg.num_workers,
+                prefetch_size=cfg.dataset.streaming_prefetch_size,
+                num_decode_workers=cfg.dataset.streaming_decode_workers,
             )
     else:
         raise NotImplementedError("The MultiLeRobotDataset isn't supported for now.")
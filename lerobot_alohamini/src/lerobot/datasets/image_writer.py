@@ -13,9 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import ctypes
 import multiprocessing
 import queue
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
@@ -104,21 +107,124 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level
         print(f"Error writing image {fpath}: {e}")
 
 
-def worker_thread_loop(queue: queue.Queue):
+@dataclass
+class SharedFrame:
+    """Reference to a frame stored in a slot of a `SharedFrameRing`."""
+
+    slot: int
+    shape: tuple[int, ...]
+    dtype: str
+    enqueued_at: float
+
+
+class SharedFrameRing:
+    """Fixed-size frame slots in shared memory, handed over to the image writer processes by index.
+
+    The recorder copies each frame into a free slot and only sends a `SharedFrame` through the queue, instead of
+    pickling the whole frame through a pipe. The writer process reads the frame from the slot and frees the slot
+    once the image is written. When every slot is in use, `put` waits for a free one, which applies back-pressure
+    on the recorder.
+
+    Args:
+        num_slots: Number of frame slots.
+        slot_nbytes: Size of a slot in bytes. Larger frames can't be stored in the ring.
+    """
+
+    def __init__(self, num_slots: int, slot_nbytes: int):
+        if num_slots <= 0 or slot_nbytes <= 0:
+            raise ValueError(
+                f"num_slots and slot_nbytes must be positive, got {num_slots} and {slot_nbytes}."
+            )
+
+        self.num_slots = num_slots
+        self.slot_nbytes = slot_nbytes
+        # Allocated before starting the writer processes, which inherit it
+        self.buffer = multiprocessing.RawArray(ctypes.c_uint8, num_slots * slot_nbytes)
+        self.free_slots = multiprocessing.Queue()
+        for slot in range(num_slots):
+            self.free_slots.put(slot)
+        self.slots_in_use = multiprocessing.Value("i", 0)
+        self.max_latency_s = multiprocessing.Value("d", 0.0)
+        # Only updated by the recorder process
+        self.max_slots_in_use = 0
+
+    def fits(self, image: np.ndarray) -> bool:
+        return image.nbytes <= self.slot_nbytes
+
+    def slot_view(self, frame: SharedFrame) -> np.ndarray:
+        dtype = np.dtype(frame.dtype)
+        count = int(np.prod(frame.shape)) * dtype.itemsize
+        view = np.frombuffer(self.buffer, dtype=np.uint8, count=count, offset=frame.slot * self.slot_nbytes)
+        return view.view(dtype).reshape(frame.shape)
+
+    def put(
+        self,
+        image: np.ndarray,
+        writer_processes: list[multiprocessing.Process] | None = None,
+        timeout_s: float = 1.0,
+    ) -> SharedFrame:
+        """Copy `image` into a free slot, waiting for one if they are all in use.
+
+        While waiting, the `writer_processes` freeing the slots are checked every `timeout_s` seconds. If one of
+        them has exited, the slots it holds will never be freed and a RuntimeError is raised instead of waiting
+        forever.
+        """
+        while True:
+            try:
+                slot = self.free_slots.get(timeout=timeout_s)
+                break
+            except queue.Empty:
+                dead = [p for p in writer_processes or [] if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(
+                        "Every shared frame slot is in use and image writer processes have exited "
+                        f"(exit codes {[p.exitcode for p in dead]}), the images can't be written anymore."
+                    ) from None
+        with self.slots_in_use.get_lock():
+            self.slots_in_use.value += 1
+            self.max_slots_in_use = max(self.max_slots_in_use, self.slots_in_use.value)
+
+        frame = SharedFrame(slot, image.shape, image.dtype.str, time.monotonic())
+        np.copyto(self.slot_view(frame), image)
+        return frame
+
+    def release(self, frame: SharedFrame) -> None:
+        """Free the slot of a frame that has been written."""
+        latency_s = time.monotonic() - frame.enqueued_at
+        with self.max_latency_s.get_lock():
+            self.max_latency_s.value = max(self.max_latency_s.value, latency_s)
+        with self.slots_in_use.get_lock():
+            self.slots_in_use.value -= 1
+        self.free_slots.put(frame.slot)
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "num_slots": self.num_slots,
+            "slots_in_use": self.slots_in_use.value,
+            "max_slots_in_use": self.max_slots_in_use,
+            "max_latency_s": self.max_latency_s.value,
+        }
+
+
+def worker_thread_loop(queue: queue.Queue, frame_ring: SharedFrameRing | None = None):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
         image_array, fpath, compress_level = item
-        write_image(image_array, fpath, compress_level)
+        if isinstance(image_array, SharedFrame):
+            write_image(frame_ring.slot_view(image_array), fpath, compress_level)
+            frame_ring.release(image_array)
+        else:
+            write_image(image_array, fpath, compress_level)
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(queue: queue.Queue, num_threads: int, frame_ring: SharedFrameRing | None = None):
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, frame_ring))
         t.daemon = True
         t.start()
         threads.append(t)
@@ -139,14 +245,25 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    With processes, numpy images are handed over through a `SharedFrameRing` of `num_shared_slots` slots of
+    `shared_slot_nbytes` bytes, so that only slot indices go through the queue. Images that don't fit in a slot,
+    and PIL images, are sent through the queue. Set `num_shared_slots=0` to send every image through the queue.
     """
 
-    def __init__(self, num_processes: int = 0, num_threads: int = 1):
+    def __init__(
+        self,
+        num_processes: int = 0,
+        num_threads: int = 1,
+        num_shared_slots: int = 64,
+        shared_slot_nbytes: int = 640 * 480 * 3,
+    ):
         self.num_processes = num_processes
         self.num_threads = num_threads
         self.queue = None
         self.threads = []
         self.processes = []
+        self.frame_ring = None
         self._stopped = False
 
         if num_threads <= 0 and num_processes <= 0:
@@ -163,8 +280,12 @@ class AsyncImageWriter:
         else:
             # Use multiprocessing
             self.queue = multiprocessing.JoinableQueue()
+            if num_shared_slots > 0:
+                self.frame_ring = SharedFrameRing(num_shared_slots, shared_slot_nbytes)
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
+                p = multiprocessing.Process(
+                    target=worker_process, args=(self.queue, self.num_threads, self.frame_ring)
+                )
                 p.daemon = True
                 p.start()
                 self.processes.append(p)
@@ -175,8 +296,15 @@ class AsyncImageWriter:
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
+        if self.frame_ring is not None and isinstance(image, np.ndarray) and self.frame_ring.fits(image):
+            image = self.frame_ring.put(image, writer_processes=self.processes)
         self.queue.put((image, fpath, compress_level))
 
+    def stats(self) -> dict[str, float | int]:
+        """Back-pressure statistics of the shared frame ring: slots currently in use, maximum number of slots
+        used at once and maximum time between handing over a frame and writing it. Empty without a ring."""
+        return self.frame_ring.stats() if self.frame_ring is not None else {}
+
     def wait_until_done(self):
         self.queue.join()
 
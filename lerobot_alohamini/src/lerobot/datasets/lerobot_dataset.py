@@ -33,14 +33,19 @@ import torch.utils
 from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
-from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.compute_stats import StatsAccumulator, aggregate_stats, compute_episode_stats
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     DEFAULT_FEATURES,
     DEFAULT_IMAGE_PATH,
     INFO_PATH,
+    SESSION_JOURNAL_PATH,
+    EpisodeIndex,
     _validate_feature_names,
+    append_session_journal,
+    build_absolute_to_relative_index,
+    cast_stats_to_numpy,
     check_delta_timestamps,
     check_version_compatibility,
     create_empty_dataset_info,
@@ -56,6 +61,7 @@ from lerobot.datasets.utils import (
     load_episodes,
     load_info,
     load_nested_dataset,
+    load_session_journal,
     load_stats,
     load_tasks,
     update_chunk_file_indices,
@@ -88,6 +94,7 @@ class LeRobotDatasetMetadata:
         revision: str | None = None,
         force_cache_sync: bool = False,
         metadata_buffer_size: int = 10,
+        info_flush_interval: int = 10,
     ):
         self.repo_id = repo_id
         self.revision = revision if revision else CODEBASE_VERSION
@@ -96,6 +103,11 @@ class LeRobotDatasetMetadata:
         self.latest_episode = None
         self.metadata_buffer: list[dict] = []
         self.metadata_buffer_size = metadata_buffer_size
+        self.pending_episodes: list[dict] = []
+        self._episodes_stale = False
+        self._writer_closed_for_reading = False
+        self.info_flush_interval = info_flush_interval
+        self._num_unwritten_episodes = 0
 
         try:
             if force_cache_sync:
@@ -155,14 +167,110 @@ class LeRobotDatasetMetadata:
         """
         Trust the user to call .finalize() but as an added safety check call the parquet writer to stop when calling the destructor
         """
+        pending_episodes = getattr(self, "pending_episodes", None)
+        if pending_episodes:
+            logging.warning(
+                f"Episodes {[ep['episode_index'] for ep in pending_episodes]} are still waiting for their videos "
+                "to be encoded, their metadata has not been written."
+            )
         self._close_writer()
 
+    @property
+    def episodes(self) -> datasets.Dataset | None:
+        """Episodes metadata. While recording, it is reloaded on access when episodes have been saved since it
+        was last loaded, instead of after every episode."""
+        if getattr(self, "_episodes_stale", False):
+            # The parquet footer must be written for the file to be readable, the next episodes go to a new file
+            self._close_writer()
+            self._writer_closed_for_reading = True
+            self._episodes = load_episodes(self.root)
+            self._episodes_stale = False
+        return self._episodes
+
+    @episodes.setter
+    def episodes(self, episodes: datasets.Dataset | None) -> None:
+        self._episodes = episodes
+        self._episodes_stale = False
+
+    @property
+    def stats(self) -> dict[str, dict] | None:
+        """Dataset stats. While recording, the stats of the saved episodes are merged as they come and only
+        assembled on access."""
+        accumulator = getattr(self, "_stats_accumulator", None)
+        if accumulator is not None and self._stats_stale:
+            self._stats = accumulator.get_stats()
+            self._stats_stale = False
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: dict[str, dict] | None) -> None:
+        self._stats = stats
+        self._stats_accumulator = None
+        self._stats_stale = False
+
+    def _add_episode_stats(self, episode_stats: dict[str, dict]) -> None:
+        if self._stats_accumulator is None:
+            self._stats_accumulator = StatsAccumulator(self._stats)
+        self._stats_accumulator.add(episode_stats)
+        self._stats_stale = True
+
+    def _add_episode_to_info(self, episode_length: int) -> None:
+        self.info["total_episodes"] += 1
+        self.info["total_frames"] += episode_length
+        self.info["total_tasks"] = len(self.tasks)
+        self.info["splits"] = {"train": f"0:{self.info['total_episodes']}"}
+
+    def write_info_and_stats(self) -> None:
+        """Write info.json and stats.json, which clears the session journal of the episodes saved since they
+        were last written."""
+        if self.stats is not None:
+            write_stats(self.stats, self.root)
+        write_info(self.info, self.root)
+        (self.root / SESSION_JOURNAL_PATH).unlink(missing_ok=True)
+        self._num_unwritten_episodes = 0
+
+    def _replay_session_journal(self) -> None:
+        """Apply the episodes of a recording session that stopped before writing info.json and stats.json.
+
+        Only the episodes present in the episodes metadata are applied. As info.json and stats.json are not
+        written at once, each of them skips the episodes it already accounts for.
+        """
+        entries = load_session_journal(self.root)
+        if len(entries) == 0:
+            return
+
+        num_episodes = len(self.episodes) if self.episodes is not None else 0
+        # Every frame is counted in the stats of the `index` feature
+        if self.stats is not None and "index" in self.stats:
+            stats_num_frames = int(self.stats["index"]["count"][0])
+        else:
+            stats_num_frames = self.info["total_frames"]
+
+        for entry in entries:
+            if entry["episode_index"] >= num_episodes:
+                continue
+            applied = False
+            if entry["episode_index"] >= self.info["total_episodes"]:
+                self._add_episode_to_info(entry["length"])
+                applied = True
+            if entry["frames_before"] >= stats_num_frames and len(entry["stats"]) > 0:
+                self._add_episode_stats(cast_stats_to_numpy(entry["stats"]))
+                applied = True
+            # Written by the next `write_info_and_stats`, e.g. when resuming the recording
+            self._num_unwritten_episodes += applied
+
+        if self._num_unwritten_episodes > 0:
+            logging.info(
+                f"Applied {self._num_unwritten_episodes} episodes from the session journal of {self.root}"
+            )
+
     def load_metadata(self):
         self.info = load_info(self.root)
         check_version_compatibility(self.repo_id, self._version, CODEBASE_VERSION)
         self.tasks = load_tasks(self.root)
         self.episodes = load_episodes(self.root)
         self.stats = load_stats(self.root)
+        self._replay_session_journal()
 
     def pull_from_repo(
         self,
@@ -367,7 +475,13 @@ class LeRobotDatasetMetadata:
                 else self.writer.where
             )
 
-            if Path(latest_path).exists():
+            if self._writer_closed_for_reading:
+                # The latest file has been closed to be read, it can't be appended to anymore
+                self._flush_metadata_buffer()
+                chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, self.chunks_size)
+                self._close_writer()
+                self._writer_closed_for_reading = False
+            elif Path(latest_path).exists():
                 latest_size_in_mb = get_file_size_in_mb(Path(latest_path))
                 latest_num_frames = self.latest_episode["episode_index"][0]
 
@@ -388,6 +502,7 @@ class LeRobotDatasetMetadata:
         # Add to buffer
         self.metadata_buffer.append(episode_dict)
         self.latest_episode = episode_dict
+        self._episodes_stale = True
 
         if len(self.metadata_buffer) >= self.metadata_buffer_size:
             self._flush_metadata_buffer()
@@ -399,7 +514,13 @@ class LeRobotDatasetMetadata:
         episode_tasks: list[str],
         episode_stats: dict[str, dict],
         episode_metadata: dict,
+        pending_videos: bool = False,
     ) -> None:
+        """Save the metadata of an episode.
+
+        With `pending_videos=True`, the episode row is held in memory until `complete_episode_videos` provides
+        the metadata of its videos, which are encoded later on by batches. Info and stats are updated right away.
+        """
         episode_dict = {
             "episode_index": episode_index,
             "tasks": episode_tasks,
@@ -407,18 +528,45 @@ class LeRobotDatasetMetadata:
         }
         episode_dict.update(episode_metadata)
         episode_dict.update(flatten_dict({"stats": episode_stats}))
-        self._save_episode_metadata(episode_dict)
+        if pending_videos:
+            self.pending_episodes.append(episode_dict)
+        else:
+            self._save_episode_metadata(episode_dict)
+
+        # Journal the episode first, so that info and stats can be recovered if the session stops before they
+        # are written
+        append_session_journal(
+            self.root,
+            {
+                "episode_index": episode_index,
+                "length": episode_length,
+                "frames_before": self.info["total_frames"],
+                "stats": episode_stats,
+            },
+        )
+        self._add_episode_to_info(episode_length)
+        self._add_episode_stats(episode_stats)
 
-        # Update info
-        self.info["total_episodes"] += 1
-        self.info["total_frames"] += episode_length
-        self.info["total_tasks"] = len(self.tasks)
-        self.info["splits"] = {"train": f"0:{self.info['total_episodes']}"}
+        self._num_unwritten_episodes += 1
+        if self._num_unwritten_episodes >= self.info_flush_interval:
+            self.write_info_and_stats()
 
-        write_info(self.info, self.root)
+    def finalize(self) -> None:
+        """Write info, stats and the buffered episodes metadata, and close the parquet writer."""
+        if getattr(self, "_num_unwritten_episodes", 0) > 0:
+            self.write_info_and_stats()
+        self._close_writer()
 
-        self.stats = aggregate_stats([self.stats, episode_stats]) if self.stats is not None else episode_stats
-        write_stats(self.stats, self.root)
+    def complete_episode_videos(self, episode_index: int, video_metadata: dict) -> None:
+        """Add the video metadata of the oldest episode saved with `pending_videos=True` and append its row to
+        the episodes parquet file. Episodes must be completed in order."""
+        if not self.pending_episodes or self.pending_episodes[0]["episode_index"] != episode_index:
+            pending = [ep["episode_index"] for ep in self.pending_episodes]
+            raise ValueError(f"Episode {episode_index} is not the next episode waiting for videos: {pending}")
+
+        episode_dict = self.pending_episodes.pop(0)
+        episode_dict.update(video_metadata)
+        self._save_episode_metadata(episode_dict)
 
     def update_video_info(self, video_key: str | None = None) -> None:
         """
@@ -505,13 +653,16 @@ class LeRobotDatasetMetadata:
         chunks_size: int | None = None,
         data_files_size_in_mb: int | None = None,
         video_files_size_in_mb: int | None = None,
+        info_flush_interval: int = 10,
+        exist_ok: bool = False,
     ) -> "LeRobotDatasetMetadata":
-        """Creates metadata for a LeRobotDataset."""
+        """Creates metadata for a LeRobotDataset. With `exist_ok`, `root` may already exist, e.g. to resume
+        writing a dataset whose info is the one that was created."""
         obj = cls.__new__(cls)
         obj.repo_id = repo_id
         obj.root = Path(root) if root is not None else HF_LEROBOT_HOME / repo_id
 
-        obj.root.mkdir(parents=True, exist_ok=False)
+        obj.root.mkdir(parents=True, exist_ok=exist_ok)
 
         features = {**features, **DEFAULT_FEATURES}
         _validate_feature_names(features)
@@ -537,6 +688,10 @@ class LeRobotDatasetMetadata:
         obj.latest_episode = None
         obj.metadata_buffer = []
         obj.metadata_buffer_size = metadata_buffer_size
+        obj.pending_episodes = []
+        obj._writer_closed_for_reading = False
+        obj.info_flush_interval = info_flush_interval
+        obj._num_unwritten_episodes = 0
         return obj
 
 
@@ -723,13 +878,17 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.hf_dataset = self.load_hf_dataset()
 
         # Create mapping from absolute indices to relative indices when only a subset of the episodes are loaded
-        # Build a mapping: absolute_index -> relative_index_in_filtered_dataset
+        # Build a lookup table: absolute_index -> relative_index_in_filtered_dataset
         self._absolute_to_relative_idx = None
         if self.episodes is not None:
-            self._absolute_to_relative_idx = {
-                abs_idx.item() if isinstance(abs_idx, torch.Tensor) else abs_idx: rel_idx
-                for rel_idx, abs_idx in enumerate(self.hf_dataset["index"])
-            }
+            self._absolute_to_relative_idx = build_absolute_to_relative_index(
+                self.hf_dataset.with_format("numpy")["index"]
+            )
+
+        # Materialize the episodes metadata used by __getitem__ into arrays
+        self._episode_index = None
+        self._episode_index_source = None
+        self._get_episode_index()
 
         # Setup delta_indices
         if self.delta_timestamps is not None:
@@ -761,7 +920,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         upload_large_folder: bool = False,
         **card_kwargs,
     ) -> None:
-        ignore_patterns = ["images/"]
+        # The session journal only matters to resume recording locally, see `LeRobotDatasetMetadata._replay_session_journal`
+        ignore_patterns = ["images/", SESSION_JOURNAL_PATH]
         if not push_videos:
             ignore_patterns.append("videos/")
 
@@ -925,10 +1085,19 @@ class LeRobotDataset(torch.utils.data.Dataset):
         else:
             return get_hf_features_from_features(self.features)
 
+    def _get_episode_index(self) -> EpisodeIndex:
+        """Columnar view of `self.meta.episodes`, rebuilt whenever the episodes metadata is reloaded."""
+        if self.meta.episodes is None:
+            self.meta.episodes = load_episodes(self.root)
+        if self._episode_index is None or self._episode_index_source is not self.meta.episodes:
+            self._episode_index = EpisodeIndex.from_episodes(self.meta.episodes, self.meta.video_keys)
+            self._episode_index_source = self.meta.episodes
+        return self._episode_index
+
     def _get_query_indices(self, idx: int, ep_idx: int) -> tuple[dict[str, list[int | bool]]]:
-        ep = self.meta.episodes[ep_idx]
-        ep_start = ep["dataset_from_index"]
-        ep_end = ep["dataset_to_index"]
+        episode_index = self._get_episode_index()
+        ep_start = int(episode_index.dataset_from_index[ep_idx])
+        ep_end = int(episode_index.dataset_to_index[ep_idx])
         query_indices = {
             key: [max(ep_start, min(ep_end - 1, idx + delta)) for delta in delta_idx]
             for key, delta_idx in self.delta_indices.items()
@@ -950,7 +1119,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         for key in self.meta.video_keys:
             if query_indices is not None and key in query_indices:
                 if self._absolute_to_relative_idx is not None:
-                    relative_indices = [self._absolute_to_relative_idx[idx] for idx in query_indices[key]]
+                    relative_indices = self._absolute_to_relative_idx[query_indices[key]].tolist()
                     timestamps = self.hf_dataset[relative_indices]["timestamp"]
                 else:
                     timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
@@ -980,7 +1149,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             relative_indices = (
                 q_idx
                 if self._absolute_to_relative_idx is None
-                else [self._absolute_to_relative_idx[idx] for idx in q_idx]
+                else self._absolute_to_relative_idx[q_idx].tolist()
             )
             try:
                 result[key] = torch.stack(self.hf_dataset[key][relative_indices])
@@ -994,16 +1163,20 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
         """
-        ep = self.meta.episodes[ep_idx]
+        episode_index = self._get_episode_index()
         item = {}
         for vid_key, query_ts in query_timestamps.items():
             # Episodes are stored sequentially on a single mp4 to reduce the number of files.
             # Thus we load the start timestamp of the episode on this mp4 and,
             # shift the query timestamp accordingly.
-            from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
+            from_timestamp = float(episode_index.video_from_timestamp[vid_key][ep_idx])
             shifted_query_ts = [from_timestamp + ts for ts in query_ts]
 
-            video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+            video_path = self.root / self.meta.video_path.format(
+                video_key=vid_key,
+                chunk_index=int(episode_index.video_chunk_index[vid_key][ep_idx]),
+                file_index=int(episode_index.video_file_index[vid_key][ep_idx]),
+            )
             frames = decode_video_frames(video_path, shifted_query_ts, self.tolerance_s, self.video_backend)
             item[vid_key] = frames.squeeze(0)
 
@@ -1069,7 +1242,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         The dataset won't be valid and can't be loaded as ds = LeRobotDataset(repo_id=repo, root=HF_LEROBOT_HOME.joinpath(repo))
         """
         self._close_writer()
-        self.meta._close_writer()
+        self.meta.finalize()
 
     def create_episode_buffer(self, episode_index: int | None = None) -> dict:
         current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
@@ -1234,8 +1407,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 for video_key in self.meta.video_keys:
                     ep_metadata.update(self._save_episode_video(video_key, episode_index))
 
-        # `meta.save_episode` need to be executed after encoding the videos
-        self.meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
+        # `meta.save_episode` need to be executed after encoding the videos. With batched encoding, the episode
+        # row is written once its videos are encoded, by `_batch_save_episode_video`
+        self.meta.save_episode(
+            episode_index,
+            episode_length,
+            episode_tasks,
+            ep_stats,
+            ep_metadata,
+            pending_videos=has_video_keys and use_batched_encoding,
+        )
 
         if has_video_keys and use_batched_encoding:
             # Check if we should trigger batch encoding
@@ -1265,43 +1446,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
             f"Batch encoding {self.batch_encoding_size} videos for episodes {start_episode} to {end_episode - 1}"
         )
 
-        chunk_idx = self.meta.episodes[start_episode]["data/chunk_index"]
-        file_idx = self.meta.episodes[start_episode]["data/file_index"]
-        episode_df_path = self.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        episode_df = pd.read_parquet(episode_df_path)
-
         for ep_idx in range(start_episode, end_episode):
             logging.info(f"Encoding videos for episode {ep_idx}")
 
-            if (
-                self.meta.episodes[ep_idx]["data/chunk_index"] != chunk_idx
-                or self.meta.episodes[ep_idx]["data/file_index"] != file_idx
-            ):
-                # The current episode is in a new chunk or file.
-                # Save previous episode dataframe and update the Hugging Face dataset by reloading it.
-                episode_df.to_parquet(episode_df_path)
-                self.meta.episodes = load_episodes(self.root)
-
-                # Load new episode dataframe
-                chunk_idx = self.meta.episodes[ep_idx]["data/chunk_index"]
-                file_idx = self.meta.episodes[ep_idx]["data/file_index"]
-                episode_df_path = self.root / DEFAULT_EPISODES_PATH.format(
-                    chunk_index=chunk_idx, file_index=file_idx
-                )
-                episode_df = pd.read_parquet(episode_df_path)
-
-            # Save the current episode's video metadata to the dataframe
             video_ep_metadata = {}
             for video_key in self.meta.video_keys:
                 video_ep_metadata.update(self._save_episode_video(video_key, ep_idx))
             video_ep_metadata.pop("episode_index")
-            video_ep_df = pd.DataFrame(video_ep_metadata, index=[ep_idx]).convert_dtypes(
-                dtype_backend="pyarrow"
-            )  # allows NaN values along with integers
 
-            episode_df = episode_df.combine_first(video_ep_df)
-            episode_df.to_parquet(episode_df_path)
-            self.meta.episodes = load_episodes(self.root)
+            # Append the episode row, held in memory until now, instead of rewriting the episodes file
+            self.meta.complete_episode_videos(ep_idx, video_ep_metadata)
 
     def _save_episode_data(self, episode_buffer: dict) -> dict:
         """Save episode data to a parquet file and update the Hugging Face dataset of frames data.
@@ -1573,6 +1727,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.delta_timestamps = None
         obj.delta_indices = None
         obj._absolute_to_relative_idx = None
+        obj._episode_index = None
+        obj._episode_index_source = None
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
         obj.writer = None
         obj.latest_episode = None
@@ -105,6 +105,10 @@ class OnlineBuffer(torch.utils.data.Dataset):
         # minus 1e-4 to account for possible numerical error
         self.tolerance_s = 1 / self.fps - 1e-4 if fps is not None else None
         self._buffer_capacity = buffer_capacity
+        # Frames added since the buffer was opened, it lets `SamplerWeights` find out which frames are new
+        self.num_added_frames = 0
+        # Occupied frames sorted by episode then timestamp, used to look up delta timestamps. Built lazily.
+        self._episodes_view: dict[str, np.ndarray] | None = None
         data_spec = self._make_data_spec(data_spec, buffer_capacity)
         Path(write_dir).mkdir(parents=True, exist_ok=True)
         self._data = {}
@@ -209,6 +213,15 @@ class OnlineBuffer(torch.utils.data.Dataset):
         else:
             self._data[OnlineBuffer.NEXT_INDEX_KEY] = n_surplus
 
+        self.num_added_frames += new_data_length
+        self._episodes_view = None
+
+    def last_written_indices(self, num_frames: int) -> np.ndarray:
+        """Indices of the `num_frames` most recently written frames, from the oldest to the newest."""
+        num_frames = min(num_frames, self._buffer_capacity)
+        next_index = int(self._data[OnlineBuffer.NEXT_INDEX_KEY])
+        return (next_index - num_frames + np.arange(num_frames)) % self._buffer_capacity
+
     @property
     def data_keys(self) -> list[str]:
         keys = set(self._data)
@@ -233,69 +246,185 @@ class OnlineBuffer(torch.utils.data.Dataset):
     def __len__(self):
         return self.num_frames
 
-    def _item_to_tensors(self, item: dict) -> dict:
-        item_ = {}
-        for k, v in item.items():
-            if isinstance(v, torch.Tensor):
-                item_[k] = v
-            elif isinstance(v, np.ndarray):
-                item_[k] = torch.from_numpy(v)
-            else:
-                item_[k] = torch.tensor(v)
-        return item_
+    def _get_episodes_view(self) -> dict[str, np.ndarray]:
+        """Sort the occupied frames by episode and timestamp, so that the frames closest to the query timestamps
+        can be searched for all the items of a batch at once."""
+        if self._episodes_view is not None:
+            return self._episodes_view
+
+        indices = np.flatnonzero(self._data[OnlineBuffer.OCCUPANCY_MASK_KEY])
+        episode_indices = self._data[OnlineBuffer.EPISODE_INDEX_KEY][indices]
+        timestamps = self._data[OnlineBuffer.TIMESTAMP_KEY][indices]
+        order = np.lexsort((timestamps, episode_indices))
+        indices, episode_indices, timestamps = indices[order], episode_indices[order], timestamps[order]
+
+        episodes, starts = np.unique(episode_indices, return_index=True)
+        ends = np.append(starts[1:], len(indices))
+        # Shift the timestamps of each episode past the ones of the previous episode, which makes them sorted
+        # across episodes
+        spans = timestamps[ends - 1] - timestamps[starts] + 1.0
+        offsets = np.cumsum(spans) - spans - timestamps[starts]
+
+        self._episodes_view = {
+            "indices": indices,
+            "timestamps": timestamps,
+            "shifted_timestamps": timestamps + np.repeat(offsets, ends - starts),
+            "episodes": episodes,
+            "starts": starts,
+            "ends": ends,
+            "offsets": offsets,
+        }
+        return self._episodes_view
 
-    def __getitem__(self, idx: int) -> dict[str, torch.Tensor]:
-        if idx >= len(self) or idx < -len(self):
+    def get_batch(self, indices: list[int] | np.ndarray) -> dict[str, torch.Tensor]:
+        """Get the items at `indices` stacked in a batch.
+
+        All the keys, and the frames of all the delta timestamps windows, are gathered with a single fancy
+        indexing of each memmap.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if ((indices >= len(self)) | (indices < -len(self))).any():
             raise IndexError
+        indices = indices % self._buffer_capacity
 
-        item = {k: v[idx] for k, v in self._data.items() if not k.startswith("_")}
+        batch = {k: v[indices] for k, v in self._data.items() if not k.startswith("_")}
 
         if self.delta_timestamps is None:
-            return self._item_to_tensors(item)
-
-        episode_index = item[OnlineBuffer.EPISODE_INDEX_KEY]
-        current_ts = item[OnlineBuffer.TIMESTAMP_KEY]
-        episode_data_indices = np.where(
-            np.bitwise_and(
-                self._data[OnlineBuffer.EPISODE_INDEX_KEY] == episode_index,
-                self._data[OnlineBuffer.OCCUPANCY_MASK_KEY],
-            )
-        )[0]
-        episode_timestamps = self._data[OnlineBuffer.TIMESTAMP_KEY][episode_data_indices]
+            return {k: torch.from_numpy(v) for k, v in batch.items()}
 
-        for data_key in self.delta_timestamps:
-            # Note: The logic in this loop is copied from `load_previous_and_future_frames`.
-            # Get timestamps used as query to retrieve data of previous/future frames.
-            query_ts = current_ts + self.delta_timestamps[data_key]
+        view = self._get_episodes_view()
+        # Position of the episode of each item in the view
+        episode_pos = np.searchsorted(view["episodes"], batch[OnlineBuffer.EPISODE_INDEX_KEY])
+        starts = view["starts"][episode_pos][:, None]
+        lasts = view["ends"][episode_pos][:, None] - 1
+        current_ts = batch[OnlineBuffer.TIMESTAMP_KEY][:, None]
 
-            # Compute distances between each query timestamp and all timestamps of all the frames belonging to
-            # the episode.
-            dist = np.abs(query_ts[:, None] - episode_timestamps[None, :])
-            argmin_ = np.argmin(dist, axis=1)
-            min_ = dist[np.arange(dist.shape[0]), argmin_]
+        for data_key, delta_ts in self.delta_timestamps.items():
+            # Get timestamps used as query to retrieve data of previous/future frames.
+            query_ts = current_ts + delta_ts[None, :]
+
+            # Candidates are the frames right before and right after the query in the episode, clipping to the
+            # episode boundaries when the query is outside of it.
+            shifted_query_ts = query_ts + view["offsets"][episode_pos][:, None]
+            after = np.searchsorted(view["shifted_timestamps"], shifted_query_ts)
+            before = np.clip(after - 1, starts, lasts)
+            after = np.clip(after, starts, lasts)
+            dist_before = np.abs(query_ts - view["timestamps"][before])
+            dist_after = np.abs(query_ts - view["timestamps"][after])
+            closest = np.where(dist_before <= dist_after, before, after)
+            min_ = np.minimum(dist_before, dist_after)
 
             is_pad = min_ > self.tolerance_s
 
             # Check violated query timestamps are all outside the episode range.
-            assert (
-                (query_ts[is_pad] < episode_timestamps[0]) | (episode_timestamps[-1] < query_ts[is_pad])
-            ).all(), (
+            first_ts = np.broadcast_to(view["timestamps"][starts], query_ts.shape)
+            last_ts = np.broadcast_to(view["timestamps"][lasts], query_ts.shape)
+            assert ((query_ts[is_pad] < first_ts[is_pad]) | (last_ts[is_pad] < query_ts[is_pad])).all(), (
                 f"One or several timestamps unexpectedly violate the tolerance ({min_} > {self.tolerance_s=}"
                 ") inside the episode range."
             )
 
             # Load frames for this data key.
-            item[data_key] = self._data[data_key][episode_data_indices[argmin_]]
+            batch[data_key] = self._data[data_key][view["indices"][closest]]
 
-            item[f"{data_key}{OnlineBuffer.IS_PAD_POSTFIX}"] = is_pad
+            batch[f"{data_key}{OnlineBuffer.IS_PAD_POSTFIX}"] = is_pad
 
-        return self._item_to_tensors(item)
+        return {k: torch.from_numpy(v) for k, v in batch.items()}
+
+    def __getitem__(self, idx: int) -> dict[str, torch.Tensor]:
+        if idx >= len(self) or idx < -len(self):
+            raise IndexError
+
+        return {k: v[0] for k, v in self.get_batch([idx]).items()}
 
     def get_data_by_key(self, key: str) -> torch.Tensor:
         """Returns all data for a given data key as a Tensor."""
         return torch.from_numpy(self._data[key][self._data[OnlineBuffer.OCCUPANCY_MASK_KEY]])
 
 
+class SamplerWeights:
+    """Sampling weights for the online training dataloader in train.py, over [offline_dataset; online_dataset].
+
+    The frames of the offline dataset that can be sampled are found once. The ones of the online dataset are
+    updated for the frames written by `OnlineBuffer.add_data` since the last access to `weights`, instead of
+    being found again in the whole buffer.
+
+    See `compute_sampler_weights` for the arguments.
+    """
+
+    def __init__(
+        self,
+        offline_dataset: LeRobotDataset,
+        offline_drop_n_last_frames: int = 0,
+        online_dataset: OnlineBuffer | None = None,
+        online_sampling_ratio: float | None = None,
+        online_drop_n_last_frames: int = 0,
+    ):
+        if len(offline_dataset) == 0 and (online_dataset is None or len(online_dataset) == 0):
+            raise ValueError("At least one of `offline_dataset` or `online_dataset` should be contain data.")
+        if (online_dataset is None) ^ (online_sampling_ratio is None):
+            raise ValueError(
+                "`online_dataset` and `online_sampling_ratio` must be provided together or not at all."
+            )
+        self.online_dataset = online_dataset
+        self.online_sampling_ratio = online_sampling_ratio
+        self.offline_sampling_ratio = 0 if online_sampling_ratio is None else 1 - online_sampling_ratio
+        self.online_drop_n_last_frames = online_drop_n_last_frames
+
+        self._offline_mask = np.zeros(len(offline_dataset), dtype=bool)
+        if len(offline_dataset) > 0:
+            from_indices = np.asarray(offline_dataset.meta.episodes["dataset_from_index"], dtype=np.int64)
+            to_indices = np.asarray(offline_dataset.meta.episodes["dataset_to_index"], dtype=np.int64)
+            lengths = to_indices - from_indices
+            frame_indices = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            indices = np.repeat(from_indices, lengths) + frame_indices
+            keep = indices < np.repeat(to_indices - offline_drop_n_last_frames, lengths)
+            self._offline_mask[indices[keep]] = True
+
+        if online_dataset is not None:
+            self._online_mask = np.zeros(online_dataset._buffer_capacity, dtype=bool)
+            # The frames already in the buffer are all treated as new
+            self._synced_num_added_frames = online_dataset.num_added_frames - len(online_dataset)
+
+    def _sync_online_mask(self) -> None:
+        num_new_frames = self.online_dataset.num_added_frames - self._synced_num_added_frames
+        if num_new_frames == 0:
+            return
+        indices = self.online_dataset.last_written_indices(num_new_frames)
+        # `add_data` appends whole episodes, the frames of each episode are contiguous
+        episode_indices = self.online_dataset._data[OnlineBuffer.EPISODE_INDEX_KEY][indices]
+        episode_ends = np.flatnonzero(np.diff(episode_indices, append=episode_indices[-1] + 1)) + 1
+        frames_to_end = np.repeat(episode_ends, np.diff(episode_ends, prepend=0)) - np.arange(len(indices))
+        self._online_mask[indices] = frames_to_end > self.online_drop_n_last_frames
+        self._synced_num_added_frames = self.online_dataset.num_added_frames
+
+    @property
+    def weights(self) -> torch.Tensor:
+        """Tensor of weights for [offline_dataset; online_dataset], normalized to 1."""
+        weights = []
+
+        if len(self._offline_mask) > 0:
+            num_offline = np.count_nonzero(self._offline_mask)
+            fill_value = self.offline_sampling_ratio / num_offline if num_offline > 0 else 0.0
+            weights.append(self._offline_mask * np.float32(fill_value))
+
+        if self.online_dataset is not None and len(self.online_dataset) > 0:
+            self._sync_online_mask()
+            online_mask = self._online_mask[: len(self.online_dataset)]
+            num_online = np.count_nonzero(online_mask)
+            fill_value = self.online_sampling_ratio / num_online if num_online > 0 else 0.0
+            weights.append(online_mask * np.float32(fill_value))
+
+        weights = torch.from_numpy(np.concatenate(weights).astype(np.float32))
+
+        if weights.sum() == 0:
+            weights += 1 / len(weights)
+        else:
+            weights /= weights.sum()
+
+        return weights
+
+
 def compute_sampler_weights(
     offline_dataset: LeRobotDataset,
     offline_drop_n_last_frames: int = 0,
@@ -323,60 +452,12 @@ def compute_sampler_weights(
           is the ability to turn shuffling off.
         - Options `drop_first_n_frames` and `episode_indices_to_use` can be added easily. They were not
           included here to avoid adding complexity.
+        - To update the weights as data is added to the online dataset, keep a `SamplerWeights` around instead.
     """
-    if len(offline_dataset) == 0 and (online_dataset is None or len(online_dataset) == 0):
-        raise ValueError("At least one of `offline_dataset` or `online_dataset` should be contain data.")
-    if (online_dataset is None) ^ (online_sampling_ratio is None):
-        raise ValueError(
-            "`online_dataset` and `online_sampling_ratio` must be provided together or not at all."
-        )
-    offline_sampling_ratio = 0 if online_sampling_ratio is None else 1 - online_sampling_ratio
-
-    weights = []
-
-    if len(offline_dataset) > 0:
-        offline_data_mask_indices = []
-        for start_index, end_index in zip(
-            offline_dataset.meta.episodes["dataset_from_index"],
-            offline_dataset.meta.episodes["dataset_to_index"],
-            strict=True,
-        ):
-            offline_data_mask_indices.extend(range(start_index, end_index - offline_drop_n_last_frames))
-        offline_data_mask = torch.zeros(len(offline_dataset), dtype=torch.bool)
-        offline_data_mask[torch.tensor(offline_data_mask_indices)] = True
-        weights.append(
-            torch.full(
-                size=(len(offline_dataset),),
-                fill_value=offline_sampling_ratio / offline_data_mask.sum(),
-            )
-            * offline_data_mask
-        )
-
-    if online_dataset is not None and len(online_dataset) > 0:
-        online_data_mask_indices = []
-        episode_indices = online_dataset.get_data_by_key("episode_index")
-        for episode_idx in torch.unique(episode_indices):
-            where_episode = torch.where(episode_indices == episode_idx)
-            start_index = where_episode[0][0]
-            end_index = where_episode[0][-1] + 1
-            online_data_mask_indices.extend(
-                range(start_index.item(), end_index.item() - online_drop_n_last_frames)
-            )
-        online_data_mask = torch.zeros(len(online_dataset), dtype=torch.bool)
-        online_data_mask[torch.tensor(online_data_mask_indices)] = True
-        weights.append(
-            torch.full(
-                size=(len(online_dataset),),
-                fill_value=online_sampling_ratio / online_data_mask.sum(),
-            )
-            * online_data_mask
-        )
-
-    weights = torch.cat(weights)
-
-    if weights.sum() == 0:
-        weights += 1 / len(weights)
-    else:
-        weights /= weights.sum()
-
-    return weights
+    return SamplerWeights(
+        offline_dataset,
+        offline_drop_n_last_frames=offline_drop_n_last_frames,
+        online_dataset=online_dataset,
+        online_sampling_ratio=online_sampling_ratio,
+        online_drop_n_last_frames=online_drop_n_last_frames,
+    ).weights
@@ -13,7 +13,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import queue
+import threading
 from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import datasets
@@ -40,6 +44,67 @@ from lerobot.datasets.video_utils import (
 from lerobot.utils.constants import HF_LEROBOT_HOME, LOOKAHEAD_BACKTRACKTABLE, LOOKBACK_BACKTRACKTABLE
 
 
+class _ShardReader:
+    """Reads the frames of a shard ahead of their consumption.
+
+    A background thread pulls the rows of the shard in order, resolving their delta frames with `read_fn`, and
+    submits the decoding of their video frames with `decode_fn` to `decode_executor`. Up to `prefetch_size`
+    frames are kept in flight. Frames are returned by `next_frame` in the order of the shard, errors raised
+    while reading or decoding a frame are re-raised there.
+    """
+
+    def __init__(
+        self,
+        read_fn: Callable[[], tuple[dict, tuple | None]],
+        decode_fn: Callable[[dict, tuple], dict],
+        decode_executor: ThreadPoolExecutor,
+        prefetch_size: int,
+    ):
+        self._read_fn = read_fn
+        self._decode_fn = decode_fn
+        self._decode_executor = decode_executor
+        self._queue: queue.Queue = queue.Queue(maxsize=prefetch_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="streaming-shard-reader", daemon=True)
+        self._thread.start()
+
+    def _put(self, entry) -> bool:
+        # Don't block forever on a full queue once the consumer is gone
+        while not self._stop.is_set():
+            try:
+                self._queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                item, video_query = self._read_fn()
+            except Exception as e:
+                # Includes the StopIteration signaling the end of the shard
+                self._put(e)
+                return
+            entry = (
+                item
+                if video_query is None
+                else self._decode_executor.submit(self._decode_fn, item, video_query)
+            )
+            if not self._put(entry):
+                return
+
+    def next_frame(self) -> dict:
+        entry = self._queue.get()
+        if isinstance(entry, Exception):
+            raise entry
+        return entry.result() if isinstance(entry, Future) else entry
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+
 class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     """LeRobotDataset with streaming capabilities.
 
@@ -94,6 +159,8 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         seed: int = 42,
         rng: np.random.Generator | None = None,
         shuffle: bool = True,
+        prefetch_size: int = 8,
+        num_decode_workers: int = 4,
     ):
         """Initialize a StreamingLeRobotDataset.
 
@@ -112,6 +179,10 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             seed (int, optional): Reproducibility random seed.
             rng (np.random.Generator | None, optional): Random number generator.
             shuffle (bool, optional): Whether to shuffle the dataset across exhaustions. Defaults to True.
+            prefetch_size (int, optional): Number of frames read ahead by the background reader of each shard.
+                0 reads and decodes the frames synchronously, when they are consumed. Defaults to 8.
+            num_decode_workers (int, optional): Maximum number of video decodes in flight, across shards, when
+                prefetching. Defaults to 4.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -129,6 +200,13 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         self.streaming = streaming
         self.buffer_size = buffer_size
 
+        if prefetch_size < 0:
+            raise ValueError(f"prefetch_size must be non-negative, got {prefetch_size}")
+        if num_decode_workers < 1:
+            raise ValueError(f"num_decode_workers must be positive, got {num_decode_workers}")
+        self.prefetch_size = prefetch_size
+        self.num_decode_workers = num_decode_workers
+
         # We cache the video decoders to avoid re-initializing them at each frame (avoiding a ~10x slowdown)
         self.video_decoder_cache = None
 
@@ -183,10 +261,6 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         while True:
             yield rng.choice(elements)
 
-    # TODO(fracapuano): Implement multi-threaded prefetching to accelerate data loading.
-    # The current sequential iteration is a bottleneck. A producer-consumer pattern
-    # could be used with a ThreadPoolExecutor to run `make_frame` (especially video decoding)
-    # in parallel, feeding a queue from which this iterator will yield processed items.
     def __iter__(self) -> Iterator[dict[str, torch.Tensor]]:
         if self.video_decoder_cache is None:
             self.video_decoder_cache = VideoDecoderCache()
@@ -201,33 +275,71 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             for idx in range(self.num_shards)
         }
 
-        # This buffer is populated while iterating on the dataset's shards
-        # the logic is to add 2 levels of randomness:
-        # (1) sample one shard at random from the ones available, and
-        # (2) sample one frame from the shard sampled at (1)
-        frames_buffer = []
-        while available_shards := list(idx_to_backtrack_dataset.keys()):
-            shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
-            backtrack_dataset = idx_to_backtrack_dataset[shard_key]  # selects which shard to iterate on
+        decode_executor = None
+        shard_readers: dict[int, _ShardReader] = {}
+        if self.prefetch_size > 0:
+            decode_executor = ThreadPoolExecutor(
+                max_workers=self.num_decode_workers, thread_name_prefix="streaming-decode"
+            )
+            decode_threads_state = threading.local()
+
+            def decode_videos(item: dict, video_query: tuple) -> dict:
+                # Video decoders are not shared across threads
+                if not hasattr(decode_threads_state, "decoder_cache"):
+                    decode_threads_state.decoder_cache = VideoDecoderCache()
+                return self._add_video_frames(
+                    item, *video_query, decoder_cache=decode_threads_state.decoder_cache
+                )
 
-            try:
-                for frame in self.make_frame(backtrack_dataset):
-                    if len(frames_buffer) == self.buffer_size:
-                        i = next(buffer_indices_generator)  # samples a element from the buffer
-                        yield frames_buffer[i]
-                        frames_buffer[i] = frame
-                    else:
-                        frames_buffer.append(frame)
-                    break  # random shard sampled, switch shard
-            except (
-                RuntimeError,
-                StopIteration,
-            ):  # NOTE: StopIteration inside a generator throws a RuntimeError since python 3.7
-                del idx_to_backtrack_dataset[shard_key]  # Remove exhausted shard, onto another shard
-
-        # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
-        rng.shuffle(frames_buffer)
-        yield from frames_buffer
+            shard_readers = {
+                idx: _ShardReader(
+                    partial(self._read_frame, backtrack_dataset),
+                    decode_videos,
+                    decode_executor,
+                    self.prefetch_size,
+                )
+                for idx, backtrack_dataset in idx_to_backtrack_dataset.items()
+            }
+            idx_to_next_frame = {idx: reader.next_frame for idx, reader in shard_readers.items()}
+        else:
+            idx_to_next_frame = {
+                idx: partial(self._next_frame, backtrack_dataset)
+                for idx, backtrack_dataset in idx_to_backtrack_dataset.items()
+            }
+
+        try:
+            # This buffer is populated while iterating on the dataset's shards
+            # the logic is to add 2 levels of randomness:
+            # (1) sample one shard at random from the ones available, and
+            # (2) sample one frame from the shard sampled at (1)
+            frames_buffer = []
+            while available_shards := list(idx_to_next_frame.keys()):
+                shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
+
+                try:
+                    frame = idx_to_next_frame[shard_key]()  # selects which shard to iterate on
+                except (
+                    RuntimeError,
+                    StopIteration,
+                ):  # NOTE: StopIteration inside a generator throws a RuntimeError since python 3.7
+                    del idx_to_next_frame[shard_key]  # Remove exhausted shard, onto another shard
+                    continue
+
+                if len(frames_buffer) == self.buffer_size:
+                    i = next(buffer_indices_generator)  # samples a element from the buffer
+                    yield frames_buffer[i]
+                    frames_buffer[i] = frame
+                else:
+                    frames_buffer.append(frame)
+
+            # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
+            rng.shuffle(frames_buffer)
+            yield from frames_buffer
+        finally:
+            for reader in shard_readers.values():
+                reader.close()
+            if decode_executor is not None:
+                decode_executor.shutdown(wait=False, cancel_futures=True)
 
     def _get_window_steps(
         self, delta_timestamps: dict[str, list[float]] | None = None, dynamic_bounds: bool = False
@@ -300,62 +412,82 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
     def make_frame(self, dataset_iterator: Backtrackable) -> Generator:
         """Makes a frame starting from a dataset iterator"""
+        item, video_query = self._read_frame(dataset_iterator)
+        if video_query is not None:
+            item = self._add_video_frames(item, *video_query)
+        yield item
+
+    def _next_frame(self, dataset_iterator: Backtrackable) -> dict:
+        return next(self.make_frame(dataset_iterator))
+
+    def _read_frame(self, dataset_iterator: Backtrackable) -> tuple[dict, tuple | None]:
+        """Reads the next frame of a dataset iterator, with its delta frames but without its video frames.
+
+        Returns:
+            The frame and the arguments of `_add_video_frames` to decode its video frames, or None if the
+            dataset has no videos.
+        """
         item = next(dataset_iterator)
         item = item_to_torch(item)
 
-        updates = []  # list of "updates" to apply to the item retrieved from hf_dataset (w/o camera features)
-
         # Get episode index from the item
         ep_idx = item["episode_index"]
 
         # "timestamp" restarts from 0 for each episode, whereas we need a global timestep within the single .mp4 file (given by index/fps)
         current_ts = item["index"] / self.fps
 
-        episode_boundaries_ts = {
-            key: (
-                self.meta.episodes[ep_idx][f"videos/{key}/from_timestamp"],
-                self.meta.episodes[ep_idx][f"videos/{key}/to_timestamp"],
-            )
-            for key in self.meta.video_keys
-        }
+        result = item.copy()
 
         # Apply delta querying logic if necessary
         if self.delta_indices is not None:
             query_result, padding = self._get_delta_frames(dataset_iterator, item)
-            updates.append(query_result)
-            updates.append(padding)
+            result.update(query_result)
+            result.update(padding)
 
-        # Load video frames, when needed
-        if len(self.meta.video_keys) > 0:
-            original_timestamps = self._make_timestamps_from_indices(current_ts, self.delta_indices)
+        result["task"] = self.meta.tasks.iloc[item["task_index"]].name
+
+        if len(self.meta.video_keys) == 0:
+            return result, None
 
-            # Some timestamps might not result available considering the episode's boundaries
-            query_timestamps = self._get_query_timestamps(
-                current_ts, self.delta_indices, episode_boundaries_ts
+        episode_boundaries_ts = {
+            key: (
+                self.meta.episodes[ep_idx][f"videos/{key}/from_timestamp"],
+                self.meta.episodes[ep_idx][f"videos/{key}/to_timestamp"],
             )
-            video_frames = self._query_videos(query_timestamps, ep_idx)
+            for key in self.meta.video_keys
+        }
+        original_timestamps = self._make_timestamps_from_indices(current_ts, self.delta_indices)
 
-            if self.image_transforms is not None:
-                image_keys = self.meta.camera_keys
-                for cam in image_keys:
-                    video_frames[cam] = self.image_transforms(video_frames[cam])
+        # Some timestamps might not result available considering the episode's boundaries
+        query_timestamps = self._get_query_timestamps(current_ts, self.delta_indices, episode_boundaries_ts)
+        return result, (query_timestamps, original_timestamps, ep_idx)
 
-            updates.append(video_frames)
+    def _add_video_frames(
+        self,
+        item: dict,
+        query_timestamps: dict[str, list[float]],
+        original_timestamps: dict[str, list[float]],
+        ep_idx: int,
+        decoder_cache: VideoDecoderCache | None = None,
+    ) -> dict:
+        """Decodes the video frames of a frame read by `_read_frame` and adds them to it."""
+        video_frames = self._query_videos(query_timestamps, ep_idx, decoder_cache)
 
-            if self.delta_indices is not None:
-                # We always return the same number of frames. Unavailable frames are padded.
-                padding_mask = self._get_video_frame_padding_mask(
-                    video_frames, query_timestamps, original_timestamps
-                )
-                updates.append(padding_mask)
+        if self.image_transforms is not None:
+            image_keys = self.meta.camera_keys
+            for cam in image_keys:
+                video_frames[cam] = self.image_transforms(video_frames[cam])
 
-        result = item.copy()
-        for update in updates:
-            result.update(update)
+        item.update(video_frames)
 
-        result["task"] = self.meta.tasks.iloc[item["task_index"]].name
+        if self.delta_indices is not None:
+            # We always return the same number of frames. Unavailable frames are padded.
+            padding_mask = self._get_video_frame_padding_mask(
+                video_frames, query_timestamps, original_timestamps
+            )
+            item.update(padding_mask)
 
-        yield result
+        return item
 
     def _get_query_timestamps(
         self,
@@ -378,19 +510,26 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         return query_timestamps
 
-    def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict:
+    def _query_videos(
+        self,
+        query_timestamps: dict[str, list[float]],
+        ep_idx: int,
+        decoder_cache: VideoDecoderCache | None = None,
+    ) -> dict:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
         """
+        if decoder_cache is None:
+            decoder_cache = self.video_decoder_cache
 
         item = {}
         for video_key, query_ts in query_timestamps.items():
             root = self.meta.url_root if self.streaming and not self.streaming_from_local else self.root
             video_path = f"{root}/{self.meta.get_video_file_path(ep_idx, video_key)}"
             frames = decode_video_frames_torchcodec(
-                video_path, query_ts, self.tolerance_s, decoder_cache=self.video_decoder_cache
+                video_path, query_ts, self.tolerance_s, decoder_cache=decoder_cache
             )
 
             item[video_key] = frames.squeeze(0) if len(query_ts) == 1 else frames
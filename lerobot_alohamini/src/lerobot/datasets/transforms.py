@@ -19,7 +19,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import torch
-from torchvision.transforms import v2
+import torch.nn.functional as nnF  # noqa: N812
+from torchvision.transforms import InterpolationMode, v2
 from torchvision.transforms.v2 import (
     Transform,
     functional as F,  # noqa: N812
@@ -179,6 +180,9 @@ class ImageTransformsConfig:
     # By default, transforms are applied in Torchvision's suggested order (shown below).
     # Set this to True to apply them in a random order.
     random_order: bool = False
+    # Set this to True to apply the transforms to whole batches on the training device, after collation,
+    # instead of to each frame in the DataLoader workers. See `BatchedImageTransforms`.
+    on_device: bool = False
     tfs: dict[str, ImageTransformConfig] = field(
         default_factory=lambda: {
             "brightness": ImageTransformConfig(
@@ -257,3 +261,213 @@ class ImageTransforms(Transform):
 
     def forward(self, *inputs: Any) -> Any:
         return self.tf(*inputs)
+
+
+def _uniform(low: float, high: float, n: int, device: torch.device) -> torch.Tensor:
+    return torch.empty(n, device=device).uniform_(low, high)
+
+
+def _per_sample(values: torch.Tensor, x: torch.Tensor) -> torch.Tensor:
+    """Reshape per-sample `values` of shape (B,) to broadcast over `x` of shape (B, N, C, H, W)."""
+    return values.view(-1, *([1] * (x.ndim - 1)))
+
+
+def _blend(x: torch.Tensor, degenerate: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    factor = _per_sample(factor, x)
+    return (factor * x + (1.0 - factor) * degenerate).clamp(0.0, 1.0)
+
+
+def _adjust_hue(x: torch.Tensor, hue_factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_hue` with a hue factor per sample, through a round trip in the HSV space."""
+    if x.shape[-3] == 1:
+        return x
+
+    r, g, b = x.unbind(dim=-3)
+    maxc = x.amax(dim=-3)
+    delta = maxc - x.amin(dim=-3)
+    safe_delta = torch.where(delta > 0, delta, torch.ones_like(delta))
+    saturation = delta / torch.where(maxc > 0, maxc, torch.ones_like(maxc))
+    hue = torch.where(
+        maxc == r,
+        (g - b) / safe_delta,
+        torch.where(maxc == g, (b - r) / safe_delta + 2.0, (r - g) / safe_delta + 4.0),
+    )
+    hue = torch.where(delta > 0, hue, torch.zeros_like(hue))
+    hue = (hue / 6.0 + _per_sample(hue_factor, hue)).remainder(1.0)
+
+    # HSV to RGB: channel n is v - v * s * clamp(min(k, 4 - k), 0, 1) with k = (n + 6h) mod 6, n in (5, 3, 1)
+    offsets = torch.tensor([5.0, 3.0, 1.0], device=x.device, dtype=x.dtype).view(3, 1, 1)
+    k = (offsets + hue.unsqueeze(-3) * 6.0).remainder(6.0)
+    value = maxc.unsqueeze(-3)
+    return value - value * saturation.unsqueeze(-3) * torch.minimum(k, 4.0 - k).clamp(0.0, 1.0)
+
+
+class _BatchedColorJitter:
+    """Batched `v2.ColorJitter`. The order of the adjustments is drawn once per batch."""
+
+    def __init__(self, transform: v2.ColorJitter):
+        self.brightness = transform.brightness
+        self.contrast = transform.contrast
+        self.saturation = transform.saturation
+        self.hue = transform.hue
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        b = x.shape[0]
+        for fn_idx in torch.randperm(4).tolist():
+            if fn_idx == 0 and self.brightness is not None:
+                x = _blend(x, torch.zeros_like(x), _uniform(*self.brightness, b, x.device))
+            elif fn_idx == 1 and self.contrast is not None:
+                x = _blend(x, F.adjust_contrast(x, 0.0), _uniform(*self.contrast, b, x.device))
+            elif fn_idx == 2 and self.saturation is not None:
+                x = _blend(x, F.adjust_saturation(x, 0.0), _uniform(*self.saturation, b, x.device))
+            elif fn_idx == 3 and self.hue is not None:
+                x = _adjust_hue(x, _uniform(*self.hue, b, x.device))
+        return x
+
+
+class _BatchedSharpnessJitter:
+    """Batched `SharpnessJitter`, blending every sample with the blurred batch with its own factor."""
+
+    def __init__(self, transform: SharpnessJitter):
+        self.sharpness = transform.sharpness
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        # F.adjust_sharpness blends the image with its blurred version, which is what it returns for a factor of 0
+        return _blend(x, F.adjust_sharpness(x, 0.0), _uniform(*self.sharpness, x.shape[0], x.device))
+
+
+class _BatchedRandomAffine:
+    """Batched `v2.RandomAffine`, sampling every image of the batch with its own affine grid."""
+
+    def __init__(self, transform: v2.RandomAffine):
+        self.degrees = transform.degrees
+        self.translate = transform.translate
+        self.scale = transform.scale
+        self.shear = transform.shear
+        self.mode = transform.interpolation.value
+
+    @staticmethod
+    def is_supported(transform: v2.RandomAffine) -> bool:
+        return (
+            transform.center is None
+            and transform.fill in (None, 0)
+            and transform.interpolation in (InterpolationMode.NEAREST, InterpolationMode.BILINEAR)
+        )
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        b, height, width = x.shape[0], x.shape[-2], x.shape[-1]
+        device = x.device
+
+        angle = torch.deg2rad(_uniform(*self.degrees, b, device))
+        tx = torch.zeros(b, device=device)
+        ty = torch.zeros(b, device=device)
+        if self.translate is not None:
+            max_dx, max_dy = self.translate[0] * width, self.translate[1] * height
+            tx = _uniform(-max_dx, max_dx, b, device).round()
+            ty = _uniform(-max_dy, max_dy, b, device).round()
+        scale = _uniform(*self.scale, b, device) if self.scale is not None else torch.ones(b, device=device)
+        shear_x = torch.zeros(b, device=device)
+        shear_y = torch.zeros(b, device=device)
+        if self.shear is not None:
+            shear_x = torch.deg2rad(_uniform(self.shear[0], self.shear[1], b, device))
+            if len(self.shear) == 4:
+                shear_y = torch.deg2rad(_uniform(self.shear[2], self.shear[3], b, device))
+
+        # Inverse of the affine matrix around the image center, as computed by F.affine
+        cos_y = torch.cos(shear_y)
+        a = torch.cos(angle - shear_y) / cos_y
+        b_ = -torch.cos(angle - shear_y) * torch.tan(shear_x) / cos_y - torch.sin(angle)
+        c = torch.sin(angle - shear_y) / cos_y
+        d = -torch.sin(angle - shear_y) * torch.tan(shear_x) / cos_y + torch.cos(angle)
+        m00, m01, m10, m11 = d / scale, -b_ / scale, -c / scale, a / scale
+        m02 = -(m00 * tx + m01 * ty)
+        m12 = -(m10 * tx + m11 * ty)
+        theta = torch.stack([m00, m01, m02, m10, m11, m12], dim=-1).view(b, 2, 3)
+
+        # Grid of the pixel centers, in pixels from the image center, mapped to normalized coordinates
+        xs = torch.linspace(-width * 0.5 + 0.5, width * 0.5 - 0.5, width, device=device)
+        ys = torch.linspace(-height * 0.5 + 0.5, height * 0.5 - 0.5, height, device=device)
+        base_grid = torch.stack(
+            [
+                xs.expand(height, width),
+                ys.unsqueeze(-1).expand(height, width),
+                torch.ones(height, width, device=device),
+            ],
+            dim=-1,
+        )
+        grid = base_grid.view(1, -1, 3) @ theta.transpose(1, 2)
+        grid = (grid / torch.tensor([0.5 * width, 0.5 * height], device=device)).view(b, height, width, 2)
+
+        # The frames and channels of a sample share its grid
+        images = x.reshape(b, -1, height, width)
+        out = nnF.grid_sample(
+            images, grid.to(images.dtype), mode=self.mode, padding_mode="zeros", align_corners=False
+        )
+        return out.view_as(x)
+
+
+class _PerSampleTransform:
+    """Fallback for transforms without a batched counterpart, applied to each sample in turn."""
+
+    def __init__(self, transform: Callable):
+        self.transform = transform
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        return torch.stack([self.transform(sample) for sample in x])
+
+
+def make_batched_transform(transform: Callable) -> Callable[[torch.Tensor], torch.Tensor]:
+    """Batched counterpart of a transform built by `make_transform_from_config`. It takes a (B, N, C, H, W)
+    tensor and draws random parameters per sample, shared by its N frames."""
+    if isinstance(transform, v2.Identity):
+        return lambda x: x
+    if isinstance(transform, v2.ColorJitter):
+        return _BatchedColorJitter(transform)
+    if isinstance(transform, SharpnessJitter):
+        return _BatchedSharpnessJitter(transform)
+    if isinstance(transform, v2.RandomAffine) and _BatchedRandomAffine.is_supported(transform):
+        return _BatchedRandomAffine(transform)
+    return _PerSampleTransform(transform)
+
+
+class BatchedImageTransforms(torch.nn.Module):
+    """Batched counterpart of `ImageTransforms`, to augment collated batches on the training device.
+
+    Each sample of a (B, ..., C, H, W) batch gets its own random subset of transforms, as `RandomSubsetApply`
+    would draw it, and its own random parameters, all drawn in one shot for the batch. As with `ImageTransforms`
+    called on a sample, the leading dimensions of a sample (e.g. the frames of a temporal window) share them.
+    Images are expected to be floating point in [0, 1].
+    """
+
+    def __init__(self, cfg: ImageTransformsConfig) -> None:
+        super().__init__()
+        image_transforms = ImageTransforms(cfg)
+        self.enabled = isinstance(image_transforms.tf, RandomSubsetApply)
+        self.transforms = [make_batched_transform(tf) for tf in image_transforms.transforms.values()]
+        self.register_buffer(
+            "p", torch.tensor(image_transforms.weights, dtype=torch.float32), persistent=False
+        )
+        if self.enabled:
+            self.n_subset = image_transforms.tf.n_subset
+            self.random_order = image_transforms.tf.random_order
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        if not self.enabled:
+            return images
+
+        b = images.shape[0]
+        x = images.reshape(b, -1, *images.shape[-3:])
+
+        selected = torch.multinomial(self.p.to(x.device).expand(b, -1), self.n_subset)
+        if not self.random_order:
+            selected = selected.sort(dim=1).values
+
+        # Apply the k-th selected transform of every sample, one batched call per transform
+        for k in range(self.n_subset):
+            for tf_idx, transform in enumerate(self.transforms):
+                sample_indices = (selected[:, k] == tf_idx).nonzero().squeeze(1)
+                if sample_indices.numel() == 0:
+                    continue
+                x = x.index_copy(0, sample_indices, transform(x[sample_indices]))
+
+        return x.view_as(images)
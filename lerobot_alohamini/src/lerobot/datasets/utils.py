@@ -19,6 +19,7 @@ import json
 import logging
 from collections import deque
 from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from pprint import pformat
 from typing import Any, Generic, TypeVar
@@ -53,6 +54,8 @@ DEFAULT_VIDEO_FILE_SIZE_IN_MB = 200  # Max size per file
 
 INFO_PATH = "meta/info.json"
 STATS_PATH = "meta/stats.json"
+# Episodes saved by a recording session since info.json and stats.json were last written
+SESSION_JOURNAL_PATH = "meta/session_journal.jsonl"
 
 EPISODES_DIR = "meta/episodes"
 DATA_DIR = "data"
@@ -312,6 +315,41 @@ def write_stats(stats: dict, local_dir: Path) -> None:
     write_json(serialized_stats, local_dir / STATS_PATH)
 
 
+def append_session_journal(local_dir: Path, entry: dict) -> None:
+    """Append an entry to the session journal, serializing its numpy arrays.
+
+    Args:
+        local_dir (Path): The root directory of the dataset.
+        entry (dict): The entry, e.g. the length and stats of a saved episode.
+    """
+    fpath = local_dir / SESSION_JOURNAL_PATH
+    fpath.parent.mkdir(exist_ok=True, parents=True)
+    with open(fpath, "a") as f:
+        f.write(json.dumps(serialize_dict(entry)) + "\n")
+
+
+def load_session_journal(local_dir: Path) -> list[dict]:
+    """Load the entries of the session journal, skipping a last line truncated by a crash.
+
+    Args:
+        local_dir (Path): The root directory of the dataset.
+
+    Returns:
+        The list of entries, empty if there is no journal.
+    """
+    fpath = local_dir / SESSION_JOURNAL_PATH
+    if not fpath.exists():
+        return []
+    entries = []
+    with open(fpath) as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return entries
+
+
 def cast_stats_to_numpy(stats: dict) -> dict[str, dict[str, np.ndarray]]:
     """Recursively cast numerical values in a stats dictionary to numpy arrays.
 
@@ -384,6 +422,58 @@ def load_episodes(local_dir: Path) -> datasets.Dataset:
     return episodes
 
 
+@dataclass
+class EpisodeIndex:
+    """Columnar view of the episodes metadata, for the lookups done on every sample.
+
+    The columns of the `episodes` dataset are read once into NumPy arrays indexed by episode index, so that
+    finding the episode of a frame, its bounds and the video file and timestamp offset of each camera is plain
+    array indexing instead of a row access on an Arrow table. It holds only small arrays and is thus cheap to
+    pickle into DataLoader workers.
+    """
+
+    dataset_from_index: np.ndarray
+    dataset_to_index: np.ndarray
+    video_chunk_index: dict[str, np.ndarray]
+    video_file_index: dict[str, np.ndarray]
+    video_from_timestamp: dict[str, np.ndarray]
+
+    @classmethod
+    def from_episodes(cls, episodes: datasets.Dataset, video_keys: list[str]) -> "EpisodeIndex":
+        columns = episodes.with_format("numpy")
+        return cls(
+            dataset_from_index=np.asarray(columns["dataset_from_index"], dtype=np.int64),
+            dataset_to_index=np.asarray(columns["dataset_to_index"], dtype=np.int64),
+            video_chunk_index={
+                key: np.asarray(columns[f"videos/{key}/chunk_index"], dtype=np.int64) for key in video_keys
+            },
+            video_file_index={
+                key: np.asarray(columns[f"videos/{key}/file_index"], dtype=np.int64) for key in video_keys
+            },
+            video_from_timestamp={
+                key: np.asarray(columns[f"videos/{key}/from_timestamp"], dtype=np.float64)
+                for key in video_keys
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.dataset_from_index)
+
+    def episode_of(self, frame_index: int | np.ndarray) -> int | np.ndarray:
+        """Episode index of the frame(s) with the given absolute index, episodes being stored contiguously."""
+        episode_index = np.searchsorted(self.dataset_to_index, frame_index, side="right")
+        return int(episode_index) if np.ndim(episode_index) == 0 else episode_index
+
+
+def build_absolute_to_relative_index(absolute_indices: np.ndarray) -> np.ndarray:
+    """Lookup table mapping the absolute index of a loaded frame to its row in a dataset holding a subset of
+    the episodes. Frames that are not loaded map to -1."""
+    absolute_indices = np.asarray(absolute_indices, dtype=np.int64)
+    table = np.full(int(absolute_indices.max()) + 1 if len(absolute_indices) else 0, -1, dtype=np.int64)
+    table[absolute_indices] = np.arange(len(absolute_indices))
+    return table
+
+
 def load_image_as_numpy(
     fpath: str | Path, dtype: np.dtype = np.float32, channel_first: bool = True
 ) -> np.ndarray:
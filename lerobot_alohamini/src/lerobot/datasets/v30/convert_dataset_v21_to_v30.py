@@ -40,11 +40,20 @@ python src/lerobot/datasets/v30/convert_dataset_v21_to_v30.py \
     --push-to-hub=false
 ```
 
+Data files of each chunk and video files of each camera are concatenated in parallel by a pool of processes
+(see `--num-workers`). The converted files are recorded in a manifest as they are written, so that a conversion
+that was interrupted resumes where it left off when it is run again with the same arguments.
+
 """
 
 import argparse
+import json
 import logging
+import multiprocessing as mp
+import os
 import shutil
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -86,6 +95,8 @@ from lerobot.utils.utils import init_logging
 V21 = "v2.1"
 V30 = "v3.0"
 
+CONVERSION_MANIFEST_PATH = "conversion_manifest.json"
+
 """
 -------------------------
 OLD
@@ -195,7 +206,101 @@ def concat_data_files(paths_to_cat, new_root, chunk_idx, file_idx, image_keys):
     concatenated_df.to_parquet(path, index=False, schema=schema)
 
 
-def convert_data(root: Path, new_root: Path, data_file_size_in_mb: int):
+class ConversionManifest:
+    """Output files already written by a conversion, stored in the directory of the converted dataset.
+
+    Args:
+        new_root: Directory of the converted dataset.
+        settings: Arguments of the conversion the files were written with. Files written with other settings
+            can't be reused.
+    """
+
+    def __init__(self, new_root: Path, settings: dict):
+        self.path = new_root / CONVERSION_MANIFEST_PATH
+        self.settings = settings
+        self.completed: set[str] = set()
+
+    @classmethod
+    def load(cls, new_root: Path, settings: dict) -> "ConversionManifest | None":
+        """Load the manifest of an interrupted conversion, or return None if it can't be resumed."""
+        path = new_root / CONVERSION_MANIFEST_PATH
+        if not path.exists():
+            return None
+        with open(path) as f:
+            content = json.load(f)
+        if content["settings"] != settings:
+            logging.warning(f"Conversion in {new_root} was run with other settings ({content['settings']}).")
+            return None
+        manifest = cls(new_root, settings)
+        manifest.completed = set(content["completed"])
+        return manifest
+
+    def mark_completed(self, job_id: str) -> None:
+        self.completed.add(job_id)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, an interruption must not leave a truncated manifest behind
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"settings": self.settings, "completed": sorted(self.completed)}, f, indent=4)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+# (id, function, arguments) of a job writing one output file, its id is the path of the file in the new dataset
+ConversionJob = tuple[str, Callable, tuple]
+
+
+def run_conversion_jobs(
+    jobs: list[ConversionJob], manifest: ConversionManifest, num_workers: int | None = None
+) -> None:
+    """Run the jobs that are not completed yet according to `manifest`, and record them as they complete.
+
+    Args:
+        jobs: Jobs to run, they must be independent from each other.
+        manifest: Manifest of the conversion.
+        num_workers: Number of processes running the jobs. Defaults to the number of CPUs, 0 runs them in the
+            current process.
+    """
+    jobs = [job for job in jobs if job[0] not in manifest.completed]
+    if len(jobs) == 0:
+        return
+
+    logging.info(f"Writing {len(jobs)} files, {len(manifest.completed)} were already written")
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, len(jobs))
+
+    if num_workers <= 1:
+        for job_id, fn, args in tqdm.tqdm(jobs, desc="convert files"):
+            fn(*args)
+            manifest.mark_completed(job_id)
+        return
+
+    error = None
+    # Spawn rather than fork, the codecs are not fork safe
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp.get_context("spawn")) as executor:
+        futures = {executor.submit(fn, *args): job_id for job_id, fn, args in jobs}
+        for future in tqdm.tqdm(as_completed(futures), total=len(futures), desc="convert files"):
+            # Keep recording the other jobs, so that they are not run again when resuming
+            if future.exception() is not None:
+                logging.error(f"Failed to write {futures[future]}: {future.exception()}")
+                error = error or future.exception()
+                continue
+            manifest.mark_completed(futures[future])
+
+    if error is not None:
+        raise error
+
+
+def plan_data_conversion(
+    root: Path, new_root: Path, data_file_size_in_mb: int
+) -> tuple[list[dict], list[ConversionJob]]:
+    """Assign the episodes data files to the new data files.
+
+    Returns:
+        The data metadata of each episode, and the jobs concatenating the data files.
+    """
     data_dir = root / "data"
     ep_paths = sorted(data_dir.glob("*/*.parquet"))
 
@@ -208,10 +313,15 @@ def convert_data(root: Path, new_root: Path, data_file_size_in_mb: int):
     num_frames = 0
     paths_to_cat = []
     episodes_metadata = []
+    jobs = []
+
+    def add_job(paths_to_cat, chunk_idx, file_idx):
+        job_id = DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+        jobs.append((job_id, concat_data_files, (paths_to_cat, new_root, chunk_idx, file_idx, image_keys)))
 
     logging.info(f"Converting data files from {len(ep_paths)} episodes")
 
-    for ep_path in tqdm.tqdm(ep_paths, desc="convert data files"):
+    for ep_path in tqdm.tqdm(ep_paths, desc="plan data files"):
         ep_size_in_mb = get_parquet_file_size_in_mb(ep_path)
         ep_num_frames = get_parquet_num_frames(ep_path)
         ep_metadata = {
@@ -231,7 +341,7 @@ def convert_data(root: Path, new_root: Path, data_file_size_in_mb: int):
             continue
 
         if paths_to_cat:
-            concat_data_files(paths_to_cat, new_root, chunk_idx, file_idx, image_keys)
+            add_job(paths_to_cat, chunk_idx, file_idx)
 
         # Reset for the next file
         size_in_mb = ep_size_in_mb
@@ -241,9 +351,9 @@ def convert_data(root: Path, new_root: Path, data_file_size_in_mb: int):
 
     # Write remaining data if any
     if paths_to_cat:
-        concat_data_files(paths_to_cat, new_root, chunk_idx, file_idx, image_keys)
+        add_job(paths_to_cat, chunk_idx, file_idx)
 
-    return episodes_metadata
+    return episodes_metadata, jobs
 
 
 def get_video_keys(root):
@@ -260,19 +370,31 @@ def get_image_keys(root):
     return image_keys
 
 
-def convert_videos(root: Path, new_root: Path, video_file_size_in_mb: int):
+def plan_videos_conversion(
+    root: Path, new_root: Path, video_file_size_in_mb: int
+) -> tuple[list[dict] | None, list[ConversionJob]]:
+    """Assign the episodes video files of every camera to the new video files.
+
+    Returns:
+        The video metadata of each episode (None if the dataset has no videos), and the jobs concatenating the
+        video files of all cameras.
+    """
     logging.info(f"Converting videos from {root} to {new_root}")
 
     video_keys = get_video_keys(root)
     if len(video_keys) == 0:
-        return None
+        return None, []
 
     video_keys = sorted(video_keys)
 
     eps_metadata_per_cam = []
+    jobs = []
     for camera in video_keys:
-        eps_metadata = convert_videos_of_camera(root, new_root, camera, video_file_size_in_mb)
+        eps_metadata, camera_jobs = plan_videos_of_camera_conversion(
+            root, new_root, camera, video_file_size_in_mb
+        )
         eps_metadata_per_cam.append(eps_metadata)
+        jobs.extend(camera_jobs)
 
     num_eps_per_cam = [len(eps_cam_map) for eps_cam_map in eps_metadata_per_cam]
     if len(set(num_eps_per_cam)) != 1:
@@ -281,7 +403,7 @@ def convert_videos(root: Path, new_root: Path, video_file_size_in_mb: int):
     episods_metadata = []
     num_cameras = len(video_keys)
     num_episodes = num_eps_per_cam[0]
-    for ep_idx in tqdm.tqdm(range(num_episodes), desc="convert videos"):
+    for ep_idx in range(num_episodes):
         # Sanity check
         ep_ids = [eps_metadata_per_cam[cam_idx][ep_idx]["episode_index"] for cam_idx in range(num_cameras)]
         ep_ids += [ep_idx]
@@ -293,10 +415,12 @@ def convert_videos(root: Path, new_root: Path, video_file_size_in_mb: int):
             ep_dict.update(eps_metadata_per_cam[cam_idx][ep_idx])
         episods_metadata.append(ep_dict)
 
-    return episods_metadata
+    return episods_metadata, jobs
 
 
-def convert_videos_of_camera(root: Path, new_root: Path, video_key: str, video_file_size_in_mb: int):
+def plan_videos_of_camera_conversion(
+    root: Path, new_root: Path, video_key: str, video_file_size_in_mb: int
+) -> tuple[list[dict], list[ConversionJob]]:
     # Access old paths to mp4
     videos_dir = root / "videos"
     ep_paths = sorted(videos_dir.glob(f"*/{video_key}/*.mp4"))
@@ -308,25 +432,26 @@ def convert_videos_of_camera(root: Path, new_root: Path, video_key: str, video_f
     duration_in_s = 0.0
     paths_to_cat = []
     episodes_metadata = []
+    jobs = []
+
+    def add_job(paths_to_cat, chunk_idx, file_idx):
+        job_id = DEFAULT_VIDEO_PATH.format(video_key=video_key, chunk_index=chunk_idx, file_index=file_idx)
+        jobs.append((job_id, concatenate_video_files, (paths_to_cat, new_root / job_id)))
 
-    for ep_path in tqdm.tqdm(ep_paths, desc=f"convert videos of {video_key}"):
+        # Update episodes metadata for the file
+        for i, _ in enumerate(paths_to_cat):
+            past_ep_idx = ep_idx - len(paths_to_cat) + i
+            episodes_metadata[past_ep_idx][f"videos/{video_key}/chunk_index"] = chunk_idx
+            episodes_metadata[past_ep_idx][f"videos/{video_key}/file_index"] = file_idx
+
+    for ep_path in tqdm.tqdm(ep_paths, desc=f"plan videos of {video_key}"):
         ep_size_in_mb = get_file_size_in_mb(ep_path)
         ep_duration_in_s = get_video_duration_in_s(ep_path)
 
         # Check if adding this episode would exceed the limit
         if size_in_mb + ep_size_in_mb >= video_file_size_in_mb and len(paths_to_cat) > 0:
             # Size limit would be exceeded, save current accumulation WITHOUT this episode
-            concatenate_video_files(
-                paths_to_cat,
-                new_root
-                / DEFAULT_VIDEO_PATH.format(video_key=video_key, chunk_index=chunk_idx, file_index=file_idx),
-            )
-
-            # Update episodes metadata for the file we just saved
-            for i, _ in enumerate(paths_to_cat):
-                past_ep_idx = ep_idx - len(paths_to_cat) + i
-                episodes_metadata[past_ep_idx][f"videos/{video_key}/chunk_index"] = chunk_idx
-                episodes_metadata[past_ep_idx][f"videos/{video_key}/file_index"] = file_idx
+            add_job(paths_to_cat, chunk_idx, file_idx)
 
             # Move to next file and start fresh with current episode
             chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, DEFAULT_CHUNK_SIZE)
@@ -337,8 +462,8 @@ def convert_videos_of_camera(root: Path, new_root: Path, video_key: str, video_f
         # Add current episode metadata
         ep_metadata = {
             "episode_index": ep_idx,
-            f"videos/{video_key}/chunk_index": chunk_idx,  # Will be updated when file is saved
-            f"videos/{video_key}/file_index": file_idx,  # Will be updated when file is saved
+            f"videos/{video_key}/chunk_index": chunk_idx,  # Will be updated when file is planned
+            f"videos/{video_key}/file_index": file_idx,  # Will be updated when file is planned
             f"videos/{video_key}/from_timestamp": duration_in_s,
             f"videos/{video_key}/to_timestamp": duration_in_s + ep_duration_in_s,
         }
@@ -352,19 +477,9 @@ def convert_videos_of_camera(root: Path, new_root: Path, video_key: str, video_f
 
     # Write remaining videos if any
     if paths_to_cat:
-        concatenate_video_files(
-            paths_to_cat,
-            new_root
-            / DEFAULT_VIDEO_PATH.format(video_key=video_key, chunk_index=chunk_idx, file_index=file_idx),
-        )
+        add_job(paths_to_cat, chunk_idx, file_idx)
 
-        # Update episodes metadata for the final file
-        for i, _ in enumerate(paths_to_cat):
-            past_ep_idx = ep_idx - len(paths_to_cat) + i
-            episodes_metadata[past_ep_idx][f"videos/{video_key}/chunk_index"] = chunk_idx
-            episodes_metadata[past_ep_idx][f"videos/{video_key}/file_index"] = file_idx
-
-    return episodes_metadata
+    return episodes_metadata, jobs
 
 
 def generate_episode_metadata_dict(
@@ -452,6 +567,7 @@ def convert_dataset(
     root: str | Path | None = None,
     push_to_hub: bool = True,
     force_conversion: bool = False,
+    num_workers: int | None = None,
 ):
     if data_file_size_in_mb is None:
         data_file_size_in_mb = DEFAULT_DATA_FILE_SIZE_IN_MB
@@ -483,9 +599,6 @@ def convert_dataset(
         shutil.rmtree(str(root))
         shutil.move(str(old_root), str(root))
 
-    if new_root.is_dir():
-        shutil.rmtree(new_root)
-
     if not use_local_dataset:
         snapshot_download(
             repo_id,
@@ -494,11 +607,27 @@ def convert_dataset(
             local_dir=root,
         )
 
+    # Resume an interrupted conversion if its files were written with the same settings
+    settings = {
+        "total_episodes": load_info(root)["total_episodes"],
+        "data_file_size_in_mb": data_file_size_in_mb,
+        "video_file_size_in_mb": video_file_size_in_mb,
+    }
+    manifest = ConversionManifest.load(new_root, settings)
+    if manifest is None:
+        if new_root.is_dir():
+            shutil.rmtree(new_root)
+        manifest = ConversionManifest(new_root, settings)
+    else:
+        print(f"Resuming conversion in {new_root}, {len(manifest.completed)} files were already converted")
+
     convert_info(root, new_root, data_file_size_in_mb, video_file_size_in_mb)
     convert_tasks(root, new_root)
-    episodes_metadata = convert_data(root, new_root, data_file_size_in_mb)
-    episodes_videos_metadata = convert_videos(root, new_root, video_file_size_in_mb)
+    episodes_metadata, data_jobs = plan_data_conversion(root, new_root, data_file_size_in_mb)
+    episodes_videos_metadata, video_jobs = plan_videos_conversion(root, new_root, video_file_size_in_mb)
+    run_conversion_jobs(data_jobs + video_jobs, manifest, num_workers)
     convert_episodes_metadata(root, new_root, episodes_metadata, episodes_videos_metadata)
+    manifest.remove()
 
     shutil.move(str(root), str(old_root))
     shutil.move(str(new_root), str(root))
@@ -566,6 +695,13 @@ if __name__ == "__main__":
         action="store_true",
         help="Force conversion even if the dataset already has a v3.0 version.",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=None,
+        help="Number of processes concatenating the data and video files. Defaults to the number of CPUs, "
+        "0 converts them in the main process.",
+    )
 
     args = parser.parse_args()
     convert_dataset(**vars(args))
@@ -300,6 +300,45 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+def get_video_pix_fmt(vcodec: str, pix_fmt: str) -> str:
+    """Pixel format actually used by `encode_video_frames` when asked to encode `pix_fmt` with `vcodec`."""
+    # Encoders/pixel formats incompatibility check
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        return "yuv420p"
+    return pix_fmt
+
+
+def get_video_encoding_options(
+    vcodec: str,
+    g: int | None = 2,
+    crf: int | None = 30,
+    fast_decode: int = 0,
+    preset: int | None = None,
+) -> dict[str, str]:
+    """Codec options of `encode_video_frames`, shared with the tools re-encoding parts of a video so that the
+    re-encoded frames match the rest of it."""
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    if vcodec == "libsvtav1":
+        video_options["preset"] = str(preset) if preset is not None else "12"
+
+    return video_options
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -327,12 +366,7 @@ def encode_video_frames(
 
     video_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
+    pix_fmt = get_video_pix_fmt(vcodec, pix_fmt)
 
     # Get input frames
     template = "frame-" + ("[0-9]" * 6) + ".png"
@@ -346,22 +380,7 @@ def encode_video_frames(
     with Image.open(input_list[0]) as dummy_image:
         width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
-    if vcodec == "libsvtav1":
-        video_options["preset"] = str(preset) if preset is not None else "12"
+    video_options = get_video_encoding_options(vcodec, g=g, crf=crf, fast_decode=fast_decode, preset=preset)
 
     # Set logging level
     if log_level is not None:
@@ -85,6 +85,13 @@ class ACTConfig(PreTrainedConfig):
             ensembling. Defaults to None which means temporal ensembling is not used. `n_action_steps` must be
             1 when using this feature, as inference needs to happen at every step to form an ensemble. For
             more information on how ensembling works, please see `ACTTemporalEnsembler`.
+        async_prefetch_low_water_mark: Number of queued actions at which `select_action` starts predicting the
+            next chunk in a background thread, from the latest observation. When it arrives, the chunk is
+            aligned with the steps executed meanwhile and replaces the rest of the queue, so that the control
+            loop doesn't stall on inference as long as the prediction takes less than this many steps.
+            Defaults to None, which predicts the next chunk synchronously once the queue is empty.
+        async_prefetch_blend_steps: Number of steps over which the queued actions are linearly cross-faded
+            into the prefetched chunk, to smooth the transition between chunks.
         dropout: Dropout to use in the transformer layers (see code for details).
         kl_weight: The weight to use for the KL-divergence component of the loss if the variational objective
             is enabled. Loss is then calculated as: `reconstruction_loss + kl_weight * kld_loss`.
@@ -127,6 +134,8 @@ class ACTConfig(PreTrainedConfig):
     # Inference.
     # Note: the value used in ACT when temporal ensembling is enabled is 0.01.
     temporal_ensemble_coeff: float | None = None
+    async_prefetch_low_water_mark: int | None = None
+    async_prefetch_blend_steps: int = 0
 
     # Training and loss computation.
     dropout: float = 0.1
@@ -150,6 +159,18 @@ class ACTConfig(PreTrainedConfig):
                 "`n_action_steps` must be 1 when using temporal ensembling. This is "
                 "because the policy needs to be queried every step to compute the ensembled action."
             )
+        if self.async_prefetch_low_water_mark is not None and not (
+            0 < self.async_prefetch_low_water_mark < self.n_action_steps
+        ):
+            raise ValueError(
+                "`async_prefetch_low_water_mark` must be positive and smaller than `n_action_steps`. Got "
+                f"{self.async_prefetch_low_water_mark} for `async_prefetch_low_water_mark` and "
+                f"{self.n_action_steps} for `n_action_steps`."
+            )
+        if self.async_prefetch_blend_steps < 0:
+            raise ValueError(
+                f"`async_prefetch_blend_steps` must be non-negative. Got {self.async_prefetch_blend_steps}."
+            )
         if self.n_action_steps > self.chunk_size:
             raise ValueError(
                 f"The chunk size is the upper bound for the number of action steps per model invocation. Got "
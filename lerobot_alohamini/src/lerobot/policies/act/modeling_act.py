@@ -19,9 +19,12 @@ As per Learning Fine-Grained Bimanual Manipulation with Low-Cost Hardware (https
 The majority of changes here involve removing unused code, unifying naming, and adding helpful comments.
 """
 
+import logging
 import math
 from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from itertools import chain
 
 import einops
@@ -65,6 +68,9 @@ class ACTPolicy(PreTrainedPolicy):
         if config.temporal_ensemble_coeff is not None:
             self.temporal_ensembler = ACTTemporalEnsembler(config.temporal_ensemble_coeff, config.chunk_size)
 
+        # Created on first use, only when `async_prefetch_low_water_mark` is set
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+
         self.reset()
 
     def get_optim_params(self) -> dict:
@@ -94,6 +100,19 @@ class ACTPolicy(PreTrainedPolicy):
             self.temporal_ensembler.reset()
         else:
             self._action_queue = deque([], maxlen=self.config.n_action_steps)
+        if self._prefetch_executor is not None:
+            # Wait for a chunk still being prefetched for the previous episode, which is dropped
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+        self._prefetch: tuple[Future, int] | None = None
+        self._num_steps = 0
+
+    def __getstate__(self) -> dict:
+        # The prefetch thread and its pending chunk can't be copied nor pickled, copies start without them
+        state = self.__dict__.copy()
+        state["_prefetch_executor"] = None
+        state["_prefetch"] = None
+        return state
 
     @torch.no_grad()
     def select_action(self, batch: dict[str, Tensor]) -> Tensor:
@@ -110,6 +129,9 @@ class ACTPolicy(PreTrainedPolicy):
             action = self.temporal_ensembler.update(actions)
             return action
 
+        if self.config.async_prefetch_low_water_mark is not None:
+            return self._select_action_with_prefetch(batch)
+
         # Action queue logic for n_action_steps > 1. When the action_queue is depleted, populate it by
         # querying the policy.
         if len(self._action_queue) == 0:
@@ -120,6 +142,83 @@ class ACTPolicy(PreTrainedPolicy):
             self._action_queue.extend(actions.transpose(0, 1))
         return self._action_queue.popleft()
 
+    def _select_action_with_prefetch(self, batch: dict[str, Tensor]) -> Tensor:
+        """Action queue logic when `async_prefetch_low_water_mark` is set.
+
+        The next chunk is predicted in a background thread as soon as the queue runs low, and merged into the
+        queue once available. The caller only waits for the model on the first step, or if the prediction
+        takes longer than the remaining queued actions.
+        """
+        if self._prefetch is not None and (self._prefetch[0].done() or len(self._action_queue) == 0):
+            self._merge_prefetched_chunk()
+
+        if len(self._action_queue) == 0:
+            actions = self.predict_action_chunk(batch)[:, : self.config.n_action_steps]
+            self._action_queue.extend(actions.transpose(0, 1))
+
+        if self._prefetch is None and len(self._action_queue) <= self.config.async_prefetch_low_water_mark:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="act_prefetch")
+            # The batch is read from the background thread, the caller must not modify its tensors in place
+            future = self._prefetch_executor.submit(
+                self._predict_action_chunk_in_modes, dict(batch), self._current_grad_modes()
+            )
+            self._prefetch = (future, self._num_steps)
+
+        self._num_steps += 1
+        return self._action_queue.popleft()
+
+    def _current_grad_modes(self) -> tuple[bool, bool, bool, torch.dtype | None]:
+        """Grad, inference and autocast modes of the calling thread. They are thread local, the prefetch thread
+        doesn't inherit them."""
+        device_type = next(self.parameters()).device.type
+        if hasattr(torch, "get_autocast_dtype"):  # torch >= 2.4
+            autocast = (torch.is_autocast_enabled(device_type), torch.get_autocast_dtype(device_type))
+        elif device_type == "cuda":
+            autocast = (torch.is_autocast_enabled(), torch.get_autocast_gpu_dtype())
+        elif device_type == "cpu":
+            autocast = (torch.is_autocast_cpu_enabled(), torch.get_autocast_cpu_dtype())
+        else:
+            autocast = (False, None)
+        return (torch.is_grad_enabled(), torch.is_inference_mode_enabled(), *autocast)
+
+    def _predict_action_chunk_in_modes(
+        self, batch: dict[str, Tensor], modes: tuple[bool, bool, bool, torch.dtype | None]
+    ) -> Tensor:
+        """`predict_action_chunk` run from the prefetch thread in the modes captured by `_current_grad_modes`."""
+        grad_enabled, inference_mode, autocast_enabled, autocast_dtype = modes
+        with ExitStack() as stack:
+            stack.enter_context(torch.inference_mode(inference_mode))
+            stack.enter_context(torch.set_grad_enabled(grad_enabled))
+            if autocast_enabled:
+                device_type = next(self.parameters()).device.type
+                stack.enter_context(torch.autocast(device_type=device_type, dtype=autocast_dtype))
+            return self.predict_action_chunk(batch)
+
+    def _merge_prefetched_chunk(self):
+        """Replace the queued actions with the prefetched chunk, time-aligned with the steps executed since its
+        observation, and cross-faded over `async_prefetch_blend_steps` steps."""
+        future, observation_step = self._prefetch
+        self._prefetch = None
+        chunk = future.result()
+
+        # The first actions of the chunk were meant for the steps executed while it was being predicted
+        num_elapsed = self._num_steps - observation_step
+        new_actions = list(chunk[:, num_elapsed : num_elapsed + self.config.n_action_steps].transpose(0, 1))
+        if len(new_actions) == 0:
+            logging.warning(
+                f"Prefetched action chunk arrived {num_elapsed} steps after its observation, which is more than "
+                f"the chunk size ({self.config.chunk_size}). Consider raising `async_prefetch_low_water_mark`."
+            )
+            return
+
+        num_blend = min(self.config.async_prefetch_blend_steps, len(self._action_queue), len(new_actions))
+        for i in range(num_blend):
+            weight = (i + 1) / (num_blend + 1)
+            new_actions[i] = torch.lerp(self._action_queue[i], new_actions[i], weight)
+        self._action_queue.clear()
+        self._action_queue.extend(new_actions)
+
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
         """Predict a chunk of actions given environment observations."""
@@ -203,52 +302,62 @@ class ACTTemporalEnsembler:
             avg /= exp_weights[: i + 1].sum()
         print("online", avg)
         ```
+
+        Since every time step receives one action per update, the number of actions already averaged for the
+        time step `k` steps ahead is known in advance: min(chunk_size - 1 - k, number of past updates). The
+        ensembler thus only keeps the weighted sums of the actions in a preallocated (batch, chunk_size,
+        action_dim) ring buffer, updated in place, and divides by the precomputed sum of the weights when an
+        action is consumed. No tensor is allocated per update apart from the returned action.
         """
         self.chunk_size = chunk_size
         self.ensemble_weights = torch.exp(-temporal_ensemble_coeff * torch.arange(chunk_size))
         self.ensemble_weights_cumsum = torch.cumsum(self.ensemble_weights, dim=0)
+        # Row `n` holds the weight of the action added at each offset during the update `n` of the episode
+        # (clamped at chunk_size - 1, after which the weights don't change anymore).
+        offsets = torch.arange(chunk_size)
+        num_past_updates = torch.arange(chunk_size).unsqueeze(1)
+        self.update_weights = self.ensemble_weights[torch.minimum(chunk_size - 1 - offsets, num_past_updates)]
         self.reset()
 
     def reset(self):
         """Resets the online computation variables."""
-        self.ensembled_actions = None
-        # (chunk_size,) count of how many actions are in the ensemble for each time step in the sequence.
-        self.ensembled_actions_count = None
+        # (batch_size, chunk_size, action_dim) ring buffer of the weighted sums of the actions predicted for
+        # the next time steps. The next time step is at `self.head`.
+        self.weighted_action_sums = None
+        self.head = 0
+        self.num_updates = 0
 
     def update(self, actions: Tensor) -> Tensor:
         """
         Takes a (batch, chunk_size, action_dim) sequence of actions, update the temporal ensemble for all
         time steps, and pop/return the next batch of actions in the sequence.
         """
-        self.ensemble_weights = self.ensemble_weights.to(device=actions.device)
-        self.ensemble_weights_cumsum = self.ensemble_weights_cumsum.to(device=actions.device)
-        if self.ensembled_actions is None:
-            # Initializes `self._ensembled_action` to the sequence of actions predicted during the first
-            # time step of the episode.
-            self.ensembled_actions = actions.clone()
-            # Note: The last dimension is unsqueeze to make sure we can broadcast properly for tensor
-            # operations later.
-            self.ensembled_actions_count = torch.ones(
-                (self.chunk_size, 1), dtype=torch.long, device=self.ensembled_actions.device
-            )
-        else:
-            # self.ensembled_actions will have shape (batch_size, chunk_size - 1, action_dim). Compute
-            # the online update for those entries.
-            self.ensembled_actions *= self.ensemble_weights_cumsum[self.ensembled_actions_count - 1]
-            self.ensembled_actions += actions[:, :-1] * self.ensemble_weights[self.ensembled_actions_count]
-            self.ensembled_actions /= self.ensemble_weights_cumsum[self.ensembled_actions_count]
-            self.ensembled_actions_count = torch.clamp(self.ensembled_actions_count + 1, max=self.chunk_size)
-            # The last action, which has no prior online average, needs to get concatenated onto the end.
-            self.ensembled_actions = torch.cat([self.ensembled_actions, actions[:, -1:]], dim=1)
-            self.ensembled_actions_count = torch.cat(
-                [self.ensembled_actions_count, torch.ones_like(self.ensembled_actions_count[-1:])]
-            )
-        # "Consume" the first action.
-        action, self.ensembled_actions, self.ensembled_actions_count = (
-            self.ensembled_actions[:, 0],
-            self.ensembled_actions[:, 1:],
-            self.ensembled_actions_count[1:],
-        )
+        if (
+            self.weighted_action_sums is None
+            or self.weighted_action_sums.shape != actions.shape
+            or self.weighted_action_sums.device != actions.device
+        ):
+            self.weighted_action_sums = torch.zeros_like(actions)
+            self.head = 0
+            self.num_updates = 0
+        if self.update_weights.device != actions.device:
+            self.update_weights = self.update_weights.to(device=actions.device)
+            self.ensemble_weights = self.ensemble_weights.to(device=actions.device)
+            self.ensemble_weights_cumsum = self.ensemble_weights_cumsum.to(device=actions.device)
+
+        row = min(self.num_updates, self.chunk_size - 1)
+        weights = self.update_weights[row].unsqueeze(-1)
+        # The offsets [0, chunk_size - head) are stored from `head` to the end of the buffer, the others wrap
+        # around to its beginning.
+        split = self.chunk_size - self.head
+        self.weighted_action_sums[:, self.head :].addcmul_(actions[:, :split], weights[:split])
+        self.weighted_action_sums[:, : self.head].addcmul_(actions[:, split:], weights[split:])
+
+        # "Consume" the first action. Its slot becomes the one of the last time step of the next update.
+        action = self.weighted_action_sums[:, self.head] / self.ensemble_weights_cumsum[row]
+        self.weighted_action_sums[:, self.head].zero_()
+        self.head = (self.head + 1) % self.chunk_size
+        self.num_updates += 1
         return action
 
 
@@ -53,6 +53,12 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Dtype used to send floating point parameters to the actor ("float16", "bfloat16"), None keeps it as is
+    policy_parameters_dtype: str | None = None
+    # Send the difference with the previously pushed parameters instead of their values
+    policy_parameters_deltas: bool = False
+    # Number of parameter pushes between two full (keyframe) pushes, 0 to only send a full push at start
+    policy_parameters_keyframe_interval: int = 10
 
 
 @dataclass
@@ -143,8 +149,12 @@ class SACConfig(PreTrainedConfig):
     online_buffer_capacity: int = 100000
     # Capacity of the offline replay buffer
     offline_buffer_capacity: int = 100000
+    # Whether to store images as uint8 in the replay buffers (converted back to floats when sampling)
+    store_images_as_uint8: bool = False
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Number of sampler processes feeding each buffer from shared memory (0 samples in the learner process)
+    sampler_num_workers: int = 0
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -275,6 +275,62 @@ class _NormalizationMixin:
         processed_action = self._apply_transform(action, ACTION, FeatureType.ACTION, inverse=inverse)
         return processed_action
 
+    def affine_params(
+        self, key: str, feature_type: FeatureType, *, inverse: bool = False
+    ) -> tuple[Tensor, Tensor] | None:
+        """
+        Expresses the (un)normalization of a feature as `tensor * scale + shift`.
+
+        Every normalization mode is an affine map, so it can be precomputed once and applied with a single
+        fused operation (e.g. `torch.addcmul`) instead of going through `_apply_transform` on every call.
+
+        Args:
+            key: The feature key.
+            feature_type: The `FeatureType` of the feature.
+            inverse: If `True`, returns the parameters of the unnormalization.
+
+        Returns:
+            A `(scale, shift)` tuple of tensors broadcastable to the feature, or `None` if the feature is
+            left unchanged.
+
+        Raises:
+            ValueError: If the normalization mode is unsupported or its stats are missing.
+        """
+        norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
+        if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
+            return None
+
+        stats = self._tensor_stats[key]
+        if norm_mode == NormalizationMode.MEAN_STD:
+            if "mean" not in stats or "std" not in stats:
+                raise ValueError("MEAN_STD normalization mode requires mean and std stats")
+            if inverse:
+                return stats["std"], stats["mean"]
+            scale = 1 / (stats["std"] + self.eps)
+            return scale, -stats["mean"] * scale
+
+        low_high_keys = {
+            NormalizationMode.MIN_MAX: ("min", "max"),
+            NormalizationMode.QUANTILES: ("q01", "q99"),
+            NormalizationMode.QUANTILE10: ("q10", "q90"),
+        }
+        if norm_mode not in low_high_keys:
+            raise ValueError(f"Unsupported normalization mode: {norm_mode}")
+        low_key, high_key = low_high_keys[norm_mode]
+        if low_key not in stats or high_key not in stats:
+            raise ValueError(f"{norm_mode.value} normalization mode requires {low_key} and {high_key} stats")
+
+        low = stats[low_key]
+        denom = stats[high_key] - low
+        # Same substitution as `_apply_transform` when both bounds are equal
+        denom = torch.where(denom == 0, torch.full_like(denom, self.eps), denom)
+        if inverse:
+            # Map from [-1, 1] back to [low, high]
+            return denom / 2, denom / 2 + low
+        # Map from [low, high] to [-1, 1]
+        scale = 2 / denom
+        return scale, -low * scale - 1
+
     def _apply_transform(
         self, tensor: Tensor, key: str, feature_type: FeatureType, *, inverse: bool = False
     ) -> Tensor:
@@ -63,14 +63,15 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.processor import TransitionKey
+from lerobot.rl.buffer import transitions_to_batch
+from lerobot.rl.parameter_sync import ParameterReceiver, drop_superseded_updates, get_modules_to_sync
 from lerobot.rl.process import ProcessSignalHandler
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.queue import get_all_items_from_queue
 from lerobot.robots import so100_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import (
-    bytes_to_state_dict,
     grpc_channel_options,
     python_object_to_bytes,
     receive_bytes_in_chunks,
@@ -79,11 +80,7 @@ from lerobot.transport.utils import (
 )
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import precise_sleep
-from lerobot.utils.transition import (
-    Transition,
-    move_state_dict_to_device,
-    move_transition_to_device,
-)
+from lerobot.utils.transition import Transition
 from lerobot.utils.utils import (
     TimerManager,
     get_safe_torch_device,
@@ -235,13 +232,14 @@ def act_with_policy(
         init_logging(log_file=log_file, display_pid=True)
         logging.info("Actor policy process logging initialized")
 
+    device = get_safe_torch_device(cfg.policy.device, log=True)
+
     logging.info("make_env online")
 
     online_env, teleop_device = make_robot_env(cfg=cfg.env)
-    env_processor, action_processor = make_processors(online_env, teleop_device, cfg.env, cfg.policy.device)
+    env_processor, action_processor = make_processors(online_env, teleop_device, cfg.env, str(device))
 
     set_seed(cfg.seed)
-    device = get_safe_torch_device(cfg.policy.device, log=True)
 
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
@@ -258,6 +256,9 @@ def act_with_policy(
     policy = policy.eval()
     assert isinstance(policy, nn.Module)
 
+    # Learner updates are copied in place into the policy parameters
+    parameter_receiver = ParameterReceiver(modules=get_modules_to_sync(policy))
+
     obs, info = online_env.reset()
     env_processor.reset()
     action_processor.reset()
@@ -351,7 +352,7 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            update_policy_parameters(parameters_queue=parameters_queue, parameter_receiver=parameter_receiver)
 
             if len(list_transition_to_send_to_learner) > 0:
                 push_transitions_to_transport_queue(
@@ -649,56 +650,41 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
-    bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
-    if bytes_state_dict is not None:
-        logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
-
-        # TODO: check encoder parameter synchronization possible issues:
-        # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
-        #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
-        # Potential fixes:
-        # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
-        # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
-
-        # Load actor state dict
-        actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
-
-        # Load discrete critic if present
-        if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
-            discrete_critic_state_dict = move_state_dict_to_device(
-                state_dicts["discrete_critic"], device=device
-            )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
-            logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+def update_policy_parameters(parameters_queue: Queue, parameter_receiver: ParameterReceiver):
+    buffers = get_all_items_from_queue(parameters_queue, block=False)
+    if not buffers:
+        return
+
+    logging.info("[ACTOR] Load new parameters from Learner.")
+    # TODO: check encoder parameter synchronization possible issues:
+    # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
+    #    instead of the updated encoder params from critic (which is optimized separately)
+    # 2. Need to handle encoder params correctly for both actor and discrete_critic
+    # Potential fixes:
+    # - Send critic's encoder state when shared_encoder=True
+    # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
+    for buffer in drop_superseded_updates(buffers):
+        parameter_receiver.apply(buffer)
+
+    logging.info(f"[ACTOR] Policy parameters updated to version {parameter_receiver.version}.")
 
 
 #  Utilities functions
 
 
 def push_transitions_to_transport_queue(transitions: list, transitions_queue):
-    """Send transitions to learner in smaller chunks to avoid network issues.
+    """Send transitions to the learner as a single columnar batch (see `transitions_to_batch`).
 
     Args:
         transitions: List of transitions to send
-        message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        transitions_queue: Queue to send messages to learner
     """
-    transition_to_send_to_learner = []
-    for transition in transitions:
-        tr = move_transition_to_device(transition=transition, device="cpu")
-        for key, value in tr["state"].items():
-            if torch.isnan(value).any():
-                logging.warning(f"Found NaN values in transition {key}")
-
-        transition_to_send_to_learner.append(tr)
+    batch = transitions_to_batch(transitions)
+    for key, value in batch["state"].items():
+        if value.is_floating_point() and torch.isnan(value).any():
+            logging.warning(f"Found NaN values in transition {key}")
 
-    transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
+    transitions_queue.put(transitions_to_bytes(batch))
 
 
 def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
@@ -87,6 +87,7 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        store_images_as_uint8: bool = False,
     ):
         """
         Replay buffer for storing transitions.
@@ -104,6 +105,11 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+                The few next_states that differ from the following state (episode boundaries, non contiguous
+                transitions) are kept aside so that sampling still returns the right ones.
+            store_images_as_uint8 (bool): If True, image keys are stored as uint8 (images are expected as floats
+                in [0, 1] or uint8) and converted back to floats in [0, 1] on the sampled batch, on `device`.
+                Implies `optimize_memory`.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
@@ -114,7 +120,14 @@ class ReplayBuffer:
         self.position = 0
         self.size = 0
         self.initialized = False
-        self.optimize_memory = optimize_memory
+        # (position, size) of the buffer seen by the sampler workers, set by `share_memory_`
+        self._shared_cursor: torch.Tensor | None = None
+        # Per slot write counters, odd while the slot is being written, set by `share_memory_`
+        self._slot_generations: torch.Tensor | None = None
+        # next_states kept aside, with one row per slot so that the sampler workers can read them
+        self._shared_next_state_overrides: dict[str, torch.Tensor] | None = None
+        self.store_images_as_uint8 = store_images_as_uint8
+        self.optimize_memory = optimize_memory or store_images_as_uint8
 
         # Track episode boundaries for memory optimization
         self.episode_ends = torch.zeros(capacity, dtype=torch.bool, device=storage_device)
@@ -142,7 +155,9 @@ class ReplayBuffer:
 
         # Pre-allocate tensors for storage
         self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            key: torch.empty(
+                (self.capacity, *shape), dtype=self._state_dtype(key), device=self.storage_device
+            )
             for key, shape in state_shapes.items()
         }
         self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
@@ -158,6 +173,12 @@ class ReplayBuffer:
             # Memory-optimized approach: don't allocate next_states buffer
             # Just create a reference to states for consistent API
             self.next_states = self.states  # Just a reference for API consistency
+            # next_states that can't be read at the following index, keyed by slot. The most recent
+            # transition always has one until we know whether the next transition continues it.
+            self.next_state_overrides: dict[int, dict[str, torch.Tensor]] = {}
+            self.has_next_state_override = torch.zeros(
+                (self.capacity,), dtype=torch.bool, device=self.storage_device
+            )
 
         self.dones = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
         self.truncateds = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
@@ -184,9 +205,87 @@ class ReplayBuffer:
 
         self.initialized = True
 
+    def _state_dtype(self, key: str) -> torch.dtype:
+        if self.store_images_as_uint8 and _is_image_key(key):
+            return torch.uint8
+        return torch.get_default_dtype()
+
     def __len__(self):
         return self.size
 
+    def memory_footprint(self) -> dict[str, int]:
+        """Number of bytes allocated by the storage of each key, e.g. `{"state.observation.image": ...}`.
+
+        With `optimize_memory`, the next_states kept aside at episode boundaries are reported under
+        `next_state_overrides`.
+        """
+        if not self.initialized:
+            return {}
+
+        footprint = {f"state.{key}": _nbytes(value) for key, value in self.states.items()}
+        if self.optimize_memory:
+            footprint["next_state_overrides"] = _nbytes(self.has_next_state_override) + sum(
+                _nbytes(value)
+                for override in self.next_state_overrides.values()
+                for value in override.values()
+            )
+            if self._shared_next_state_overrides is not None:
+                footprint["next_state_overrides"] += sum(
+                    _nbytes(value) for value in self._shared_next_state_overrides.values()
+                )
+        else:
+            footprint.update({f"next_state.{key}": _nbytes(value) for key, value in self.next_states.items()})
+        footprint[ACTION] = _nbytes(self.actions)
+        footprint["reward"] = _nbytes(self.rewards)
+        footprint["done"] = _nbytes(self.dones)
+        footprint["truncated"] = _nbytes(self.truncateds)
+        for key, value in self.complementary_info.items():
+            footprint[f"complementary_info.{key}"] = _nbytes(value)
+        return footprint
+
+    def share_memory_(self) -> "ReplayBuffer":
+        """Move the storage to shared memory so that sampler processes can read it without copies.
+
+        Transitions keep being added from this process, the sampler processes see them as they are written.
+        With `optimize_memory`, the next_states kept aside get a shared copy with one row per slot, which the
+        sampler processes read at gather time. It takes as much memory as the states.
+        """
+        if not self.initialized:
+            raise RuntimeError("Cannot share an empty buffer. Add transitions first.")
+        if torch.device(self.storage_device).type != "cpu":
+            raise ValueError(f"Only a buffer stored on cpu can be shared, got '{self.storage_device}'.")
+
+        storage = self._storage()
+        for tensor in _iter_tensors(storage):
+            tensor.share_memory_()
+        if self._shared_cursor is None:
+            self._shared_cursor = torch.empty(2, dtype=torch.long).share_memory_()
+            self._publish_cursor()
+            self._slot_generations = torch.zeros(self.capacity, dtype=torch.long).share_memory_()
+        if self.optimize_memory and self._shared_next_state_overrides is None:
+            self.has_next_state_override.share_memory_()
+            self._shared_next_state_overrides = {
+                key: torch.zeros_like(value).share_memory_() for key, value in self.states.items()
+            }
+            for slot, override in self.next_state_overrides.items():
+                for key, value in override.items():
+                    self._shared_next_state_overrides[key][slot].copy_(value)
+        return self
+
+    def _publish_cursor(self):
+        """Let the sampler workers see the transitions written so far. The position is updated before the
+        size, which the workers read first, so that they never see a size ahead of the position."""
+        if self._shared_cursor is not None:
+            self._shared_cursor[0] = self.position
+            self._shared_cursor[1] = self.size
+
+    def _bump_slot_generations(self, num_rows: int):
+        """Called before and after writing `num_rows` transitions at the current position, so that the sampler
+        workers can tell the rows they gathered meanwhile apart (see `_fill_staging_slot`)."""
+        if self._slot_generations is not None:
+            slots = (self.position + torch.arange(num_rows)) % self.capacity
+            self._slot_generations[slots] += 1
+
     def add(
         self,
         state: dict[str, torch.Tensor],
@@ -202,13 +301,29 @@ class ReplayBuffer:
         if not self.initialized:
             self._initialize_storage(state=state, action=action, complementary_info=complementary_info)
 
+        self._bump_slot_generations(1)
+        state = {key: self._cast_rows(self.states[key], state[key].reshape(1, -1)) for key in self.states}
+        if self.optimize_memory:
+            # next_state may be None at the end of an episode, in which case we repeat the state
+            next_state = (
+                {
+                    key: self._cast_rows(self.states[key], next_state[key].reshape(1, -1))
+                    for key in self.states
+                }
+                if next_state is not None
+                else state
+            )
+            self._track_next_states(state, next_state)
+
         # Store the transition in pre-allocated tensors
         for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+            self.states[key][self.position].copy_(state[key][0])
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
-                self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
+                self.next_states[key][self.position].copy_(
+                    next_state[key].reshape(self.next_states[key].shape[1:])
+                )
 
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
@@ -226,8 +341,139 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        self._bump_slot_generations(1)
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
+        self._publish_cursor()
+
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """Saves a batch of transitions stacked along the first dimension (see `transitions_to_batch`).
+
+        The whole batch is written into the circular storage with (at most two) slice copies, wrapping around
+        the end of the buffer if needed. uint8 images are converted back to floats in [0, 1] when the storage
+        is floating point. If the batch is larger than the capacity, only its most recent transitions are kept.
+        """
+        num_transitions = action.shape[0]
+        if num_transitions == 0:
+            return
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: value[:1] for key, value in state.items()},
+                action=action[:1],
+                complementary_info=(
+                    {key: value[:1] for key, value in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        # Only the most recent transitions fit when the batch is bigger than the buffer
+        start = max(0, num_transitions - self.capacity)
+        num_written = num_transitions - start
+        self._bump_slot_generations(num_written)
+
+        if self.optimize_memory:
+            self._track_next_states(
+                state={key: self._cast_rows(self.states[key], state[key][start:]) for key in self.states},
+                next_state={
+                    key: self._cast_rows(self.states[key], next_state[key][start:]) for key in self.states
+                },
+            )
+
+        for key in self.states:
+            self._write_rows(self.states[key], state[key][start:])
+
+            if not self.optimize_memory:
+                # Only store next_states if not optimizing memory
+                self._write_rows(self.next_states[key], next_state[key][start:])
+
+        self._write_rows(self.actions, action[start:])
+        self._write_rows(self.rewards, torch.as_tensor(reward)[start:])
+        self._write_rows(self.dones, torch.as_tensor(done)[start:])
+        self._write_rows(self.truncateds, torch.as_tensor(truncated)[start:])
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    self._write_rows(
+                        self.complementary_info[key], torch.as_tensor(complementary_info[key])[start:]
+                    )
+
+        self._bump_slot_generations(num_written)
+        self.position = (self.position + num_written) % self.capacity
+        self.size = min(self.size + num_written, self.capacity)
+        self._publish_cursor()
+
+    @staticmethod
+    def _cast_rows(storage: torch.Tensor, values: torch.Tensor) -> torch.Tensor:
+        """Move rows stacked along the first dimension to the device, dtype and row shape of `storage`.
+        Images are converted between uint8 and floats in [0, 1] when their dtype differs from the storage."""
+        values = values.to(storage.device)
+        if values.dtype == torch.uint8 and storage.is_floating_point():
+            values = values.to(storage.dtype).div_(255)
+        elif storage.dtype == torch.uint8 and values.is_floating_point():
+            values = values.mul(255).round_().clamp_(0, 255).to(torch.uint8)
+        return values.reshape(values.shape[0], *storage.shape[1:])
+
+    def _track_next_states(self, state: dict[str, torch.Tensor], next_state: dict[str, torch.Tensor]):
+        """Keep aside the next_states that can't be derived from the following index (memory optimized mode).
+
+        `state` and `next_state` hold the transitions about to be written at the current position, stacked
+        along the first dimension and already cast with `_cast_rows`. The most recent transition always gets
+        an override, which is dropped once the following transition turns out to start from its next_state.
+        """
+        num_rows = next(iter(state.values())).shape[0]
+        slots = (self.position + torch.arange(num_rows)) % self.capacity
+
+        if self.size > 0:
+            last_slot = (self.position - 1) % self.capacity
+            override = self.next_state_overrides.get(last_slot)
+            if override is not None and all(torch.equal(override[key], state[key][0]) for key in state):
+                self._drop_next_state_override(last_slot)
+
+        # Overwritten transitions don't need their override anymore
+        overwritten = slots[self.has_next_state_override.cpu()[slots]]
+        for slot in overwritten.tolist():
+            self._drop_next_state_override(slot)
+
+        # Keep the next_states that differ from the state that follows them, and the last one
+        keep = torch.zeros(num_rows, dtype=torch.bool)
+        keep[-1] = True
+        for key in state:
+            same = (next_state[key][:-1] == state[key][1:]).reshape(num_rows - 1, -1).all(dim=1)
+            keep[:-1] |= ~same.cpu()
+
+        for row in keep.nonzero().squeeze(1).tolist():
+            slot = int(slots[row])
+            self.next_state_overrides[slot] = {key: value[row].clone() for key, value in next_state.items()}
+            if self._shared_next_state_overrides is not None:
+                for key, value in next_state.items():
+                    self._shared_next_state_overrides[key][slot].copy_(value[row])
+            self.has_next_state_override[slot] = True
+
+    def _drop_next_state_override(self, slot: int):
+        self.next_state_overrides.pop(slot, None)
+        self.has_next_state_override[slot] = False
+
+    def _write_rows(self, storage: torch.Tensor, values: torch.Tensor):
+        """Copy `values` into `storage` starting at the current position, wrapping around the end."""
+        values = self._cast_rows(storage, values)
+
+        num_rows = values.shape[0]
+        first = min(num_rows, self.capacity - self.position)
+        storage[self.position : self.position + first].copy_(values[:first])
+        if first < num_rows:
+            storage[: num_rows - first].copy_(values[first:])
 
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
@@ -235,29 +481,66 @@ class ReplayBuffer:
             raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
 
         batch_size = min(batch_size, self.size)
-        high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
 
         # Random indices for sampling - create on the same device as storage
-        idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        idx = torch.randint(low=0, high=self.size, size=(batch_size,), device=self.storage_device)
+
+        rows = _gather_transitions(
+            self._storage(), idx, capacity=self.capacity, lazy_next_state=self.optimize_memory
+        )
+        if self.optimize_memory:
+            # Episode boundaries and other transitions whose next_state was kept aside
+            for row in self.has_next_state_override[idx].nonzero().squeeze(1).tolist():
+                override = self.next_state_overrides.get(int(idx[row]))
+                # Dropped meanwhile by `add`, when sampling from the prefetching thread
+                if override is None:
+                    continue
+                for key, value in rows["next_state"].items():
+                    value[row] = override[key]
+        return self._collate_on_device(rows, idx)
+
+    def _storage(self) -> BatchTransition:
+        """The storage tensors, laid out as a `BatchTransition` with one row per slot."""
+        return BatchTransition(
+            state=self.states,
+            action=self.actions,
+            reward=self.rewards,
+            next_state=self.next_states,
+            done=self.dones,
+            truncated=self.truncateds,
+            complementary_info=self.complementary_info if self.has_complementary_info else None,
+        )
+
+    def _collate_on_device(
+        self, rows: BatchTransition, idx: torch.Tensor, copy: bool = False
+    ) -> BatchTransition:
+        """Move gathered rows to `device` and turn them into a training batch: convert uint8 images to floats
+        and apply the DrQ augmentation.
+
+        Args:
+            rows (BatchTransition): Rows gathered with `_gather_transitions`, with the next_states kept aside
+                already restored.
+            idx (torch.Tensor): Slots the rows were gathered from.
+            copy (bool): Whether to always copy the rows, even if they already are on `device`. Needed when the
+                rows live in a staging buffer that gets reused.
+        """
+        batch_size = idx.shape[0]
 
         # Identify image keys that need augmentation
         image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
 
-        # Create batched state and next_state
-        batch_state = {}
-        batch_next_state = {}
+        # Load all state tensors to target device
+        batch_state = {key: value.to(self.device, copy=copy) for key, value in rows["state"].items()}
+        batch_next_state = {
+            key: value.to(self.device, copy=copy) for key, value in rows["next_state"].items()
+        }
 
-        # First pass: load all state tensors to target device
-        for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
-
-            if not self.optimize_memory:
-                # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
-            else:
-                # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+        if self.store_images_as_uint8:
+            # Only the sampled images are converted to floats, once on the target device
+            for observations in (batch_state, batch_next_state):
+                for key, value in observations.items():
+                    if value.dtype == torch.uint8:
+                        observations[key] = value.to(torch.get_default_dtype()).div_(255)
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -280,18 +563,18 @@ class ReplayBuffer:
                 # Next states start after the states at index (i*2+1)*batch_size and also take up batch_size slots
                 batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
 
-        # Sample other tensors
-        batch_actions = self.actions[idx].to(self.device)
-        batch_rewards = self.rewards[idx].to(self.device)
-        batch_dones = self.dones[idx].to(self.device).float()
-        batch_truncateds = self.truncateds[idx].to(self.device).float()
+        # Other tensors
+        batch_actions = rows[ACTION].to(self.device, copy=copy)
+        batch_rewards = rows["reward"].to(self.device, copy=copy)
+        batch_dones = rows["done"].to(self.device).float()
+        batch_truncateds = rows["truncated"].to(self.device).float()
 
-        # Sample complementary_info if available
+        # Complementary_info if available
         batch_complementary_info = None
         if self.has_complementary_info:
             batch_complementary_info = {}
             for key in self.complementary_info_keys:
-                batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
+                batch_complementary_info[key] = rows["complementary_info"][key].to(self.device, copy=copy)
 
         return BatchTransition(
             state=batch_state,
@@ -308,6 +591,7 @@ class ReplayBuffer:
         batch_size: int,
         async_prefetch: bool = True,
         queue_size: int = 2,
+        num_workers: int = 0,
     ):
         """
         Creates an infinite iterator that yields batches of transitions.
@@ -317,12 +601,18 @@ class ReplayBuffer:
             batch_size (int): Size of batches to sample
             async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
             queue_size (int): Number of batches to prefetch (default: 2)
+            num_workers (int): Number of sampler processes gathering the batches from shared memory. If greater
+                than 0, it takes precedence over `async_prefetch` (default: 0)
 
         Yields:
             BatchTransition: Batched transitions
         """
         while True:  # Create an infinite loop
-            if async_prefetch:
+            if num_workers > 0:
+                iterator = self._get_multiprocess_iterator(
+                    batch_size=batch_size, queue_size=queue_size, num_workers=num_workers
+                )
+            elif async_prefetch:
                 # Get the standard iterator
                 iterator = self._get_async_iterator(queue_size=queue_size, batch_size=batch_size)
             else:
@@ -411,6 +701,85 @@ class ReplayBuffer:
             yield queue.popleft()
             enqueue(1)
 
+    def _get_multiprocess_iterator(self, batch_size: int, queue_size: int = 2, num_workers: int = 1):
+        """
+        Creates an iterator fed by `num_workers` sampler processes.
+
+        The storage is moved to shared memory and each worker gathers random rows straight into one of
+        `num_workers + queue_size` preallocated shared staging slots. Only slot indices travel through the
+        queues. This process then copies the slot to `device` in one transfer per tensor and runs the uint8
+        conversion and the DrQ augmentation there, on the whole batch at once.
+
+        Args:
+            batch_size (int): Size of batches to sample.
+            queue_size (int): Number of batches to prefetch on top of the ones being gathered.
+            num_workers (int): Number of sampler processes.
+
+        Yields:
+            BatchTransition: A batch sampled from the replay buffer.
+        """
+        import queue
+
+        import torch.multiprocessing as mp
+
+        self.share_memory_()
+        storage = self._storage()
+        staging = [_allocate_staging(storage, batch_size) for _ in range(num_workers + queue_size)]
+
+        # Spawn, as the learner may already hold a CUDA context
+        context = mp.get_context("spawn")
+        free_slots = context.Queue()
+        ready_slots = context.Queue()
+        for slot in range(len(staging)):
+            free_slots.put(slot)
+        shutdown_event = context.Event()
+
+        workers = [
+            context.Process(
+                target=_sampler_worker,
+                kwargs={
+                    "storage": storage,
+                    "shared_cursor": self._shared_cursor,
+                    "slot_generations": self._slot_generations,
+                    "capacity": self.capacity,
+                    "next_state_overrides": self._shared_next_state_overrides,
+                    "has_next_state_override": (
+                        self.has_next_state_override if self.optimize_memory else None
+                    ),
+                    "staging": staging,
+                    "free_slots": free_slots,
+                    "ready_slots": ready_slots,
+                    "shutdown_event": shutdown_event,
+                    "seed": int(torch.randint(0, 2**31 - 1, ())) + worker_id,
+                },
+                daemon=True,
+            )
+            for worker_id in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while True:
+                try:
+                    slot, count = ready_slots.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        raise RuntimeError("The replay buffer sampler workers exited unexpectedly.") from None
+                    continue
+
+                rows = _select_rows(staging[slot], slice(0, count))
+                batch = self._collate_on_device(rows, rows["index"], copy=True)
+                # The batch doesn't reference the staging slot anymore, give it back to the workers
+                free_slots.put(slot)
+                yield batch
+        finally:
+            shutdown_event.set()
+            for worker in workers:
+                worker.join(timeout=1.0)
+                if worker.is_alive():
+                    worker.terminate()
+
     @classmethod
     def from_lerobot_dataset(
         cls,
@@ -422,6 +791,7 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        store_images_as_uint8: bool = False,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +807,8 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            store_images_as_uint8 (bool): If True, images are stored as uint8 and converted back to floats when
+                sampling.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +830,7 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            store_images_as_uint8=store_images_as_uint8,
         )
 
         # Convert dataset to transitions
@@ -574,7 +947,8 @@ class ReplayBuffer:
 
             # Fill the data for state keys
             for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+                value = self.states[key][actual_idx].cpu()
+                frame_dict[key] = value.float() / 255 if value.dtype == torch.uint8 else value
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -758,6 +1132,292 @@ def guess_feature_info(t, name: str):
         }
 
 
+def _is_image_key(key: str) -> bool:
+    return key.startswith(OBS_IMAGE)
+
+
+def _nbytes(tensor: torch.Tensor) -> int:
+    return tensor.numel() * tensor.element_size()
+
+
+def _iter_tensors(batch: BatchTransition):
+    """Yields the tensors of a batch, or of a storage laid out as a batch, once each."""
+    seen = set()
+    for value in batch.values():
+        tensors = value.values() if isinstance(value, dict) else [value]
+        for tensor in tensors:
+            if isinstance(tensor, torch.Tensor) and id(tensor) not in seen:
+                seen.add(id(tensor))
+                yield tensor
+
+
+def _select_rows(batch: dict, index: torch.Tensor | slice) -> dict:
+    """Index every tensor of a batch (or of a staging slot), including the nested observation dicts."""
+    selected = {}
+    for key, value in batch.items():
+        if isinstance(value, dict):
+            selected[key] = {name: tensor[index] for name, tensor in value.items()}
+        elif isinstance(value, torch.Tensor):
+            selected[key] = value[index]
+        else:
+            selected[key] = value
+    return selected
+
+
+def _gather_transitions(
+    storage: BatchTransition,
+    idx: torch.Tensor,
+    capacity: int,
+    lazy_next_state: bool,
+    out: BatchTransition | None = None,
+) -> BatchTransition:
+    """Gather the rows `idx` of a replay buffer storage (see `ReplayBuffer._storage`).
+
+    With `lazy_next_state`, next_states are read at the following slot; the few ones kept aside by the buffer
+    have to be restored by the caller. Rows are written into `out` when given.
+    """
+    next_idx = (idx + 1) % capacity if lazy_next_state else idx
+
+    def gather(source: torch.Tensor, index: torch.Tensor, destination: torch.Tensor | None) -> torch.Tensor:
+        if destination is None:
+            return source[index]
+        return torch.index_select(source, 0, index, out=destination)
+
+    def gather_dict(source: dict | None, index: torch.Tensor, key: str) -> dict | None:
+        if source is None:
+            return None
+        return {
+            name: gather(tensor, index, out[key][name] if out is not None else None)
+            for name, tensor in source.items()
+        }
+
+    return BatchTransition(
+        state=gather_dict(storage["state"], idx, "state"),
+        action=gather(storage[ACTION], idx, out[ACTION] if out is not None else None),
+        reward=gather(storage["reward"], idx, out["reward"] if out is not None else None),
+        next_state=gather_dict(storage["next_state"], next_idx, "next_state"),
+        done=gather(storage["done"], idx, out["done"] if out is not None else None),
+        truncated=gather(storage["truncated"], idx, out["truncated"] if out is not None else None),
+        complementary_info=gather_dict(storage.get("complementary_info"), idx, "complementary_info"),
+    )
+
+
+def _allocate_staging(storage: BatchTransition, batch_size: int) -> dict:
+    """Shared memory buffers receiving `batch_size` gathered rows of `storage`, plus their slot `index`."""
+
+    def allocate(tensor: torch.Tensor) -> torch.Tensor:
+        return torch.empty((batch_size, *tensor.shape[1:]), dtype=tensor.dtype).share_memory_()
+
+    staging = {
+        key: {name: allocate(tensor) for name, tensor in value.items()}
+        if isinstance(value, dict)
+        else allocate(value)
+        for key, value in storage.items()
+        if value is not None
+    }
+    staging["index"] = torch.empty((batch_size,), dtype=torch.long).share_memory_()
+    return staging
+
+
+def _fill_staging_slot(
+    storage: BatchTransition,
+    shared_cursor: torch.Tensor,
+    slot_generations: torch.Tensor,
+    capacity: int,
+    staging_slot: dict,
+    next_state_overrides: dict[str, torch.Tensor] | None = None,
+    has_next_state_override: torch.Tensor | None = None,
+) -> int:
+    """Gather random rows of the shared storage into a staging slot and return how many were gathered.
+
+    The learner keeps writing while the rows are gathered. The generations of the slots are read before and
+    after gathering, the rows whose slots were being written meanwhile are gathered again at other random slots.
+
+    With lazy next states (`next_state_overrides` given), the next_states kept aside are restored from
+    `next_state_overrides` within the same check. The newest transition is not sampled as long as there is
+    another one: its override is dropped by the learner when the following transition is added.
+    """
+    lazy_next_state = next_state_overrides is not None
+    size = int(shared_cursor[1])
+    position = int(shared_cursor[0])
+    num_candidates = size - 1 if lazy_next_state and size > 1 else size
+
+    def gather(rows: int, out: dict | None = None) -> tuple[dict, torch.Tensor]:
+        # Offsets from the oldest transition, turned into slots of the circular storage
+        index = out["index"] if out is not None else torch.empty(rows, dtype=torch.long)
+        torch.randint(low=0, high=num_candidates, size=(rows,), out=index)
+        index.add_(position - size).remainder_(capacity)
+
+        watched = torch.cat([index, (index + 1) % capacity]) if lazy_next_state else index
+        generations = slot_generations[watched]
+        gathered = _gather_transitions(
+            storage, index, capacity=capacity, lazy_next_state=lazy_next_state, out=out
+        )
+        gathered["index"] = index
+        if lazy_next_state:
+            overridden = has_next_state_override[index].nonzero().squeeze(1)
+            for key, value in gathered["next_state"].items():
+                value[overridden] = next_state_overrides[key][index[overridden]]
+        torn = (generations % 2 == 1) | (generations != slot_generations[watched])
+        # The next_state of a row is read at the following slot
+        return gathered, torn.view(2, rows).any(dim=0) if lazy_next_state else torn
+
+    batch_size = staging_slot["index"].shape[0]
+    count = min(batch_size, num_candidates)
+    out = _select_rows(staging_slot, slice(0, count))
+    _, torn = gather(count, out)
+    torn_rows = torn.nonzero().squeeze(1)
+    while torn_rows.numel() > 0:
+        gathered, torn = gather(torn_rows.numel())
+        _copy_rows(out, torn_rows[~torn], _select_rows(gathered, ~torn))
+        torn_rows = torn_rows[torn]
+    return count
+
+
+def _copy_rows(destination: dict, rows: torch.Tensor, source: dict):
+    """Copy the rows of `source` into the `rows` of `destination`, both laid out as a staging slot."""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            for name, tensor in value.items():
+                destination[key][name].index_copy_(0, rows, tensor)
+        elif isinstance(value, torch.Tensor):
+            destination[key].index_copy_(0, rows, value)
+
+
+def _sampler_worker(
+    storage: BatchTransition,
+    shared_cursor: torch.Tensor,
+    slot_generations: torch.Tensor,
+    capacity: int,
+    next_state_overrides: dict[str, torch.Tensor] | None,
+    has_next_state_override: torch.Tensor | None,
+    staging: list[dict],
+    free_slots,
+    ready_slots,
+    shutdown_event,
+    seed: int,
+):
+    """Sampler process of `ReplayBuffer._get_multiprocess_iterator`: fills free staging slots with random
+    rows of the shared storage and hands their index back to the learner."""
+    import queue
+
+    torch.manual_seed(seed)
+    # The workers share the CPU with the learner, gathering rows doesn't benefit from intra-op threads
+    torch.set_num_threads(1)
+
+    while not shutdown_event.is_set():
+        try:
+            slot = free_slots.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        count = _fill_staging_slot(
+            storage,
+            shared_cursor,
+            slot_generations,
+            capacity,
+            staging[slot],
+            next_state_overrides=next_state_overrides,
+            has_next_state_override=has_next_state_override,
+        )
+        ready_slots.put((slot, count))
+
+
+def _images_to_uint8(images: torch.Tensor) -> torch.Tensor:
+    """Quantize float images in [0, 1] to uint8, other tensors are returned unchanged."""
+    if images.is_floating_point() and images.numel() > 0 and images.min() >= 0 and images.max() <= 1:
+        return images.mul(255).round_().to(torch.uint8)
+    return images
+
+
+def _stack_values(values: list) -> torch.Tensor:
+    # Tensors coming from the environment carry a leading batch dimension of 1, as in `ReplayBuffer.add`
+    return torch.stack([torch.as_tensor(value).detach().to("cpu").squeeze(0) for value in values])
+
+
+def transitions_to_batch(transitions: list[Transition], images_to_uint8: bool = True) -> BatchTransition:
+    """Stack a list of transitions into a columnar `BatchTransition` on CPU, with one tensor per key.
+
+    This is the format used to ship transitions from the actor to the learner: a handful of large
+    tensors serialise much faster than a list of nested dicts, and `ReplayBuffer.add_batch` can write them
+    with slice copies. With `images_to_uint8`, image keys holding floats in [0, 1] are quantized to uint8.
+    """
+    if not transitions:
+        raise ValueError("Cannot build a batch from an empty list of transitions.")
+
+    def stack_observations(observations: list[dict[str, torch.Tensor]]) -> dict[str, torch.Tensor]:
+        stacked = {}
+        for key in observations[0]:
+            stacked[key] = _stack_values([observation[key] for observation in observations])
+            if images_to_uint8 and _is_image_key(key):
+                stacked[key] = _images_to_uint8(stacked[key])
+        return stacked
+
+    complementary_info = None
+    first_info = transitions[0].get("complementary_info")
+    if first_info:
+        complementary_info = {
+            key: _stack_values([transition["complementary_info"][key] for transition in transitions])
+            for key in first_info
+        }
+
+    return BatchTransition(
+        state=stack_observations([transition["state"] for transition in transitions]),
+        action=_stack_values([transition[ACTION] for transition in transitions]),
+        reward=_stack_values([transition["reward"] for transition in transitions]).float(),
+        next_state=stack_observations([transition["next_state"] for transition in transitions]),
+        done=_stack_values([transition["done"] for transition in transitions]).bool(),
+        truncated=_stack_values([transition["truncated"] for transition in transitions]).bool(),
+        complementary_info=complementary_info,
+    )
+
+
+def batch_to_transitions(batch: BatchTransition) -> list[Transition]:
+    """Inverse of `transitions_to_batch`. uint8 images are converted back to floats in [0, 1]."""
+
+    def unstack_observations(observations: dict[str, torch.Tensor], i: int) -> dict[str, torch.Tensor]:
+        unstacked = {}
+        for key, value in observations.items():
+            unstacked[key] = value[i].float() / 255 if value.dtype == torch.uint8 else value[i]
+        return unstacked
+
+    complementary_info = batch.get("complementary_info")
+    return [
+        Transition(
+            state=unstack_observations(batch["state"], i),
+            action=batch[ACTION][i],
+            reward=batch["reward"][i],
+            next_state=unstack_observations(batch["next_state"], i),
+            done=batch["done"][i],
+            truncated=batch["truncated"][i],
+            complementary_info=(
+                {key: value[i] for key, value in complementary_info.items()}
+                if complementary_info is not None
+                else None
+            ),
+        )
+        for i in range(batch[ACTION].shape[0])
+    ]
+
+
+def select_batch_transitions(batch: BatchTransition, index: torch.Tensor) -> BatchTransition:
+    """Select a subset of the transitions of a batch with a boolean mask or integer indices."""
+    complementary_info = batch.get("complementary_info")
+    return BatchTransition(
+        state={key: value[index] for key, value in batch["state"].items()},
+        action=batch[ACTION][index],
+        reward=batch["reward"][index],
+        next_state={key: value[index] for key, value in batch["next_state"].items()},
+        done=batch["done"][index],
+        truncated=batch["truncated"][index],
+        complementary_info=(
+            {key: value[index] for key, value in complementary_info.items()}
+            if complementary_info is not None
+            else None
+        ),
+    )
+
+
 def concatenate_batch_transitions(
     left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition
 ) -> BatchTransition:
@@ -237,6 +237,7 @@ def convert_lerobot_dataset_to_cropped_lerobot_dataset(
 
     # Save the last episode
     new_dataset.save_episode()
+    new_dataset.finalize()
 
     if push_to_hub:
         new_dataset.push_to_hub()
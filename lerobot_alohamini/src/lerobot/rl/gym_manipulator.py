@@ -715,9 +715,12 @@ def control_loop(
         # Maintain fps timing
         precise_sleep(dt - (time.perf_counter() - step_start_time))
 
-    if dataset is not None and cfg.dataset.push_to_hub:
-        logging.info("Pushing dataset to hub")
-        dataset.push_to_hub()
+    if dataset is not None:
+        # Write the info, stats and episodes metadata still buffered before the dataset is read or pushed
+        dataset.finalize()
+        if cfg.dataset.push_to_hub:
+            logging.info("Pushing dataset to hub")
+            dataset.push_to_hub()
 
 
 def replay_trajectory(
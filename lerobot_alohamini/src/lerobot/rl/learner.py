@@ -66,7 +66,14 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    concatenate_batch_transitions,
+    select_batch_transitions,
+    transitions_to_batch,
+)
+from lerobot.rl.parameter_sync import ParameterSender, get_modules_to_sync
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -77,7 +84,6 @@ from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
     bytes_to_transitions,
-    state_to_bytes,
 )
 from lerobot.utils.constants import (
     ACTION,
@@ -93,7 +99,6 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -295,6 +300,7 @@ def add_actor_information_and_train(
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
+    sampler_num_workers = cfg.policy.sampler_num_workers
 
     # Initialize logging for multiprocessing
     if not use_threads(cfg):
@@ -315,7 +321,16 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    actor_learner_config = cfg.policy.actor_learner_config
+    parameter_sender = ParameterSender(
+        modules=get_modules_to_sync(policy),
+        wire_dtype=actor_learner_config.policy_parameters_dtype,
+        use_deltas=actor_learner_config.policy_parameters_deltas,
+        keyframe_interval=actor_learner_config.policy_parameters_keyframe_interval,
+    )
+    push_actor_policy_to_queue(
+        parameters_queue=parameters_queue, policy=policy, parameter_sender=parameter_sender
+    )
 
     last_time_policy_pushed = time.time()
 
@@ -363,7 +378,6 @@ def add_actor_information_and_train(
             transition_queue=transition_queue,
             replay_buffer=replay_buffer,
             offline_replay_buffer=offline_replay_buffer,
-            device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
         )
@@ -382,12 +396,18 @@ def add_actor_information_and_train(
 
         if online_iterator is None:
             online_iterator = replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                num_workers=sampler_num_workers,
             )
 
         if offline_replay_buffer is not None and offline_iterator is None:
             offline_iterator = offline_replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                num_workers=sampler_num_workers,
             )
 
         time_for_one_optimization_step = time.time()
@@ -550,7 +570,9 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue, policy=policy, parameter_sender=parameter_sender
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -953,6 +975,7 @@ def initialize_replay_buffer(
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            store_images_as_uint8=cfg.policy.store_images_as_uint8,
         )
 
     logging.info("Resume training load the online dataset")
@@ -972,6 +995,7 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        store_images_as_uint8=cfg.policy.store_images_as_uint8,
     )
 
 
@@ -1009,6 +1033,7 @@ def initialize_offline_replay_buffer(
         state_keys=cfg.policy.input_features.keys(),
         storage_device=storage_device,
         optimize_memory=True,
+        store_images_as_uint8=cfg.policy.store_images_as_uint8,
         capacity=cfg.policy.offline_buffer_capacity,
     )
     return offline_replay_buffer
@@ -1094,21 +1119,19 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
-    logging.debug("[LEARNER] Pushing actor policy to the queue")
+def push_actor_policy_to_queue(
+    parameters_queue: Queue, policy: nn.Module, parameter_sender: ParameterSender | None = None
+):
+    """Push the actor (and discrete critic, if any) parameters that changed since the last push.
 
-    # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    Without a `parameter_sender`, a full (keyframe) update is pushed.
+    """
+    logging.debug("[LEARNER] Pushing actor policy to the queue")
 
-    # Add discrete critic if it exists
-    if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
-        logging.debug("[LEARNER] Including discrete critic in state dict push")
+    if parameter_sender is None:
+        parameter_sender = ParameterSender(modules=get_modules_to_sync(policy))
 
-    state_bytes = state_to_bytes(state_dicts)
-    parameters_queue.put(state_bytes)
+    parameters_queue.put(parameter_sender.encode_update())
 
 
 def process_interaction_message(
@@ -1126,47 +1149,58 @@ def process_interaction_message(
     return message
 
 
+def find_transitions_with_nan(batch: BatchTransition) -> torch.Tensor:
+    """Boolean mask of the transitions of `batch` whose state, next state or action contain NaN values."""
+    num_transitions = batch[ACTION].shape[0]
+    nan_mask = torch.zeros(num_transitions, dtype=torch.bool, device=batch[ACTION].device)
+    for tensor in [*batch["state"].values(), *batch["next_state"].values(), batch[ACTION]]:
+        if tensor.is_floating_point():
+            nan_mask |= torch.isnan(tensor.reshape(num_transitions, -1)).any(dim=1)
+    return nan_mask
+
+
 def process_transitions(
     transition_queue: Queue,
     replay_buffer: ReplayBuffer,
     offline_replay_buffer: ReplayBuffer,
-    device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
 ):
     """Process all available transitions from the queue.
 
+    Transitions arrive as columnar batches and are written into the replay buffers with one `add_batch`
+    call per message.
+
     Args:
         transition_queue: Queue for receiving transitions from the actor
         replay_buffer: Replay buffer to add transitions to
         offline_replay_buffer: Offline replay buffer to add transitions to
-        device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
     """
     while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
-
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
+        batch = bytes_to_transitions(buffer=transition_queue.get())
+        if isinstance(batch, list):
+            # Transitions serialised one by one
+            if not batch:
                 continue
-
-            replay_buffer.add(**transition)
-
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+            batch = transitions_to_batch(batch)
+
+        # Skip transitions with NaN values
+        nan_mask = find_transitions_with_nan(batch)
+        if nan_mask.any():
+            logging.warning(f"[LEARNER] NaN detected in {int(nan_mask.sum())} transitions, skipping them")
+            batch = select_batch_transitions(batch, ~nan_mask)
+
+        replay_buffer.add_batch(**batch)
+
+        # Add to offline buffer if it's an intervention
+        complementary_info = batch.get("complementary_info") or {}
+        if dataset_repo_id is not None and TeleopEvents.IS_INTERVENTION in complementary_info:
+            is_intervention = complementary_info[TeleopEvents.IS_INTERVENTION]
+            is_intervention = is_intervention.reshape(is_intervention.shape[0], -1)[:, 0].bool()
+            if is_intervention.any():
+                offline_replay_buffer.add_batch(**select_batch_transitions(batch, is_intervention))
 
 
 def process_interaction_messages(
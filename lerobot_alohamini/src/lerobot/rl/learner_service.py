@@ -19,7 +19,8 @@ import logging
 import time
 from multiprocessing import Event, Queue
 
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.parameter_sync import drop_superseded_updates
+from lerobot.rl.queue import get_all_items_from_queue
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
 
@@ -65,19 +66,21 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 continue
 
             logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
+            # Incremental updates must all be sent in order, only the ones preceding a keyframe are dropped
+            buffers = get_all_items_from_queue(
                 self.parameters_queue, block=True, timeout=self.queue_get_timeout
             )
 
-            if buffer is None:
+            if not buffers:
                 continue
 
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+            for buffer in drop_superseded_updates(buffers):
+                yield from send_bytes_in_chunks(
+                    buffer,
+                    services_pb2.Parameters,
+                    log_prefix="[LEARNER] Sending parameters",
+                    silent=True,
+                )
 
             last_push_time = time.time()
             logging.info("[LEARNER] Parameters sent")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Incremental parameter synchronisation from the learner to the actors.
+
+Instead of `torch.save`-ing the full actor state dict on every push, the learner encodes a versioned
+*parameter update* holding only the tensors that changed since the previous update. Each tensor is laid out
+as a raw, contiguous frame after a small JSON header, so the actor can decode and copy the tensors one by one
+straight into the storage of its already allocated parameters, without materialising an intermediate state
+dict.
+
+- Every `keyframe_interval` pushes (and on the first one) a *keyframe* carrying every tensor and buffer is
+  emitted. Keyframes let an actor that missed updates, e.g. after a reconnection, resynchronise.
+- Frozen parameters (`requires_grad=False`, e.g. a frozen vision encoder) are only sent with keyframes, as
+  they don't change between two of them.
+- Floating point tensors can be sent in float16/bfloat16, and non-keyframe updates can carry the difference
+  with the previous version instead of the values. The sender tracks the exact (decoded) values held by the
+  actors, so reduced precision never accumulates drift.
+
+Updates that are not keyframes must be applied in order: queues carrying them are drained completely and
+only the updates preceding the most recent keyframe can be dropped (see `drop_superseded_updates`).
+"""
+
+import json
+import logging
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import torch
+from torch import nn
+
+PARAMETER_UPDATE_MAGIC = b"LRPU"
+_PREFIX_FORMAT = "<4sQ"  # magic, header length
+_PREFIX_SIZE = struct.calcsize(_PREFIX_FORMAT)
+_FRAME_ALIGNMENT = 8
+
+ENCODING_VALUE = "value"
+ENCODING_DELTA = "delta"
+
+WIRE_DTYPES = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+
+
+@dataclass
+class ParameterUpdateHeader:
+    version: int
+    base_version: int | None
+    keyframe: bool
+    tensors: list[dict]
+
+
+def get_modules_to_sync(policy: nn.Module) -> dict[str, nn.Module]:
+    """Modules of a SAC policy used by the actor, keyed by the name used on the wire."""
+    modules = {"policy": policy.actor}
+    if getattr(policy, "discrete_critic", None) is not None:
+        modules["discrete_critic"] = policy.discrete_critic
+    return modules
+
+
+def _named_tensors(modules: dict[str, nn.Module]) -> Iterator[tuple[str, torch.Tensor, bool]]:
+    """Yields `(name, tensor, frozen)` for every parameter and persistent buffer of `modules`."""
+    for prefix, module in modules.items():
+        for name, tensor in module.state_dict(keep_vars=True).items():
+            frozen = isinstance(tensor, nn.Parameter) and not tensor.requires_grad
+            yield f"{prefix}.{name}", tensor, frozen
+
+
+def _dtype_to_str(dtype: torch.dtype) -> str:
+    return str(dtype).removeprefix("torch.")
+
+
+def _str_to_dtype(name: str) -> torch.dtype:
+    return getattr(torch, name)
+
+
+def encode_parameter_update(
+    version: int, base_version: int | None, keyframe: bool, tensors: list[tuple[str, str, torch.Tensor]]
+) -> bytes:
+    """Serialise `(name, encoding, tensor)` triplets into a parameter update message."""
+    frames = []
+    entries = []
+    offset = 0
+    for name, encoding, tensor in tensors:
+        tensor = tensor.detach().contiguous()
+        # bfloat16 has no numpy equivalent, reinterpret the storage as raw bytes instead
+        frame = tensor.view(-1).view(torch.uint8).numpy().tobytes() if tensor.numel() > 0 else b""
+        # Keep every frame aligned on 8 bytes so that it can be viewed in place with its dtype
+        padding = b"\x00" * (-len(frame) % _FRAME_ALIGNMENT)
+        entries.append(
+            {
+                "name": name,
+                "encoding": encoding,
+                "dtype": _dtype_to_str(tensor.dtype),
+                "shape": list(tensor.shape),
+                "offset": offset,
+                "nbytes": len(frame),
+            }
+        )
+        frames.append(frame + padding)
+        offset += len(frame) + len(padding)
+
+    header = json.dumps(
+        {"version": version, "base_version": base_version, "keyframe": keyframe, "tensors": entries}
+    ).encode("utf-8")
+    return b"".join([struct.pack(_PREFIX_FORMAT, PARAMETER_UPDATE_MAGIC, len(header)), header, *frames])
+
+
+def decode_parameter_update_header(buffer: bytes) -> ParameterUpdateHeader | None:
+    """Parse the header of a parameter update, or return None if `buffer` is not a parameter update."""
+    if len(buffer) < _PREFIX_SIZE or buffer[: len(PARAMETER_UPDATE_MAGIC)] != PARAMETER_UPDATE_MAGIC:
+        return None
+    _, header_size = struct.unpack_from(_PREFIX_FORMAT, buffer)
+    header = json.loads(bytes(buffer[_PREFIX_SIZE : _PREFIX_SIZE + header_size]).decode("utf-8"))
+    return ParameterUpdateHeader(**header)
+
+
+def iter_parameter_update(buffer: bytes) -> Iterator[tuple[str, str, torch.Tensor]]:
+    """Lazily decode the tensors of a parameter update, one at a time, as `(name, encoding, tensor)`.
+
+    The yielded tensors are CPU views on a private copy of `buffer`.
+    """
+    header = decode_parameter_update_header(buffer)
+    if header is None:
+        raise ValueError("Buffer is not a parameter update")
+
+    _, header_size = struct.unpack_from(_PREFIX_FORMAT, buffer)
+    # torch.frombuffer needs a writable buffer, a single copy of the payload is cheaper than one per tensor
+    payload = bytearray(memoryview(buffer)[_PREFIX_SIZE + header_size :])
+    for entry in header.tensors:
+        dtype = _str_to_dtype(entry["dtype"])
+        if entry["nbytes"] == 0:
+            tensor = torch.empty(entry["shape"], dtype=dtype)
+        else:
+            count = entry["nbytes"] // torch.empty((), dtype=dtype).element_size()
+            tensor = torch.frombuffer(payload, dtype=dtype, count=count, offset=entry["offset"])
+            tensor = tensor.view(entry["shape"])
+        yield entry["name"], entry["encoding"], tensor
+
+
+def is_parameter_keyframe(buffer: bytes) -> bool:
+    """Whether `buffer` can be applied on its own. Payloads that are not parameter updates (e.g. a full state
+    dict) are self-contained and thus treated as keyframes."""
+    header = decode_parameter_update_header(buffer)
+    return header is None or header.keyframe
+
+
+def drop_superseded_updates(buffers: list[bytes]) -> list[bytes]:
+    """Keep the most recent keyframe and the updates that follow it. Updates preceding a keyframe are not
+    needed anymore."""
+    for i in range(len(buffers) - 1, -1, -1):
+        if is_parameter_keyframe(buffers[i]):
+            return buffers[i:]
+    return buffers
+
+
+class ParameterSender:
+    """Learner side of the parameter synchronisation.
+
+    Args:
+        modules: Modules to synchronise, keyed by a prefix shared with the `ParameterReceiver`.
+        wire_dtype: Optional floating point dtype ("float16", "bfloat16") used to transmit floating point
+            tensors. Defaults to the tensor dtype.
+        use_deltas: Whether non-keyframe updates carry the difference with the previous version.
+        keyframe_interval: Number of pushes between two keyframes. 0 disables periodic keyframes, in which
+            case only the first update is a keyframe.
+    """
+
+    def __init__(
+        self,
+        modules: dict[str, nn.Module],
+        wire_dtype: str | None = None,
+        use_deltas: bool = False,
+        keyframe_interval: int = 10,
+    ):
+        if wire_dtype is not None and wire_dtype not in WIRE_DTYPES:
+            raise ValueError(f"Unsupported wire dtype '{wire_dtype}'. Available: {list(WIRE_DTYPES)}")
+        if keyframe_interval < 0:
+            raise ValueError(f"keyframe_interval must be non-negative, got {keyframe_interval}")
+
+        self.modules = modules
+        self.wire_dtype = WIRE_DTYPES[wire_dtype] if wire_dtype is not None else None
+        self.use_deltas = use_deltas
+        self.keyframe_interval = keyframe_interval
+        self.version = -1
+        # Values currently held by the receivers (decoded, in the original dtype, on CPU)
+        self._sent: dict[str, torch.Tensor] = {}
+
+    def _to_wire(self, tensor: torch.Tensor) -> torch.Tensor:
+        if self.wire_dtype is not None and tensor.is_floating_point():
+            return tensor.to(self.wire_dtype)
+        return tensor
+
+    def encode_update(self) -> bytes:
+        """Encode the next parameter update."""
+        previous_version = self.version
+        self.version += 1
+        first_update = previous_version < 0
+        keyframe = first_update or (self.keyframe_interval > 0 and self.version % self.keyframe_interval == 0)
+
+        tensors = []
+        for name, tensor, frozen in _named_tensors(self.modules):
+            if frozen and not keyframe:
+                continue
+
+            value = tensor.detach().to("cpu")
+            sent = self._sent.get(name)
+            wire_value = self._to_wire(value)
+            decoded_value = wire_value.to(value.dtype)
+
+            if sent is not None and torch.equal(decoded_value, sent):
+                if not keyframe:
+                    continue
+            elif sent is not None and not keyframe and self.use_deltas and value.is_floating_point():
+                wire_delta = self._to_wire(value - sent)
+                tensors.append((name, ENCODING_DELTA, wire_delta))
+                self._sent[name] = sent + wire_delta.to(value.dtype)
+                continue
+
+            tensors.append((name, ENCODING_VALUE, wire_value))
+            self._sent[name] = decoded_value.clone()
+
+        base_version = None if keyframe else previous_version
+        logging.debug(
+            f"[LEARNER] Encoding parameter update v{self.version} with {len(tensors)} tensors "
+            f"(keyframe={keyframe})"
+        )
+        return encode_parameter_update(self.version, base_version, keyframe, tensors)
+
+
+class ParameterReceiver:
+    """Actor side of the parameter synchronisation. Tensors are copied in place into the parameters and
+    buffers of `modules`, no new storage is allocated on the device.
+
+    Args:
+        modules: Modules to synchronise, keyed by the same prefixes as the `ParameterSender`.
+    """
+
+    def __init__(self, modules: dict[str, nn.Module]):
+        self._targets = {name: tensor for name, tensor, _ in _named_tensors(modules)}
+        self.version = -1
+
+    def apply(self, buffer: bytes) -> bool:
+        """Apply a parameter update. Returns False if the update was skipped because it does not follow the
+        current version; the receiver then waits for the next keyframe."""
+        header = decode_parameter_update_header(buffer)
+        if header is None:
+            raise ValueError("Buffer is not a parameter update")
+
+        if not header.keyframe and header.base_version != self.version:
+            logging.warning(
+                f"[ACTOR] Skipping parameter update v{header.version}: based on v{header.base_version}, "
+                f"current version is v{self.version}. Waiting for the next keyframe."
+            )
+            return False
+
+        with torch.no_grad():
+            for name, encoding, tensor in iter_parameter_update(buffer):
+                target = self._targets.get(name)
+                if target is None:
+                    logging.warning(f"[ACTOR] Received unknown parameter '{name}', ignoring it")
+                    continue
+                if encoding == ENCODING_DELTA:
+                    target.add_(tensor.to(device=target.device, dtype=target.dtype))
+                else:
+                    target.copy_(tensor)
+
+        self.version = header.version
+        return True
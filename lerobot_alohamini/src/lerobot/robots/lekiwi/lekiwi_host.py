@@ -24,6 +24,8 @@ import cv2
 import draccus
 import zmq
 
+from lerobot.utils.robot_utils import RateScheduler
+
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
 
@@ -74,9 +76,10 @@ def main(cfg: LeKiwiServerConfig):
     try:
         # Business logic
         start = time.perf_counter()
+        scheduler = RateScheduler(host.max_loop_freq_hz)
+        scheduler.start()
         duration = 0
         while duration < host.connection_time_s:
-            loop_start_time = time.time()
             try:
                 msg = host.zmq_cmd_socket.recv_string(zmq.NOBLOCK)
                 data = dict(json.loads(msg))
@@ -115,10 +118,8 @@ def main(cfg: LeKiwiServerConfig):
             except zmq.Again:
                 logging.info("Dropping observation, no client connected")
 
-            # Ensure a short sleep to avoid overloading the CPU.
-            elapsed = time.time() - loop_start_time
-
-            time.sleep(max(1 / host.max_loop_freq_hz - elapsed, 0))
+            # Wait for the next tick, which also avoids overloading the CPU.
+            scheduler.sleep()
             duration = time.perf_counter() - start
         print("Cycle time reached.")
 
@@ -49,12 +49,13 @@ You can learn about the CLI options for this script in the `EvalPipelineConfig`
 import concurrent.futures as cf
 import json
 import logging
+import queue
 import threading
 import time
+import traceback
 from collections import defaultdict
 from collections.abc import Callable
 from contextlib import nullcontext
-from copy import deepcopy
 from dataclasses import asdict
 from functools import partial
 from pathlib import Path
@@ -65,6 +66,7 @@ import einops
 import gymnasium as gym
 import numpy as np
 import torch
+import torch.multiprocessing as mp
 from termcolor import colored
 from torch import Tensor, nn
 from tqdm import trange
@@ -92,6 +94,95 @@ from lerobot.utils.utils import (
 )
 
 
+class _TrajectoryBuffer:
+    """(batch, sequence, *) tensors filled in place step by step, instead of stacking lists of per-step tensors.
+
+    The sequence dimension grows geometrically up to `max_length`, so that short episodes don't pay for the
+    memory of `max_length` steps (which can be large for image observations).
+    """
+
+    def __init__(self, max_length: int, initial_length: int = 32):
+        self.max_length = max_length
+        self.initial_length = min(initial_length, max_length)
+        self.tensors: dict[str, Tensor] = {}
+        self.length = 0
+
+    def write(self, index: int, values: dict[str, Tensor]):
+        for key, value in values.items():
+            buffer = self.tensors.get(key)
+            if buffer is None:
+                buffer = torch.empty(
+                    (value.shape[0], self.initial_length, *value.shape[1:]),
+                    dtype=value.dtype,
+                    device=value.device,
+                )
+            elif index >= buffer.shape[1]:
+                grown = buffer.new_empty(
+                    (buffer.shape[0], min(2 * buffer.shape[1], self.max_length), *buffer.shape[2:])
+                )
+                grown[:, : buffer.shape[1]] = buffer
+                buffer = grown
+            buffer[:, index] = value
+            self.tensors[key] = buffer
+        self.length = max(self.length, index + 1)
+
+    def get(self) -> dict[str, Tensor]:
+        return {key: buffer[:, : self.length] for key, buffer in self.tensors.items()}
+
+
+class _EpisodeVideoWriter:
+    """Writes the videos of the rendered episodes from a background thread.
+
+    The rollout only renders the frames and hands them over with `add_frames`. Stacking the frames of each
+    episode and encoding its video happen in the writer thread, while the next rollouts run.
+    """
+
+    def __init__(self, fps: float):
+        self.fps = fps
+        self._queue: queue.Queue = queue.Queue()
+        self._frames: list[list[np.ndarray]] = []
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name="eval_video_writer", daemon=True)
+        self._thread.start()
+
+    def add_frames(self, frames: np.ndarray):
+        """Queue the (b, h, w, c) frames rendered for the b first environments at one step."""
+        self._queue.put(("frames", frames))
+
+    def write_episodes(self, video_paths: list[str], done_indices: list[int]):
+        """Queue the videos of the episodes rendered since the last call, the i-th one being made of the frames
+        of the i-th environment up to `done_indices[i]`."""
+        self._queue.put(("write", (video_paths, done_indices)))
+
+    def _run(self):
+        while (item := self._queue.get()) is not None:
+            kind, value = item
+            # After a failure, keep draining the queue so that the rollouts never block
+            if self._error is not None:
+                continue
+            try:
+                if kind == "frames":
+                    if not self._frames:
+                        self._frames = [[] for _ in range(len(value))]
+                    for env_frames, frame in zip(self._frames, value, strict=True):
+                        env_frames.append(frame)
+                else:
+                    for video_path, done_index, env_frames in zip(*value, self._frames, strict=False):
+                        # + 1 to capture the last observation
+                        write_video(video_path, np.stack(env_frames[: done_index + 1]), self.fps)
+                    self._frames = []
+            except Exception as e:
+                logging.error(f"Writing the eval videos failed: {e}")
+                self._error = e
+
+    def close(self):
+        """Wait for the queued videos to be written."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError("Writing the eval videos failed") from self._error
+
+
 def rollout(
     env: gym.vector.VectorEnv,
     policy: PreTrainedPolicy,
@@ -102,6 +193,7 @@ def rollout(
     seeds: list[int] | None = None,
     return_observations: bool = False,
     render_callback: Callable[[gym.vector.VectorEnv], None] | None = None,
+    image_device: torch.device | str | None = None,
 ) -> dict:
     """Run a batched policy rollout once through a batch of environments.
 
@@ -131,6 +223,9 @@ def rollout(
             are returned optionally because they typically take more memory to cache. Defaults to False.
         render_callback: Optional rendering callback to be used after the environments are reset, and after
             every step.
+        image_device: If provided, camera images are transferred to this device (usually the policy device)
+            as uint8 and converted to float32 there, see `preprocess_observation`. Ignored when
+            `return_observations` is True, since the observations are then kept on the CPU.
     Returns:
         The dictionary described above.
     """
@@ -142,16 +237,16 @@ def rollout(
     if render_callback is not None:
         render_callback(env)
 
-    all_observations = []
-    all_actions = []
-    all_rewards = []
-    all_successes = []
-    all_dones = []
-
     step = 0
     # Keep track of which environments are done.
     done = np.array([False] * env.num_envs)
     max_steps = env.call("_max_episode_steps")[0]
+    trajectory = _TrajectoryBuffer(max_steps, initial_length=max_steps)
+    observations = _TrajectoryBuffer(max_steps + 1) if return_observations else None
+    ever_succeeded = np.zeros(env.num_envs, dtype=bool)
+    tasks = None
+    if return_observations:
+        image_device = None
     progbar = trange(
         max_steps,
         desc=f"Running rollout with at most {max_steps} steps",
@@ -161,13 +256,17 @@ def rollout(
     check_env_attributes_and_types(env)
     while not np.all(done) and step < max_steps:
         # Numpy array to tensor and changing dictionary keys to LeRobot policy format.
-        observation = preprocess_observation(observation)
-        if return_observations:
-            all_observations.append(deepcopy(observation))
-
-        # Infer "task" from attributes of environments.
-        # TODO: works with SyncVectorEnv but not AsyncVectorEnv
-        observation = add_envs_task(env, observation)
+        observation = preprocess_observation(observation, image_device=image_device)
+        if observations is not None:
+            # Copied into the buffer, the following steps don't modify the recorded tensors
+            observations.write(step, observation)
+
+        # Infer "task" from attributes of environments. It doesn't change during a rollout, so it is only
+        # queried at the first step.
+        # TODO: `add_envs_task` inspects `env.envs`, which only exists on SyncVectorEnv
+        if tasks is None:
+            tasks = add_envs_task(env, observation)["task"]
+        observation["task"] = tasks
 
         # Apply environment-specific preprocessing (e.g., LiberoProcessorStep for LIBERO)
         observation = env_preprocessor(observation)
@@ -187,6 +286,7 @@ def rollout(
 
         # Apply the next action.
         observation, reward, terminated, truncated, info = env.step(action_numpy)
+        trajectory.write(step, {ACTION: torch.from_numpy(action_numpy)})
         if render_callback is not None:
             render_callback(env)
 
@@ -199,9 +299,9 @@ def rollout(
                     "Unsupported `final_info` format: expected dict (Gymnasium >= 1.0). "
                     "You're likely using an older version of gymnasium (< 1.0). Please upgrade."
                 )
-            successes = final_info["is_success"].tolist()
+            successes = np.asarray(final_info["is_success"], dtype=bool)
         else:
-            successes = [False] * env.num_envs
+            successes = np.zeros(env.num_envs, dtype=bool)
 
         # Keep track of which environments are done so far.
         # Mark the episode as done if we reach the maximum step limit.
@@ -211,35 +311,27 @@ def rollout(
         if step + 1 == max_steps:
             done = np.ones_like(done, dtype=bool)
 
-        all_actions.append(torch.from_numpy(action_numpy))
-        all_rewards.append(torch.from_numpy(reward))
-        all_dones.append(torch.from_numpy(done))
-        all_successes.append(torch.tensor(successes))
+        trajectory.write(
+            step,
+            {
+                "reward": torch.from_numpy(reward),
+                "done": torch.from_numpy(done),
+                "success": torch.from_numpy(successes),
+            },
+        )
 
         step += 1
-        running_success_rate = (
-            einops.reduce(torch.stack(all_successes, dim=1), "b n -> b", "any").numpy().mean()
-        )
-        progbar.set_postfix({"running_success_rate": f"{running_success_rate.item() * 100:.1f}%"})
+        ever_succeeded |= successes
+        progbar.set_postfix({"running_success_rate": f"{ever_succeeded.mean().item() * 100:.1f}%"})
         progbar.update()
 
     # Track the final observation.
-    if return_observations:
-        observation = preprocess_observation(observation)
-        all_observations.append(deepcopy(observation))
-
-    # Stack the sequence along the first dimension so that we have (batch, sequence, *) tensors.
-    ret = {
-        ACTION: torch.stack(all_actions, dim=1),
-        "reward": torch.stack(all_rewards, dim=1),
-        "success": torch.stack(all_successes, dim=1),
-        "done": torch.stack(all_dones, dim=1),
-    }
-    if return_observations:
-        stacked_observations = {}
-        for key in all_observations[0]:
-            stacked_observations[key] = torch.stack([obs[key] for obs in all_observations], dim=1)
-        ret[OBS_STR] = stacked_observations
+    if observations is not None:
+        observations.write(step, preprocess_observation(observation))
+
+    ret = trajectory.get()
+    if observations is not None:
+        ret[OBS_STR] = observations.get()
 
     if hasattr(policy, "use_original_modules"):
         policy.use_original_modules()
@@ -259,6 +351,7 @@ def eval_policy(
     videos_dir: Path | None = None,
     return_episode_data: bool = False,
     start_seed: int | None = None,
+    image_device: torch.device | str | None = None,
 ) -> dict:
     """
     Args:
@@ -271,6 +364,7 @@ def eval_policy(
             the "episodes" key of the returned dictionary.
         start_seed: The first seed to use for the first individual rollout. For all subsequent rollouts the
             seed is incremented by 1. If not provided, the environments are not manually seeded.
+        image_device: Device the camera images are transferred to as uint8, see `rollout`.
     Returns:
         Dictionary with metrics and data regarding the rollouts.
     """
@@ -294,23 +388,23 @@ def eval_policy(
     max_rewards = []
     all_successes = []
     all_seeds = []
-    threads = []  # for video saving threads
     n_episodes_rendered = 0  # for saving the correct number of videos
 
-    # Callback for visualization.
+    # Callback for visualization. Rendering has to happen in this thread, where the simulators live, the videos
+    # are written by `video_writer`.
     def render_frame(env: gym.vector.VectorEnv):
-        # noqa: B023
         if n_episodes_rendered >= max_episodes_rendered:
             return
         n_to_render_now = min(max_episodes_rendered - n_episodes_rendered, env.num_envs)
         if isinstance(env, gym.vector.SyncVectorEnv):
-            ep_frames.append(np.stack([env.envs[i].render() for i in range(n_to_render_now)]))  # noqa: B023
+            video_writer.add_frames(np.stack([env.envs[i].render() for i in range(n_to_render_now)]))
         elif isinstance(env, gym.vector.AsyncVectorEnv):
             # Here we must render all frames and discard any we don't need.
-            ep_frames.append(np.stack(env.call("render")[:n_to_render_now]))
+            video_writer.add_frames(np.stack(env.call("render")[:n_to_render_now]))
 
     if max_episodes_rendered > 0:
         video_paths: list[str] = []
+        video_writer = _EpisodeVideoWriter(fps=env.unwrapped.metadata["render_fps"])
 
     if return_episode_data:
         episode_data: dict | None = None
@@ -318,11 +412,7 @@ def eval_policy(
     # we dont want progress bar when we use slurm, since it clutters the logs
     progbar = trange(n_batches, desc="Stepping through eval batches", disable=inside_slurm())
     for batch_ix in progbar:
-        # Cache frames for rendering videos. Each item will be (b, h, w, c), and the list indexes the rollout
-        # step.
-        if max_episodes_rendered > 0:
-            ep_frames: list[np.ndarray] = []
-
+        rendering = n_episodes_rendered < max_episodes_rendered
         if start_seed is None:
             seeds = None
         else:
@@ -339,6 +429,7 @@ def eval_policy(
             seeds=list(seeds) if seeds else None,
             return_observations=return_episode_data,
             render_callback=render_frame if max_episodes_rendered > 0 else None,
+            image_device=image_device,
         )
 
         # Figure out where in each rollout sequence the first done condition was encountered (results after
@@ -381,36 +472,24 @@ def eval_policy(
                 episode_data = {k: torch.cat([episode_data[k], this_episode_data[k]]) for k in episode_data}
 
         # Maybe render video for visualization.
-        if max_episodes_rendered > 0 and len(ep_frames) > 0:
-            batch_stacked_frames = np.stack(ep_frames, axis=1)  # (b, t, *)
-            for stacked_frames, done_index in zip(
-                batch_stacked_frames, done_indices.flatten().tolist(), strict=False
-            ):
-                if n_episodes_rendered >= max_episodes_rendered:
-                    break
-
-                videos_dir.mkdir(parents=True, exist_ok=True)
-                video_path = videos_dir / f"eval_episode_{n_episodes_rendered}.mp4"
-                video_paths.append(str(video_path))
-                thread = threading.Thread(
-                    target=write_video,
-                    args=(
-                        str(video_path),
-                        stacked_frames[: done_index + 1],  # + 1 to capture the last observation
-                        env.unwrapped.metadata["render_fps"],
-                    ),
-                )
-                thread.start()
-                threads.append(thread)
-                n_episodes_rendered += 1
+        if rendering:
+            n_to_render_now = min(max_episodes_rendered - n_episodes_rendered, env.num_envs)
+            videos_dir.mkdir(parents=True, exist_ok=True)
+            batch_video_paths = [
+                str(videos_dir / f"eval_episode_{n_episodes_rendered + i}.mp4")
+                for i in range(n_to_render_now)
+            ]
+            video_writer.write_episodes(batch_video_paths, done_indices.flatten().tolist()[:n_to_render_now])
+            video_paths.extend(batch_video_paths)
+            n_episodes_rendered += n_to_render_now
 
         progbar.set_postfix(
             {"running_success_rate": f"{np.mean(all_successes[:n_episodes]).item() * 100:.1f}%"}
         )
 
-    # Wait till all video rendering threads are done.
-    for thread in threads:
-        thread.join()
+    # Wait till all videos are written.
+    if max_episodes_rendered > 0:
+        video_writer.close()
 
     # Compile eval info.
     info = {
@@ -495,6 +574,32 @@ def _compile_episode_data(
     return data_dict
 
 
+def make_eval_processors(
+    cfg: EvalPipelineConfig, policy: PreTrainedPolicy
+) -> tuple[
+    PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+]:
+    """Returns the policy preprocessor and postprocessor, and the environment preprocessor and postprocessor."""
+    # The inference device is automatically set to match the detected hardware, overriding any previous device settings from training to ensure compatibility.
+    preprocessor_overrides = {
+        "device_processor": {"device": str(policy.config.device)},
+        "rename_observations_processor": {"rename_map": cfg.rename_map},
+    }
+
+    preprocessor, postprocessor = make_pre_post_processors(
+        policy_cfg=cfg.policy,
+        pretrained_path=cfg.policy.pretrained_path,
+        preprocessor_overrides=preprocessor_overrides,
+    )
+
+    # Create environment-specific preprocessor and postprocessor (e.g., for LIBERO environments)
+    env_preprocessor, env_postprocessor = make_env_pre_post_processors(env_cfg=cfg.env, policy_cfg=cfg.policy)
+    return preprocessor, postprocessor, env_preprocessor, env_postprocessor
+
+
 @parser.wrap()
 def eval_main(cfg: EvalPipelineConfig):
     logging.info(pformat(asdict(cfg)))
@@ -511,54 +616,60 @@ def eval_main(cfg: EvalPipelineConfig):
     logging.info("Making environment.")
     envs = make_env(cfg.env, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
 
-    logging.info("Making policy.")
-
-    policy = make_policy(
-        cfg=cfg.policy,
-        env_cfg=cfg.env,
-        rename_map=cfg.rename_map,
-    )
-
-    policy.eval()
-
-    # The inference device is automatically set to match the detected hardware, overriding any previous device settings from training to ensure compatibility.
-    preprocessor_overrides = {
-        "device_processor": {"device": str(policy.config.device)},
-        "rename_observations_processor": {"rename_map": cfg.rename_map},
-    }
-
-    preprocessor, postprocessor = make_pre_post_processors(
-        policy_cfg=cfg.policy,
-        pretrained_path=cfg.policy.pretrained_path,
-        preprocessor_overrides=preprocessor_overrides,
-    )
-
-    # Create environment-specific preprocessor and postprocessor (e.g., for LIBERO environments)
-    env_preprocessor, env_postprocessor = make_env_pre_post_processors(env_cfg=cfg.env, policy_cfg=cfg.policy)
-
-    with torch.no_grad(), torch.autocast(device_type=device.type) if cfg.policy.use_amp else nullcontext():
-        info = eval_policy_all(
-            envs=envs,
-            policy=policy,
-            env_preprocessor=env_preprocessor,
-            env_postprocessor=env_postprocessor,
-            preprocessor=preprocessor,
-            postprocessor=postprocessor,
+    if cfg.eval.num_workers > 0:
+        # The workers make their own environments, they are only needed here to list the tasks
+        tasks = [(task_group, task_id) for task_group, group in envs.items() for task_id in group]
+        close_envs(envs)
+        info = eval_policy_all_multiprocess(
+            cfg,
+            tasks,
+            num_workers=cfg.eval.num_workers,
             n_episodes=cfg.eval.n_episodes,
             max_episodes_rendered=10,
             videos_dir=Path(cfg.output_dir) / "videos",
-            start_seed=cfg.seed,
-            max_parallel_tasks=cfg.env.max_parallel_tasks,
+            results_path=Path(cfg.output_dir) / EVAL_RESULTS_PATH,
         )
-        print("Overall Aggregated Metrics:")
-        print(info["overall"])
-
-        # Print per-suite stats
-        for task_group, task_group_info in info.items():
-            print(f"\nAggregated Metrics for {task_group}:")
-            print(task_group_info)
-    # Close all vec envs
-    close_envs(envs)
+    else:
+        logging.info("Making policy.")
+
+        policy = make_policy(
+            cfg=cfg.policy,
+            env_cfg=cfg.env,
+            rename_map=cfg.rename_map,
+        )
+
+        policy.eval()
+
+        preprocessor, postprocessor, env_preprocessor, env_postprocessor = make_eval_processors(cfg, policy)
+
+        with (
+            torch.no_grad(),
+            torch.autocast(device_type=device.type) if cfg.policy.use_amp else nullcontext(),
+        ):
+            info = eval_policy_all(
+                envs=envs,
+                policy=policy,
+                env_preprocessor=env_preprocessor,
+                env_postprocessor=env_postprocessor,
+                preprocessor=preprocessor,
+                postprocessor=postprocessor,
+                n_episodes=cfg.eval.n_episodes,
+                max_episodes_rendered=10,
+                videos_dir=Path(cfg.output_dir) / "videos",
+                start_seed=cfg.seed,
+                max_parallel_tasks=cfg.env.max_parallel_tasks,
+                image_device=device if cfg.eval.uint8_image_transfer else None,
+            )
+        # Close all vec envs
+        close_envs(envs)
+
+    print("Overall Aggregated Metrics:")
+    print(info["overall"])
+
+    # Print per-suite stats
+    for task_group, task_group_info in info.items():
+        print(f"\nAggregated Metrics for {task_group}:")
+        print(task_group_info)
 
     # Save info
     with open(Path(cfg.output_dir) / "eval_info.json", "w") as f:
@@ -591,6 +702,7 @@ def eval_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    image_device: torch.device | str | None = None,
 ) -> TaskMetrics:
     """Evaluates one task_id of one suite using the provided vec env."""
 
@@ -608,6 +720,7 @@ def eval_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        image_device=image_device,
     )
 
     per_episode = task_result["per_episode"]
@@ -634,6 +747,7 @@ def run_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    image_device: torch.device | str | None = None,
 ):
     """
     Run eval_one for a single (task_group, task_id, env).
@@ -658,6 +772,7 @@ def run_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        image_device=image_device,
     )
     # ensure we always provide video_paths key to simplify accumulation
     if max_episodes_rendered > 0:
@@ -679,6 +794,7 @@ def eval_policy_all(
     return_episode_data: bool = False,
     start_seed: int | None = None,
     max_parallel_tasks: int = 1,
+    image_device: torch.device | str | None = None,
 ) -> dict:
     """
     Evaluate a nested `envs` dict: {task_group: {task_id: vec_env}}.
@@ -692,35 +808,8 @@ def eval_policy_all(
     # Flatten envs into list of (task_group, task_id, env)
     tasks = [(tg, tid, vec) for tg, group in envs.items() for tid, vec in group.items()]
 
-    # accumulators: track metrics at both per-group level and across all groups
-    group_acc: dict[str, dict[str, list]] = defaultdict(lambda: {k: [] for k in ACC_KEYS})
-    overall: dict[str, list] = {k: [] for k in ACC_KEYS}
     per_task_infos: list[dict] = []
 
-    # small inline helper to accumulate one task's metrics into accumulators
-    def _accumulate_to(group: str, metrics: dict):
-        # metrics expected to contain 'sum_rewards', 'max_rewards', 'successes', optionally 'video_paths'
-        # but eval_one may store per-episode lists; we assume metrics uses scalars averaged per task as before.
-        # To be robust, accept scalars or lists.
-        def _append(key, value):
-            if value is None:
-                return
-            if isinstance(value, list):
-                group_acc[group][key].extend(value)
-                overall[key].extend(value)
-            else:
-                group_acc[group][key].append(value)
-                overall[key].append(value)
-
-        _append("sum_rewards", metrics.get("sum_rewards"))
-        _append("max_rewards", metrics.get("max_rewards"))
-        _append("successes", metrics.get("successes"))
-        # video_paths is list-like
-        paths = metrics.get("video_paths", [])
-        if paths:
-            group_acc[group]["video_paths"].extend(paths)
-            overall["video_paths"].extend(paths)
-
     # Choose runner (sequential vs threaded)
     task_runner = partial(
         run_one,
@@ -734,6 +823,7 @@ def eval_policy_all(
         videos_dir=videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        image_device=image_device,
     )
 
     if max_parallel_tasks <= 1:
@@ -741,7 +831,6 @@ def eval_policy_all(
         # NOTE: keeping a single-threaded accumulator avoids concurrent list appends or locks
         for task_group, task_id, env in tasks:
             tg, tid, metrics = task_runner(task_group, task_id, env)
-            _accumulate_to(tg, metrics)
             per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
     else:
         # threaded path: submit all tasks, consume completions on main thread and accumulate there
@@ -752,9 +841,48 @@ def eval_policy_all(
                 fut2meta[fut] = (task_group, task_id)
             for fut in cf.as_completed(fut2meta):
                 tg, tid, metrics = fut.result()
-                _accumulate_to(tg, metrics)
                 per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
 
+    return aggregate_task_metrics(per_task_infos, start_t)
+
+
+def aggregate_task_metrics(per_task_infos: list[dict], start_t: float) -> dict:
+    """
+    Accumulates the metrics of `per_task_infos` ({"task_group", "task_id", "metrics"} dicts) into per-group
+    and overall statistics, with the same aggregate metrics schema as the single-env evaluator
+    (avg_sum_reward / avg_max_reward / pc_success / timings) plus per-task infos.
+    """
+    # accumulators: track metrics at both per-group level and across all groups
+    group_acc: dict[str, dict[str, list]] = defaultdict(lambda: {k: [] for k in ACC_KEYS})
+    overall: dict[str, list] = {k: [] for k in ACC_KEYS}
+
+    # small inline helper to accumulate one task's metrics into accumulators
+    def _accumulate_to(group: str, metrics: dict):
+        # metrics expected to contain 'sum_rewards', 'max_rewards', 'successes', optionally 'video_paths'
+        # but eval_one may store per-episode lists; we assume metrics uses scalars averaged per task as before.
+        # To be robust, accept scalars or lists.
+        def _append(key, value):
+            if value is None:
+                return
+            if isinstance(value, list):
+                group_acc[group][key].extend(value)
+                overall[key].extend(value)
+            else:
+                group_acc[group][key].append(value)
+                overall[key].append(value)
+
+        _append("sum_rewards", metrics.get("sum_rewards"))
+        _append("max_rewards", metrics.get("max_rewards"))
+        _append("successes", metrics.get("successes"))
+        # video_paths is list-like
+        paths = metrics.get("video_paths", [])
+        if paths:
+            group_acc[group]["video_paths"].extend(paths)
+            overall["video_paths"].extend(paths)
+
+    for task_info in per_task_infos:
+        _accumulate_to(task_info["task_group"], task_info["metrics"])
+
     # compute aggregated metrics helper (robust to lists/scalars)
     def _agg_from_list(xs):
         if not xs:
@@ -791,6 +919,234 @@ def eval_policy_all(
     }
 
 
+# ---- process-parallel evaluation, sharded by task and episodes ----
+EVAL_RESULTS_PATH = "eval_results.jsonl"
+
+
+def make_task_env(cfg: EvalPipelineConfig, task_group: str, task_id: int) -> gym.vector.VectorEnv:
+    """Makes the vec env of a single (task_group, task_id), without building the other tasks of the suite."""
+    env_cfg = cfg.env
+    if "libero" in env_cfg.type:
+        from lerobot.envs.libero import create_libero_envs
+
+        envs = create_libero_envs(
+            task=task_group,
+            n_envs=cfg.eval.batch_size,
+            gym_kwargs={**env_cfg.gym_kwargs, "task_ids": [task_id]},
+            camera_name=env_cfg.camera_name,
+            init_states=env_cfg.init_states,
+            env_cls=gym.vector.AsyncVectorEnv if cfg.eval.use_async_envs else gym.vector.SyncVectorEnv,
+            control_mode=env_cfg.control_mode,
+            episode_length=env_cfg.episode_length,
+        )
+    else:
+        envs = make_env(env_cfg, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
+    env = envs[task_group].pop(task_id)
+    close_envs(envs)
+    return env
+
+
+def load_eval_results(path: Path) -> list[dict]:
+    """Loads the shard results saved by `eval_policy_all_multiprocess`. A truncated last line, left by an
+    interrupted evaluation, is ignored."""
+    if not path.exists():
+        return []
+    results = []
+    with open(path) as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                logging.warning(f"Ignoring malformed line in {path}")
+    return results
+
+
+def merge_shard_results(shard_results: list[dict]) -> list[dict]:
+    """Merges the shard results of each task, in episode order, into per-task infos."""
+    per_task: dict[tuple[str, int], list[dict]] = defaultdict(list)
+    for result in shard_results:
+        per_task[(result["task_group"], result["task_id"])].append(result)
+
+    per_task_infos = []
+    for (task_group, task_id), results in sorted(per_task.items()):
+        metrics = TaskMetrics(sum_rewards=[], max_rewards=[], successes=[], video_paths=[])
+        for result in sorted(results, key=lambda r: r["episode_start"]):
+            for key in ACC_KEYS:
+                metrics[key].extend(result["metrics"].get(key, []))
+        per_task_infos.append({"task_group": task_group, "task_id": task_id, "metrics": metrics})
+    return per_task_infos
+
+
+def _eval_worker(
+    cfg: EvalPipelineConfig,
+    policy: PreTrainedPolicy | None,
+    work_queue,
+    result_queue,
+    max_episodes_rendered: int,
+    videos_dir: Path | None,
+):
+    """Evaluates the (task_group, task_id, episode_start, n_episodes) work items of `work_queue` until it
+    receives None. The policy and the env of the current task are only made once."""
+    init_logging()
+    register_third_party_plugins()
+    set_seed(cfg.seed)
+    device = get_safe_torch_device(cfg.policy.device)
+
+    if policy is None:
+        policy = make_policy(cfg=cfg.policy, env_cfg=cfg.env, rename_map=cfg.rename_map)
+        policy.eval()
+    preprocessor, postprocessor, env_preprocessor, env_postprocessor = make_eval_processors(cfg, policy)
+
+    env_key, env = None, None
+    try:
+        while (item := work_queue.get()) is not None:
+            task_group, task_id, episode_start, n_episodes = item
+            try:
+                if env_key != (task_group, task_id):
+                    if env is not None:
+                        env.close()
+                    env_key, env = (task_group, task_id), make_task_env(cfg, task_group, task_id)
+
+                task_videos_dir = None
+                n_rendered = max(0, min(n_episodes, max_episodes_rendered - episode_start))
+                if videos_dir is not None and n_rendered > 0:
+                    task_videos_dir = videos_dir / f"{task_group}_{task_id}" / f"episodes_{episode_start}"
+                    task_videos_dir.mkdir(parents=True, exist_ok=True)
+
+                with (
+                    torch.no_grad(),
+                    torch.autocast(device_type=device.type) if cfg.policy.use_amp else nullcontext(),
+                ):
+                    metrics = eval_one(
+                        env,
+                        policy=policy,
+                        env_preprocessor=env_preprocessor,
+                        env_postprocessor=env_postprocessor,
+                        preprocessor=preprocessor,
+                        postprocessor=postprocessor,
+                        n_episodes=n_episodes,
+                        max_episodes_rendered=n_rendered,
+                        videos_dir=task_videos_dir,
+                        return_episode_data=False,
+                        start_seed=None if cfg.seed is None else cfg.seed + episode_start,
+                        image_device=device if cfg.eval.uint8_image_transfer else None,
+                    )
+                result_queue.put(
+                    {
+                        "task_group": task_group,
+                        "task_id": task_id,
+                        "episode_start": episode_start,
+                        "metrics": dict(metrics),
+                    }
+                )
+            except Exception:
+                result_queue.put({"item": item, "error": traceback.format_exc()})
+    finally:
+        if env is not None:
+            env.close()
+
+
+def eval_policy_all_multiprocess(
+    cfg: EvalPipelineConfig,
+    tasks: list[tuple[str, int]],
+    num_workers: int,
+    n_episodes: int,
+    *,
+    max_episodes_rendered: int = 0,
+    videos_dir: Path | None = None,
+    results_path: Path,
+) -> dict:
+    """
+    Evaluates `tasks` in `num_workers` processes. Each task is split into shards of `cfg.eval.batch_size`
+    episodes, which are spread over the workers. Every worker loads the policy once (on CPU, the weights
+    are loaded by the main process and shared with the workers) and keeps the env of its current task.
+
+    The result of each shard is appended to `results_path` as soon as it is received, so that a relaunched
+    evaluation only runs the shards which are missing. Shards are seeded by their first episode, which makes
+    the results independent of the number of workers and of the order in which the shards ran.
+    """
+    start_t = time.time()
+    batch_size = cfg.eval.batch_size
+    work_items = [
+        (task_group, task_id, episode_start, min(batch_size, n_episodes - episode_start))
+        for task_group, task_id in tasks
+        for episode_start in range(0, n_episodes, batch_size)
+    ]
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    wanted = {item[:3] for item in work_items}
+    shard_results = [
+        r
+        for r in load_eval_results(results_path)
+        if (r["task_group"], r["task_id"], r["episode_start"]) in wanted
+    ]
+    done = {(r["task_group"], r["task_id"], r["episode_start"]) for r in shard_results}
+    todo = [item for item in work_items if item[:3] not in done]
+    if done:
+        logging.info(f"Resuming evaluation: {len(done)}/{len(work_items)} shards already in {results_path}")
+
+    if todo:
+        shared_policy = None
+        if get_safe_torch_device(cfg.policy.device).type == "cpu":
+            shared_policy = make_policy(cfg=cfg.policy, env_cfg=cfg.env, rename_map=cfg.rename_map)
+            shared_policy.eval()
+            shared_policy.share_memory()
+
+        # Workers use CUDA and their own subprocesses (async envs), which rules out fork and daemon processes
+        ctx = mp.get_context("spawn")
+        work_queue = ctx.Queue()
+        result_queue = ctx.Queue()
+        for item in todo:
+            work_queue.put(item)
+        num_workers = min(num_workers, len(todo))
+        for _ in range(num_workers):
+            work_queue.put(None)
+
+        workers = [
+            ctx.Process(
+                target=_eval_worker,
+                args=(cfg, shared_policy, work_queue, result_queue, max_episodes_rendered, videos_dir),
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        errors = []
+        remaining = len(todo)
+        try:
+            with open(results_path, "a") as f:
+                while remaining > 0:
+                    try:
+                        result = result_queue.get(timeout=1.0)
+                    except queue.Empty:
+                        if not any(worker.is_alive() for worker in workers):
+                            break
+                        continue
+                    remaining -= 1
+                    if "error" in result:
+                        logging.error(f"Evaluation of {result['item']} failed:\n{result['error']}")
+                        errors.append(result["item"])
+                        continue
+                    f.write(json.dumps(result) + "\n")
+                    f.flush()
+                    shard_results.append(result)
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+        if errors or remaining > 0:
+            raise RuntimeError(
+                f"{len(errors) + remaining} of {len(todo)} evaluation shards did not complete. "
+                f"Relaunch with the same `output_dir` to resume from {results_path}."
+            )
+
+    return aggregate_task_metrics(merge_shard_results(shard_results), start_t)
+
+
 def main():
     init_logging()
     register_third_party_plugins()
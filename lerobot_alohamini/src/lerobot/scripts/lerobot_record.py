@@ -113,20 +113,21 @@ from lerobot.teleoperators import (  # noqa: F401
 from lerobot.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop
 from lerobot.utils.constants import ACTION, OBS_STR
 from lerobot.utils.control_utils import (
+    PolicyInferenceSession,
     init_keyboard_listener,
     is_headless,
-    predict_action,
     sanity_check_dataset_name,
     sanity_check_dataset_robot_compatibility,
 )
 from lerobot.utils.import_utils import register_third_party_plugins
-from lerobot.utils.robot_utils import precise_sleep
+from lerobot.utils.recording_utils import FrameConsumer, LoopTimingStats, append_recording_stats
+from lerobot.utils.robot_utils import RateScheduler
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
     log_say,
 )
-from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
+from lerobot.utils.visualization_utils import RerunSink, init_rerun
 
 
 @dataclass
@@ -181,6 +182,9 @@ class RecordConfig:
     teleop: TeleoperatorConfig | None = None
     # Whether to control the robot with a policy
     policy: PreTrainedConfig | None = None
+    # Compile the policy with `torch.compile` using this mode (e.g. "default", or "reduce-overhead" to use CUDA
+    # graphs). The compilation happens during the first steps of the first episode.
+    policy_compile_mode: str | None = None
     # Display all cameras on screen
     display_data: bool = False
     # Use vocal synthesis to read events.
@@ -229,9 +233,12 @@ class RecordConfig:
                                V
                     [ robot.send_action() ] -- (Robot Executes)
                                V
-                    ( Save to Dataset )
-                               V
-                  ( Rerun Log / Loop Wait )
+                          ( Loop Wait )
+
+     The control thread only observes, acts and measures its timing. Frames are handed over through bounded
+     queues to consumer threads:
+        ( Save to Dataset ) - waits for a free spot, frames are never dropped
+        ( Rerun Log )       - skips frames when the viewer can't keep up
 """
 
 
@@ -257,7 +264,13 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+    inference_session: PolicyInferenceSession | None = None,
+) -> LoopTimingStats:
+    """Run the control loop for `control_time_s` seconds and return its timing stats.
+
+    When a policy is given, actions are predicted with `inference_session`. Pass a session built once per
+    policy to reuse its buffers (and compiled policy) across episodes, one is built otherwise.
+    """
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
@@ -290,12 +303,93 @@ def record_loop(
 
     # Reset policy and processor if they are provided
     if policy is not None and preprocessor is not None and postprocessor is not None:
-        policy.reset()
-        preprocessor.reset()
-        postprocessor.reset()
+        if inference_session is None:
+            inference_session = PolicyInferenceSession(
+                policy=policy,
+                preprocessor=preprocessor,
+                postprocessor=postprocessor,
+                device=get_safe_torch_device(policy.config.device),
+                use_amp=policy.config.use_amp,
+            )
+        inference_session.reset()
+    else:
+        inference_session = None
+
+    # Up to 2 seconds of frames can wait to be validated and written, so that a slow disk doesn't slow down
+    # the control loop
+    dataset_writer = (
+        FrameConsumer(dataset.add_frame, name="dataset_writer", maxsize=max(1, 2 * fps))
+        if dataset is not None
+        else None
+    )
+    rerun_sink = RerunSink() if display_data else None
+    timing_stats = LoopTimingStats(fps=fps)
+
+    try:
+        _run_record_loop(
+            robot=robot,
+            events=events,
+            fps=fps,
+            teleop_action_processor=teleop_action_processor,
+            robot_action_processor=robot_action_processor,
+            robot_observation_processor=robot_observation_processor,
+            dataset=dataset,
+            teleop=teleop,
+            teleop_arm=teleop_arm,
+            teleop_keyboard=teleop_keyboard,
+            policy=policy,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            control_time_s=control_time_s,
+            single_task=single_task,
+            inference_session=inference_session,
+            dataset_writer=dataset_writer,
+            rerun_sink=rerun_sink,
+            timing_stats=timing_stats,
+        )
+    finally:
+        # Make sure every frame reached the dataset before the episode is saved
+        for consumer in (rerun_sink, dataset_writer):
+            if consumer is not None:
+                consumer.close()
+
+    if rerun_sink is not None:
+        timing_stats.num_dropped_display_frames = rerun_sink.num_dropped
+    if timing_stats.num_overruns > 0:
+        logging.warning(
+            f"Control loop overran {timing_stats.num_overruns} times and dropped "
+            f"{timing_stats.num_dropped_frames} frames at {fps} fps"
+        )
+    return timing_stats
 
+
+def _run_record_loop(
+    robot: Robot,
+    events: dict,
+    fps: int,
+    teleop_action_processor: RobotProcessorPipeline[tuple[RobotAction, RobotObservation], RobotAction],
+    robot_action_processor: RobotProcessorPipeline[tuple[RobotAction, RobotObservation], RobotAction],
+    robot_observation_processor: RobotProcessorPipeline[RobotObservation, RobotObservation],
+    dataset: LeRobotDataset | None,
+    teleop: Teleoperator | list[Teleoperator] | None,
+    teleop_arm: Teleoperator | None,
+    teleop_keyboard: KeyboardTeleop | None,
+    policy: PreTrainedPolicy | None,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]] | None,
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction] | None,
+    control_time_s: int | None,
+    single_task: str | None,
+    inference_session: PolicyInferenceSession | None,
+    dataset_writer: FrameConsumer | None,
+    rerun_sink: RerunSink | None,
+    timing_stats: LoopTimingStats,
+):
+    """Control thread of `record_loop`: observe, act, hand the frames over to the consumers and keep the rate."""
+    scheduler = RateScheduler(fps)
     timestamp = 0
     start_episode_t = time.perf_counter()
+    scheduler.start()
+    previous_loop_t = None
     while timestamp < control_time_s:
         start_loop_t = time.perf_counter()
 
@@ -313,16 +407,9 @@ def record_loop(
             observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix=OBS_STR)
 
         # Get action from either policy or teleop
-        if policy is not None and preprocessor is not None and postprocessor is not None:
-            action_values = predict_action(
-                observation=observation_frame,
-                policy=policy,
-                device=get_safe_torch_device(policy.config.device),
-                preprocessor=preprocessor,
-                postprocessor=postprocessor,
-                use_amp=policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
+        if inference_session is not None:
+            action_values = inference_session(
+                observation_frame, task=single_task, robot_type=robot.robot_type
             )
 
             act_processed_policy: RobotAction = make_robot_action(action_values, dataset.features)
@@ -364,16 +451,20 @@ def record_loop(
         _sent_action = robot.send_action(robot_action_to_send)
 
         # Write to dataset
-        if dataset is not None:
+        if dataset_writer is not None:
             action_frame = build_dataset_frame(dataset.features, action_values, prefix=ACTION)
             frame = {**observation_frame, **action_frame, "task": single_task}
-            dataset.add_frame(frame)
+            dataset_writer.put(frame)
 
-        if display_data:
-            log_rerun_data(observation=obs_processed, action=action_values)
+        if rerun_sink is not None:
+            rerun_sink.log(observation=obs_processed, action=action_values)
 
         dt_s = time.perf_counter() - start_loop_t
-        precise_sleep(1 / fps - dt_s)
+        timing_stats.record_iteration(
+            busy_s=dt_s, period_s=None if previous_loop_t is None else start_loop_t - previous_loop_t
+        )
+        previous_loop_t = start_loop_t
+        scheduler.sleep()
 
         timestamp = time.perf_counter() - start_episode_t
 
@@ -448,6 +539,20 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             },
         )
 
+    # Built once so that the input buffers and the compiled policy are reused across episodes
+    inference_session = (
+        PolicyInferenceSession(
+            policy=policy,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            device=get_safe_torch_device(cfg.policy.device),
+            use_amp=cfg.policy.use_amp,
+            compile_mode=cfg.policy_compile_mode,
+        )
+        if policy is not None
+        else None
+    )
+
     robot.connect()
     if teleop is not None:
         teleop.connect()
@@ -458,7 +563,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
         recorded_episodes = 0
         while recorded_episodes < cfg.dataset.num_episodes and not events["stop_recording"]:
             log_say(f"Recording episode {dataset.num_episodes}", cfg.play_sounds)
-            record_loop(
+            timing_stats = record_loop(
                 robot=robot,
                 events=events,
                 fps=cfg.dataset.fps,
@@ -473,6 +578,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 control_time_s=cfg.dataset.episode_time_s,
                 single_task=cfg.dataset.single_task,
                 display_data=cfg.display_data,
+                inference_session=inference_session,
             )
 
             # Execute a few seconds without recording to give time to manually reset the environment
@@ -502,10 +608,17 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 continue
 
             dataset.save_episode()
+            append_recording_stats(dataset.root, dataset.num_episodes - 1, timing_stats.to_episode_metadata())
             recorded_episodes += 1
 
     log_say("Stop recording", cfg.play_sounds, blocking=True)
 
+    if inference_session is not None:
+        for stage, stats in inference_session.latency_stats().items():
+            logging.info(
+                f"Inference {stage}: {stats['mean_s'] * 1e3:.2f}ms mean, {stats['p99_s'] * 1e3:.2f}ms p99"
+            )
+
     robot.disconnect()
     if teleop is not None:
         teleop.disconnect()
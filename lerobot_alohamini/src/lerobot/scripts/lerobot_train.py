@@ -28,6 +28,7 @@ from lerobot.configs import parser
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.sampler import EpisodeAwareSampler
+from lerobot.datasets.transforms import BatchedImageTransforms
 from lerobot.datasets.utils import cycle
 from lerobot.envs.factory import make_env, make_env_pre_post_processors
 from lerobot.envs.utils import close_envs
@@ -305,6 +306,11 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     )
     dl_iter = cycle(dataloader)
 
+    # Augment the collated batches on the training device instead of each frame in the dataloader workers
+    batch_image_transforms = None
+    if cfg.dataset.image_transforms.enable and cfg.dataset.image_transforms.on_device:
+        batch_image_transforms = BatchedImageTransforms(cfg.dataset.image_transforms).to(device)
+
     policy.train()
 
     train_metrics = {
@@ -332,6 +338,9 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     for _ in range(step, cfg.steps):
         start_time = time.perf_counter()
         batch = next(dl_iter)
+        if batch_image_transforms is not None:
+            for cam_key in dataset.meta.camera_keys:
+                batch[cam_key] = batch_image_transforms(batch[cam_key])
         batch = preprocessor(batch)
         train_tracker.dataloading_s = time.perf_counter() - start_time
 
@@ -399,6 +408,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
                         max_episodes_rendered=4,
                         start_seed=cfg.seed,
                         max_parallel_tasks=cfg.env.max_parallel_tasks,
+                        image_device=device if cfg.eval.uint8_image_transfer else None,
                     )
                 # overall metrics (suite-agnostic)
                 aggregated = eval_info["overall"]
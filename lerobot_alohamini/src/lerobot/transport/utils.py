@@ -137,14 +137,15 @@ def bytes_to_python_object(buffer: bytes) -> Any:
     return obj
 
 
-def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+def bytes_to_transitions(buffer: bytes) -> list[Transition] | dict[str, Any]:
+    """Deserialise either a list of transitions or a columnar batch of transitions."""
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     transitions = torch.load(bytes_buffer, weights_only=True)
     return transitions
 
 
-def transitions_to_bytes(transitions: list[Transition]) -> bytes:
+def transitions_to_bytes(transitions: list[Transition] | dict[str, Any]) -> bytes:
     bytes_buffer = io.BytesIO()
     torch.save(transitions, bytes_buffer)
     return bytes_buffer.getvalue()
@@ -18,7 +18,9 @@
 
 
 import logging
+import time
 import traceback
+from collections import deque
 from contextlib import nullcontext
 from copy import copy
 from functools import cache
@@ -28,12 +30,22 @@ import numpy as np
 import torch
 from deepdiff import DeepDiff
 
+from lerobot.configs.types import FeatureType
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.utils import DEFAULT_FEATURES
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.utils import prepare_observation_for_inference
-from lerobot.processor import PolicyAction, PolicyProcessorPipeline
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DeviceProcessorStep,
+    NormalizerProcessorStep,
+    PolicyAction,
+    PolicyProcessorPipeline,
+    RenameObservationsProcessorStep,
+    UnnormalizerProcessorStep,
+)
 from lerobot.robots import Robot
+from lerobot.utils.constants import ACTION
 
 
 @cache
@@ -115,6 +127,234 @@ def predict_action(
     return action
 
 
+class PolicyInferenceSession:
+    """
+    Runs the inference pipeline of `predict_action` for one policy, with as little work per control tick as
+    possible. Build it once per policy and call it on every tick instead of `predict_action`.
+
+    - The observation is copied into input tensors allocated on the device on the first call, images are
+      converted to float CHW in place, instead of allocating a new tensor at every conversion step.
+    - When the pre/postprocessors only rename, batch, move and (un)normalize (the default for most policies,
+      e.g. ACT and diffusion), the pipelines are replaced by one precomputed `tensor * scale + shift` per
+      feature. Other pipelines (e.g. with a tokenizer) run unchanged.
+    - The `predict_action_chunk` method of the policy can be compiled with `torch.compile`. The batch size is
+      always 1 so shapes are static, which makes the "reduce-overhead" mode (CUDA graphs) usable.
+
+    The latency of each stage ("prepare", "preprocess", "policy", "postprocess") is recorded, see
+    `latency_stats`. On CUDA, the device is synchronized at the end of each stage so that the time is
+    attributed to the right stage.
+
+    Args:
+        policy: The `PreTrainedPolicy` model to use for action prediction.
+        preprocessor: The `PolicyProcessorPipeline` for preprocessing observations.
+        postprocessor: The `PolicyProcessorPipeline` for postprocessing actions.
+        device: The `torch.device` to run inference on.
+        use_amp: Whether to enable Automatic Mixed Precision for CUDA inference.
+        fuse_processors: Whether to replace the pre/postprocessors with fused normalization when possible.
+        compile_mode: If set, `torch.compile` mode used to compile `policy.predict_action_chunk`, e.g.
+            "default" or "reduce-overhead".
+        latency_history: Number of ticks kept to compute the latency stats.
+    """
+
+    STAGES = ("prepare", "preprocess", "policy", "postprocess")
+
+    def __init__(
+        self,
+        policy: PreTrainedPolicy,
+        preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+        postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+        device: torch.device,
+        use_amp: bool = False,
+        fuse_processors: bool = True,
+        compile_mode: str | None = None,
+        latency_history: int = 1000,
+    ):
+        self.policy = policy
+        self.preprocessor = preprocessor
+        self.postprocessor = postprocessor
+        self.device = device
+        self.use_amp = use_amp
+        self.latencies_s = {stage: deque(maxlen=latency_history) for stage in self.STAGES}
+
+        self._input_buffers: dict[str, torch.Tensor] = {}
+        self._staging_buffers: dict[str, torch.Tensor] = {}
+        self._fused_preprocessor = self._fuse_preprocessor() if fuse_processors else None
+        self._fused_postprocessor = self._fuse_postprocessor() if fuse_processors else None
+
+        if compile_mode is not None:
+            logging.info(f"Compiling predict_action_chunk with torch.compile (mode={compile_mode})")
+            policy.predict_action_chunk = torch.compile(
+                policy.predict_action_chunk, mode=compile_mode, dynamic=False
+            )
+
+    @property
+    def is_fused(self) -> bool:
+        return self._fused_preprocessor is not None and self._fused_postprocessor is not None
+
+    def _fuse_preprocessor(
+        self,
+    ) -> tuple[dict[str, str], dict[str, tuple[torch.Tensor, torch.Tensor]]] | None:
+        """Returns the rename map and the per-key normalization of the preprocessor, or None if the
+        preprocessor does more than renaming, batching, moving to `device` and normalizing."""
+        rename_map: dict[str, str] = {}
+        normalizer = None
+        for step in self.preprocessor.steps:
+            if isinstance(step, RenameObservationsProcessorStep):
+                rename_map = step.rename_map
+            elif isinstance(step, NormalizerProcessorStep):
+                normalizer = step
+            elif isinstance(step, DeviceProcessorStep):
+                if step.float_dtype is not None or step.tensor_device.type != self.device.type:
+                    return None
+            elif not isinstance(step, AddBatchDimensionProcessorStep):
+                return None
+
+        normalization = {}
+        if normalizer is not None:
+            for key, feature in normalizer.features.items():
+                if feature.type == FeatureType.ACTION:
+                    continue
+                if (
+                    normalizer.normalize_observation_keys is not None
+                    and key not in normalizer.normalize_observation_keys
+                ):
+                    continue
+                params = normalizer.affine_params(key, feature.type)
+                if params is not None:
+                    normalization[key] = tuple(p.to(self.device, torch.float32) for p in params)
+        return rename_map, normalization
+
+    def _fuse_postprocessor(self) -> tuple[torch.Tensor | None, torch.Tensor | None] | None:
+        """Returns the unnormalization of the action as `(scale, shift)` (None tensors for the identity), or
+        None if the postprocessor does more than unnormalizing and moving to the CPU."""
+        params = None
+        for step in self.postprocessor.steps:
+            if isinstance(step, UnnormalizerProcessorStep):
+                params = step.affine_params(ACTION, FeatureType.ACTION, inverse=True)
+            elif isinstance(step, DeviceProcessorStep):
+                if step.float_dtype is not None or step.tensor_device.type != "cpu":
+                    return None
+            else:
+                return None
+        if params is None:
+            return (None, None)
+        return tuple(p.to(self.device, torch.float32) for p in params)
+
+    def _end_stage(self, stage: str, start_t: float) -> float:
+        if self.device.type == "cuda":
+            torch.cuda.synchronize(self.device)
+        end_t = time.perf_counter()
+        self.latencies_s[stage].append(end_t - start_t)
+        return end_t
+
+    def _prepare(self, observation: dict[str, np.ndarray]) -> dict[str, torch.Tensor]:
+        """Same as `prepare_observation_for_inference`, but writes into the preallocated input tensors."""
+        inputs = {}
+        for name, value in observation.items():
+            value = torch.from_numpy(value)
+            is_image = "image" in name
+            shape = (1, *(value.shape[2:] + value.shape[:2] if is_image else value.shape))
+            dtype = torch.float32 if is_image else value.dtype
+            buffer = self._input_buffers.get(name)
+            if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+                buffer = self._input_buffers[name] = torch.empty(shape, dtype=dtype, device=self.device)
+                self._staging_buffers.pop(name, None)
+
+            if is_image:
+                if self.device.type != "cpu":
+                    # Transfer the uint8 image, 4 times lighter than float32, and convert it on the device
+                    staging = self._staging_buffers.get(name)
+                    if staging is None:
+                        staging = self._staging_buffers[name] = torch.empty_like(value, device=self.device)
+                    value = staging.copy_(value, non_blocking=True)
+                torch.div(value.permute(2, 0, 1), 255, out=buffer[0])
+            else:
+                buffer[0].copy_(value, non_blocking=True)
+            inputs[name] = buffer
+        return inputs
+
+    def _preprocess(
+        self, inputs: dict[str, torch.Tensor], task: str | None, robot_type: str | None
+    ) -> dict[str, Any]:
+        if self._fused_preprocessor is None:
+            observation = dict(inputs)
+            observation["task"] = task if task else ""
+            observation["robot_type"] = robot_type if robot_type else ""
+            return self.preprocessor(observation)
+
+        rename_map, normalization = self._fused_preprocessor
+        observation = {}
+        for name, tensor in inputs.items():
+            key = rename_map.get(name, name)
+            params = normalization.get(key)
+            # Always hand out new tensors: policies may keep past observations (e.g. the observation queue of
+            # diffusion) while the input tensors are overwritten at the next tick
+            observation[key] = (
+                tensor.clone() if params is None else torch.addcmul(params[1], tensor, params[0])
+            )
+        observation["task"] = task if task else ""
+        observation["robot_type"] = robot_type if robot_type else ""
+        return observation
+
+    def _postprocess(self, action: PolicyAction) -> PolicyAction:
+        if self._fused_postprocessor is None:
+            return self.postprocessor(action)
+        scale, shift = self._fused_postprocessor
+        if scale is not None:
+            action = torch.addcmul(shift, action, scale)
+        return action.cpu()
+
+    def __call__(
+        self, observation: dict[str, np.ndarray], task: str | None = None, robot_type: str | None = None
+    ) -> PolicyAction:
+        """
+        Predicts the action for `observation`, same as `predict_action`.
+
+        Args:
+            observation: A dictionary of NumPy arrays representing the robot's current observation.
+            task: An optional string identifier for the task.
+            robot_type: An optional string identifier for the robot type.
+
+        Returns:
+            A `torch.Tensor` containing the predicted action, on the CPU.
+        """
+        with (
+            torch.inference_mode(),
+            torch.autocast(device_type=self.device.type)
+            if self.device.type == "cuda" and self.use_amp
+            else nullcontext(),
+        ):
+            start_t = time.perf_counter()
+            inputs = self._prepare(observation)
+            start_t = self._end_stage("prepare", start_t)
+            batch = self._preprocess(inputs, task, robot_type)
+            start_t = self._end_stage("preprocess", start_t)
+            action = self.policy.select_action(batch)
+            start_t = self._end_stage("policy", start_t)
+            action = self._postprocess(action)
+            self._end_stage("postprocess", start_t)
+        return action
+
+    def reset(self):
+        """Reset the policy and the processors, e.g. at the beginning of an episode."""
+        self.policy.reset()
+        self.preprocessor.reset()
+        self.postprocessor.reset()
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        """Mean, 99th percentile and max latency in seconds of each stage over the recorded ticks."""
+        stats = {}
+        for stage, latencies in self.latencies_s.items():
+            values = np.asarray(latencies, dtype=np.float64)
+            has_values = values.size > 0
+            stats[stage] = {
+                "mean_s": float(values.mean()) if has_values else 0.0,
+                "p99_s": float(np.percentile(values, 99)) if has_values else 0.0,
+                "max_s": float(values.max()) if has_values else 0.0,
+            }
+        return stats
+
+
 def init_keyboard_listener():
     """
     Initializes a non-blocking keyboard listener for real-time user interaction.
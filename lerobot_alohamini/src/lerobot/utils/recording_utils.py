@@ -0,0 +1,181 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers decoupling the control loop of `lerobot-record` from the consumers of its frames (dataset writing,
+visualization), and measuring how well the loop kept its rate."""
+
+import json
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+RECORDING_STATS_PATH = "meta/recording_stats.jsonl"
+
+_STOP = object()
+
+
+class FrameConsumer:
+    """Calls `fn` on every item put in a bounded queue, from a background thread.
+
+    Errors raised by `fn` are re-raised in the producer thread by the next call to `put` or `close`.
+
+    Args:
+        fn: Function consuming the items.
+        name: Name of the consumer thread.
+        maxsize: Capacity of the queue.
+        drop_when_full: If True, `put` drops the item when the queue is full instead of waiting for a free
+            spot. Use it for consumers that may fall behind without consequences, e.g. visualization.
+    """
+
+    def __init__(self, fn: Callable[[Any], None], name: str, maxsize: int, drop_when_full: bool = False):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+
+        self.fn = fn
+        self.name = name
+        self.drop_when_full = drop_when_full
+        self.num_dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            # After a failure, keep draining the queue so that the producer never blocks
+            if self._error is not None:
+                continue
+            try:
+                self.fn(item)
+            except Exception as e:
+                logging.error(f"{self.name} failed: {e}")
+                self._error = e
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise RuntimeError(f"{self.name} failed") from self._error
+
+    def put(self, item: Any) -> bool:
+        """Queue `item`. Returns False if it was dropped because the queue is full."""
+        self._raise_if_failed()
+        if not self.drop_when_full:
+            self._queue.put(item)
+            return True
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.num_dropped += 1
+            return False
+        return True
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def close(self):
+        """Wait for the queued items to be consumed and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_if_failed()
+
+
+@dataclass
+class LoopTimingStats:
+    """Timing of the iterations of a fixed rate loop.
+
+    An iteration overruns when its work takes longer than the loop period. The frames the loop should have
+    produced while it was late are counted as dropped.
+    """
+
+    fps: float
+    periods_s: list[float] = field(default_factory=list)
+    num_overruns: int = 0
+    num_dropped_frames: int = 0
+    # Frames the visualization skipped because it couldn't keep up, they are still recorded
+    num_dropped_display_frames: int = 0
+
+    def record_iteration(self, busy_s: float, period_s: float | None):
+        """Record an iteration that did `busy_s` seconds of work and started `period_s` seconds after the
+        previous one (None for the first iteration)."""
+        if busy_s > 1 / self.fps:
+            self.num_overruns += 1
+        if period_s is not None:
+            self.periods_s.append(period_s)
+            self.num_dropped_frames += max(0, round(period_s * self.fps) - 1)
+
+    def to_episode_metadata(self) -> dict[str, float | int]:
+        periods = np.asarray(self.periods_s, dtype=np.float64)
+        has_periods = periods.size > 0
+        return {
+            "fps": self.fps,
+            "num_overruns": self.num_overruns,
+            "num_dropped_frames": self.num_dropped_frames,
+            "num_dropped_display_frames": self.num_dropped_display_frames,
+            "period_mean_s": float(periods.mean()) if has_periods else 0.0,
+            "period_std_s": float(periods.std()) if has_periods else 0.0,
+            "period_p99_s": float(np.percentile(periods, 99)) if has_periods else 0.0,
+            "period_max_s": float(periods.max()) if has_periods else 0.0,
+        }
+
+
+def append_recording_stats(root: Path, episode_index: int, stats: dict[str, float | int]) -> None:
+    """Append the recording stats of an episode to `meta/recording_stats.jsonl` in the dataset `root`."""
+    fpath = Path(root) / RECORDING_STATS_PATH
+    fpath.parent.mkdir(exist_ok=True, parents=True)
+    with open(fpath, "a") as f:
+        f.write(json.dumps({"episode_index": episode_index, **stats}) + "\n")
+
+
+def load_recording_stats(root: Path) -> list[dict[str, float | int]]:
+    fpath = Path(root) / RECORDING_STATS_PATH
+    if not fpath.exists():
+        return []
+    with open(fpath) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def remap_recording_stats(
+    src_roots: list[Path], episode_mappings: list[dict[int, int]], dst_root: Path
+) -> None:
+    """Write the recording stats of the datasets derived from other ones (episodes deleted, split, merged).
+
+    Args:
+        src_roots: Roots of the source datasets.
+        episode_mappings: For each source dataset, the new index of each of its episodes kept in the
+            destination dataset. The stats of the other episodes are dropped.
+        dst_root: Root of the destination dataset.
+    """
+    remapped = []
+    for src_root, episode_mapping in zip(src_roots, episode_mappings, strict=True):
+        for stats in load_recording_stats(src_root):
+            if stats["episode_index"] in episode_mapping:
+                remapped.append({**stats, "episode_index": episode_mapping[stats["episode_index"]]})
+
+    fpath = Path(dst_root) / RECORDING_STATS_PATH
+    if not remapped:
+        fpath.unlink(missing_ok=True)
+        return
+    fpath.parent.mkdir(exist_ok=True, parents=True)
+    with open(fpath, "w") as f:
+        for stats in sorted(remapped, key=lambda stats: stats["episode_index"]):
+            f.write(json.dumps(stats) + "\n")
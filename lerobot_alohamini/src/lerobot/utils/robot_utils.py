@@ -53,3 +53,101 @@ def precise_sleep(seconds: float, spin_threshold: float = 0.010, sleep_margin: f
     else:
         # On Linux time.sleep is accurate enough for most uses
         time.sleep(seconds)
+
+
+class RateScheduler:
+    """
+    Keeps a loop running at a fixed rate by waiting for absolute deadlines on the monotonic clock.
+
+    Deadlines are computed from the start of the loop (`t0 + k / fps`) rather than from the end of the previous
+    iteration, so the phase carries over from tick to tick and errors don't accumulate over long episodes.
+    When an iteration runs past its deadline, the scheduler returns immediately; if it is late by more than a
+    whole period, the missed ticks are skipped so that the loop stays aligned on its original phase instead of
+    bursting to catch up.
+
+    Usage:
+        scheduler = RateScheduler(fps=30)
+        while True:
+            ...  # loop body
+            scheduler.sleep()
+
+    Parameters:
+      - fps: target rate of the loop
+      - spin_budget_s: time before each deadline spent spinning instead of sleeping, trading CPU for accuracy.
+        Defaults to 0 on Linux, where time.sleep is accurate enough, and to 3ms on macOS and Windows.
+      - jitter_bin_s: width of the bins of the jitter histogram. Default 0.5ms
+      - jitter_num_bins: number of bins of the jitter histogram, the last one gathers everything later. Default 20
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        spin_budget_s: float | None = None,
+        jitter_bin_s: float = 0.0005,
+        jitter_num_bins: int = 20,
+    ):
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        if spin_budget_s is None:
+            spin_budget_s = 0.003 if platform.system() in ("Darwin", "Windows") else 0.0
+
+        self.period_s = 1 / fps
+        self.spin_budget_s = spin_budget_s
+        self.jitter_bin_s = jitter_bin_s
+        self.jitter_histogram = [0] * jitter_num_bins
+        self.num_ticks = 0
+        self.num_missed_deadlines = 0
+        self.max_jitter_s = 0.0
+        self._start_t: float | None = None
+        self._tick = 0
+
+    def start(self):
+        """(Re)start the schedule from now. Called by the first `sleep` if the schedule wasn't started."""
+        self._start_t = time.perf_counter()
+        self._tick = 0
+
+    def next_deadline(self) -> float:
+        """Deadline of the current tick, in `time.perf_counter()` time."""
+        if self._start_t is None:
+            self.start()
+        return self._start_t + (self._tick + 1) * self.period_s
+
+    def sleep(self) -> float:
+        """Wait for the deadline of the current tick and move on to the next one.
+
+        Returns:
+            The jitter of this tick: how late, in seconds, the call returned with respect to the deadline.
+        """
+        deadline = self.next_deadline()
+
+        remaining = deadline - time.perf_counter()
+        if remaining < 0:
+            # The loop body overran: skip the ticks that are already over, keeping the phase of the schedule
+            skipped_ticks = int(-remaining // self.period_s)
+            self.num_missed_deadlines += 1 + skipped_ticks
+            self._tick += skipped_ticks
+        else:
+            if remaining > self.spin_budget_s:
+                time.sleep(remaining - self.spin_budget_s)
+            while time.perf_counter() < deadline:
+                pass
+
+        jitter_s = time.perf_counter() - deadline
+        self._record_jitter(jitter_s)
+        self.num_ticks += 1
+        self._tick += 1
+        return jitter_s
+
+    def _record_jitter(self, jitter_s: float):
+        self.max_jitter_s = max(self.max_jitter_s, jitter_s)
+        index = min(int(max(jitter_s, 0.0) / self.jitter_bin_s), len(self.jitter_histogram) - 1)
+        self.jitter_histogram[index] += 1
+
+    def stats(self) -> dict[str, float | int | list[int]]:
+        return {
+            "num_ticks": self.num_ticks,
+            "num_missed_deadlines": self.num_missed_deadlines,
+            "max_jitter_s": self.max_jitter_s,
+            "jitter_bin_s": self.jitter_bin_s,
+            "jitter_histogram": list(self.jitter_histogram),
+        }
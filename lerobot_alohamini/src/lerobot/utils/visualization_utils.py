@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import numbers
 import os
+import time
 from typing import Any
 
 import numpy as np
 import rerun as rr
 
 from .constants import OBS_PREFIX, OBS_STR
+from .recording_utils import FrameConsumer
 
 
 def init_rerun(session_name: str = "lerobot_control_loop") -> None:
@@ -94,3 +97,114 @@ def log_rerun_data(
                     flat = v.flatten()
                     for i, vi in enumerate(flat):
                         rr.log(f"{key}_{i}", rr.Scalars(float(vi)))
+
+
+class RerunSink:
+    """Logs observations and actions to Rerun from a background thread, so that visualization never slows down
+    the control loop.
+
+    Contrary to `log_rerun_data`, which makes one `rr.log` call per value on every frame:
+    - Scalars are accumulated and sent every `flush_interval_s` with one `rr.send_columns` call per entity,
+      on the `log_time` timeline. 1-D arrays are sent as a single entity with one series per element.
+    - Images are downsampled by an integer stride so that their largest side fits in `max_image_size`, and
+      logged at most `image_fps` times per second, on the same `log_time` timeline as the scalars.
+    - Frames are dropped when the logging thread falls behind, see `num_dropped`.
+
+    Args:
+        max_image_size: Largest side, in pixels, of the logged images. None logs them at full resolution.
+        image_fps: Maximum rate at which each image is logged. None logs every image.
+        flush_interval_s: Period at which the accumulated scalars are sent to Rerun.
+        maxsize: Number of frames that can wait to be logged before new ones are dropped.
+    """
+
+    def __init__(
+        self,
+        max_image_size: int | None = 320,
+        image_fps: float | None = 10,
+        flush_interval_s: float = 0.1,
+        maxsize: int = 2,
+    ):
+        if max_image_size is not None and max_image_size <= 0:
+            raise ValueError(f"max_image_size must be positive, got {max_image_size}")
+        if image_fps is not None and image_fps <= 0:
+            raise ValueError(f"image_fps must be positive, got {image_fps}")
+
+        self.max_image_size = max_image_size
+        self.image_period_s = 1 / image_fps if image_fps is not None else 0.0
+        self.flush_interval_s = flush_interval_s
+        # Per entity: timestamps and 1-D values of the frames not sent yet
+        self._pending_times: dict[str, list[float]] = {}
+        self._pending_values: dict[str, list[np.ndarray]] = {}
+        self._last_image_t: dict[str, float] = {}
+        self._last_flush_t = time.perf_counter()
+        self._consumer = FrameConsumer(self._consume, name="rerun_sink", maxsize=maxsize, drop_when_full=True)
+
+    @property
+    def num_dropped(self) -> int:
+        return self._consumer.num_dropped
+
+    def log(self, observation: dict[str, Any] | None = None, action: dict[str, Any] | None = None) -> bool:
+        """Queue a frame for logging. Returns False if it was dropped because the logging thread is behind."""
+        return self._consumer.put((time.time(), observation, action))
+
+    def _consume(self, item: tuple[float, dict[str, Any] | None, dict[str, Any] | None]):
+        timestamp, observation, action = item
+        for k, v in (observation or {}).items():
+            if v is None:
+                continue
+            key = k if str(k).startswith(OBS_PREFIX) else f"{OBS_STR}.{k}"
+            if _is_scalar(v) or (isinstance(v, np.ndarray) and v.ndim == 1):
+                self._add_scalars(key, timestamp, v)
+            elif isinstance(v, np.ndarray):
+                self._log_image(key, timestamp, v)
+
+        for k, v in (action or {}).items():
+            if v is None:
+                continue
+            key = k if str(k).startswith("action.") else f"action.{k}"
+            if _is_scalar(v) or isinstance(v, np.ndarray):
+                self._add_scalars(key, timestamp, v)
+
+        if time.perf_counter() - self._last_flush_t >= self.flush_interval_s:
+            self.flush()
+
+    def _add_scalars(self, key: str, timestamp: float, value: Any):
+        self._pending_times.setdefault(key, []).append(timestamp)
+        self._pending_values.setdefault(key, []).append(np.asarray(value, dtype=np.float64).reshape(-1))
+
+    def _log_image(self, key: str, timestamp: float, arr: np.ndarray):
+        last_t = self._last_image_t.get(key)
+        if last_t is not None and timestamp - last_t < self.image_period_s:
+            return
+        self._last_image_t[key] = timestamp
+
+        # Convert CHW -> HWC when needed
+        if arr.ndim == 3 and arr.shape[0] in (1, 3, 4) and arr.shape[-1] not in (1, 3, 4):
+            arr = np.transpose(arr, (1, 2, 0))
+        if self.max_image_size is not None and arr.ndim >= 2:
+            stride = math.ceil(max(arr.shape[:2]) / self.max_image_size)
+            if stride > 1:
+                arr = arr[::stride, ::stride]
+        # The time is set for the logging thread only
+        rr.set_time("log_time", timestamp=timestamp)
+        rr.log(key, rr.Image(arr))
+
+    def flush(self):
+        """Send the accumulated scalars to Rerun."""
+        for key, times in self._pending_times.items():
+            values = self._pending_values[key]
+            rr.send_columns(
+                key,
+                indexes=[rr.TimeColumn("log_time", timestamp=np.asarray(times))],
+                columns=rr.Scalars.columns(scalars=np.concatenate(values)).partition(
+                    [len(v) for v in values]
+                ),
+            )
+        self._pending_times.clear()
+        self._pending_values.clear()
+        self._last_flush_t = time.perf_counter()
+
+    def close(self):
+        """Log the queued frames, send the remaining scalars and stop the thread."""
+        self._consumer.close()
+        self.flush()
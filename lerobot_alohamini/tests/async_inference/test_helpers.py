@@ -15,13 +15,17 @@
 import math
 import pickle
 import time
+from queue import Empty
 
 import numpy as np
+import pytest
 import torch
 
 from lerobot.async_inference.helpers import (
     FPSTracker,
+    ObservationStateTracker,
     TimedAction,
+    TimedActionQueue,
     TimedObservation,
     observations_similar,
     prepare_image,
@@ -165,6 +169,64 @@ def test_timed_data_deserialization_data_getters():
     torch.testing.assert_close(to_out.get_observation()[OBS_STATE], obs_dict[OBS_STATE])
 
 
+# ---------------------------------------------------------------------
+# TimedActionQueue
+# ---------------------------------------------------------------------
+
+
+def _timed_actions(start_t: int, count: int, value: float | None = None) -> list[TimedAction]:
+    return [
+        TimedAction(
+            timestamp=float(t), timestep=t, action=torch.full((3,), float(t) if value is None else value)
+        )
+        for t in range(start_t, start_t + count)
+    ]
+
+
+def test_timed_action_queue_pops_in_timestep_order():
+    queue = TimedActionQueue(capacity=4)
+    queue.aggregate(_timed_actions(0, 4), latest_action=-1, aggregate_fn=lambda old, new: new)
+
+    assert queue.qsize() == 4
+    assert queue.first_and_last_timestep() == (0, 3)
+    for t in range(4):
+        action = queue.get_nowait()
+        assert action.get_timestep() == t
+        assert action.get_timestamp() == float(t)
+        torch.testing.assert_close(action.get_action(), torch.full((3,), float(t)))
+
+    assert queue.empty()
+    with pytest.raises(Empty):
+        queue.get_nowait()
+
+
+def test_timed_action_queue_blends_overlap_and_wraps_around():
+    queue = TimedActionQueue(capacity=5)
+    queue.aggregate(_timed_actions(0, 5, value=10.0), latest_action=-1, aggregate_fn=lambda old, new: new)
+    for _ in range(3):
+        queue.get_nowait()
+
+    # Timesteps 3, 4 overlap, 5, 6, 7 wrap around the ring
+    queue.aggregate(
+        _timed_actions(2, 6, value=0.0), latest_action=2, aggregate_fn=lambda old, new: 0.5 * old + 0.5 * new
+    )
+
+    assert queue.timesteps() == [3, 4, 5, 6, 7]
+    popped = [queue.get_nowait().get_action()[0].item() for _ in range(5)]
+    assert popped == [5.0, 5.0, 0.0, 0.0, 0.0]
+
+
+def test_timed_action_queue_grows_for_longer_chunks():
+    queue = TimedActionQueue(capacity=2)
+    queue.put(_timed_actions(0, 1)[0])
+    queue.aggregate(_timed_actions(0, 6), latest_action=-1, aggregate_fn=lambda old, new: old + new)
+
+    assert queue.capacity == 6
+    assert queue.timesteps() == list(range(6))
+    assert queue.get_nowait().get_action()[0].item() == 0.0
+    assert queue.get_nowait().get_action()[0].item() == 1.0
+
+
 # ---------------------------------------------------------------------
 # observations_similar()
 # ---------------------------------------------------------------------
@@ -203,6 +265,53 @@ def test_observations_similar_true():
     assert not observations_similar(obs1, obs3, lerobot_features, atol=2.0)
 
 
+def test_observation_state_tracker_matches_observations_similar():
+    lerobot_features = {
+        OBS_STATE: {"dtype": "float32", "shape": [4], "names": ["shoulder", "elbow", "wrist", "gripper"]}
+    }
+    tracker = ObservationStateTracker(lerobot_features[OBS_STATE]["names"], atol=2.0)
+    reference = _make_obs(torch.zeros(4))
+
+    # Nothing processed yet, every observation is dissimilar
+    assert not tracker.update(reference.get_observation())
+    tracker.mark_sent(timestep=0)
+    np.testing.assert_array_equal(tracker.state, np.zeros(4, dtype=np.float32))
+    assert not tracker.update(reference.get_observation())
+
+    # The observation becomes the reference once an action chunk comes back for its timestep
+    tracker.mark_processed(timestep=0)
+
+    for value in [0.5, 0.99, 1.0, 2.0]:
+        obs = _make_obs(value * torch.ones(4))
+        assert tracker.update(obs.get_observation()) == observations_similar(
+            reference, obs, lerobot_features, atol=2.0
+        )
+
+    tracker.reset()
+    assert not tracker.update(reference.get_observation())
+
+
+def test_observation_state_tracker_reference_follows_processed_observations():
+    tracker = ObservationStateTracker(["shoulder", "elbow"], atol=0.5)
+
+    tracker.update({"shoulder": 0.0, "elbow": 0.0})
+    tracker.mark_sent(timestep=3)
+    tracker.update({"shoulder": 1.0, "elbow": 0.0})
+    tracker.mark_sent(timestep=4)
+    # Sent again for the same timestep, the server only processes the first one
+    tracker.update({"shoulder": 2.0, "elbow": 0.0})
+    tracker.mark_sent(timestep=4)
+
+    # The server processed the observation of timestep 4, the one of timestep 3 is not the reference
+    tracker.mark_processed(timestep=4)
+    assert tracker.update({"shoulder": 1.0, "elbow": 0.0})
+    assert not tracker.update({"shoulder": 0.0, "elbow": 0.0})
+
+    # Chunks for forgotten timesteps don't move the reference
+    tracker.mark_processed(timestep=3)
+    assert tracker.update({"shoulder": 1.0, "elbow": 0.0})
+
+
 # ---------------------------------------------------------------------
 # raw_observation_to_observation and helpers
 # ---------------------------------------------------------------------
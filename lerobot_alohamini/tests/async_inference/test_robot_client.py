@@ -20,7 +20,6 @@ no real hardware is accessed. Only the queue-update mechanism is verified.
 from __future__ import annotations
 
 import time
-from queue import Queue
 
 import pytest
 import torch
@@ -101,7 +100,7 @@ def test_update_action_queue_discards_stale(robot_client):
     robot_client._aggregate_action_queues(incoming)
 
     # Extract timesteps from queue
-    resulting_timesteps = [a.get_timestep() for a in robot_client.action_queue.queue]
+    resulting_timesteps = robot_client.action_queue.timesteps()
 
     assert resulting_timesteps == [5, 6, 7]
 
@@ -152,7 +151,8 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 
     queue_overlap_actions = []
     queue_non_overlap_actions = []
-    for a in robot_client.action_queue.queue:
+    while not robot_client.action_queue.empty():
+        a = robot_client.action_queue.get_nowait()
         if a.get_timestep() in overlap_timesteps:
             queue_overlap_actions.append(a)
         elif a.get_timestep() in nonoverlap_timesteps:
@@ -187,7 +187,7 @@ def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int
     robot_client.action_chunk_size = chunk_size
 
     # Clear any existing actions then fill with `queue_len` dummy entries ----
-    robot_client.action_queue = Queue()
+    robot_client.action_queue.clear()
 
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
     for act in dummy_actions:
@@ -225,9 +225,62 @@ def test_ready_to_send_observation_with_varying_threshold(robot_client, g_thresh
     robot_client._chunk_size_threshold = g_threshold
 
     # Fill queue with dummy actions
-    robot_client.action_queue = Queue()
+    robot_client.action_queue.clear()
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
     for act in dummy_actions:
         robot_client.action_queue.put(act)
 
     assert robot_client._ready_to_send_observation() is expected
+
+
+def test_aggregate_action_queues_replaces_queue_with_incoming_chunk(robot_client):
+    """Queued actions not covered by the incoming chunk are dropped, as with the previous `Queue` rebuild."""
+    robot_client.latest_action = 4
+    for a in _make_actions(start_ts=time.time(), start_t=5, count=10):  # 5..14
+        robot_client.action_queue.put(a)
+
+    incoming = _make_actions(start_ts=time.time(), start_t=6, count=4)  # 6..9
+    robot_client._aggregate_action_queues(incoming)
+
+    assert robot_client.action_queue.timesteps() == [6, 7, 8, 9]
+    assert robot_client.action_queue.qsize() == 4
+
+
+def test_action_tensor_to_action_dict_reuses_buffer(robot_client):
+    action_keys = list(robot_client.robot.action_features)
+
+    first = robot_client._action_tensor_to_action_dict(torch.arange(len(action_keys), dtype=torch.float32))
+    assert list(first) == action_keys
+    assert list(first.values()) == [float(i) for i in range(len(action_keys))]
+
+    second = robot_client._action_tensor_to_action_dict(torch.ones(len(action_keys)))
+    assert second is first
+    assert list(second.values()) == [1.0] * len(action_keys)
+
+
+def test_control_loop_observation_skips_similar_observations(robot_client, monkeypatch):
+    sent = []
+    monkeypatch.setattr(robot_client, "send_observation", lambda obs: sent.append(obs) or True)
+    static_observation = dict.fromkeys(robot_client.robot.action_features, 0.0)
+    monkeypatch.setattr(robot_client.robot, "get_observation", lambda: dict(static_observation))
+    robot_client.action_chunk_size = 10
+    for a in _make_actions(start_ts=time.time(), start_t=0, count=2):
+        robot_client.action_queue.put(a)
+    robot_client.must_go.clear()
+
+    robot_client.control_loop_observation(task="")
+    # No action chunk came back yet, the server may not have processed the first observation
+    robot_client.control_loop_observation(task="")
+    assert len(sent) == 2
+
+    # Once it did, the robot doesn't move and the next observation is not worth sending
+    robot_client.state_tracker.mark_processed(sent[0].get_timestep())
+    robot_client.control_loop_observation(task="")
+    assert len(sent) == 2
+
+    # Unless the action queue is empty, in which case the observation must go
+    robot_client.action_queue.clear()
+    robot_client.must_go.set()
+    robot_client.control_loop_observation(task="")
+    assert len(sent) == 3
+    assert sent[-1].must_go
@@ -16,9 +16,11 @@
 
 from unittest.mock import patch
 
+import pytest
 import torch
 
-from lerobot.datasets.aggregate import aggregate_datasets
+from lerobot.datasets import aggregate
+from lerobot.datasets.aggregate import AGGREGATE_PROGRESS_PATH, aggregate_datasets, assign_destination_files
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from tests.fixtures.constants import DUMMY_REPO_ID
 
@@ -380,3 +382,115 @@ def test_video_timestamps_regression(tmp_path, lerobot_dataset_factory):
         for key in aggr_ds.meta.video_keys:
             assert key in item, f"Video key {key} missing from item {i}"
             assert item[key].shape[0] == 3, f"Expected 3 channels for video key {key}"
+
+
+def test_assign_destination_files():
+    # The first source always starts a file, even when it is larger than the limit
+    assert assign_destination_files([3.0, 1.0, 1.0, 2.0, 5.0], max_mb=4.0, chunk_size=2) == [
+        (0, 0),
+        (0, 1),
+        (0, 1),
+        (1, 0),
+        (1, 1),
+    ]
+
+
+def test_aggregate_resumes_after_crash(tmp_path, lerobot_dataset_factory):
+    datasets = [
+        lerobot_dataset_factory(
+            root=tmp_path / f"resume_{i}",
+            repo_id=f"{DUMMY_REPO_ID}_resume_{i}",
+            total_episodes=4,
+            total_frames=120,
+        )
+        for i in range(2)
+    ]
+    aggr_root = tmp_path / "resume_aggr"
+    kwargs = {
+        "repo_ids": [ds.repo_id for ds in datasets],
+        "roots": [ds.root for ds in datasets],
+        "aggr_repo_id": f"{DUMMY_REPO_ID}_resume_aggr",
+        "aggr_root": aggr_root,
+        "data_files_size_in_mb": 0.01,
+        "num_workers": 0,
+    }
+
+    execute_job = aggregate.execute_aggregation_job
+    calls = []
+
+    def crash_after_two_jobs(job, root):
+        if len(calls) == 2:
+            raise RuntimeError("crash")
+        calls.append(job["dst"])
+        return execute_job(job, root)
+
+    with (
+        patch.object(aggregate, "execute_aggregation_job", crash_after_two_jobs),
+        pytest.raises(RuntimeError),
+    ):
+        aggregate_datasets(**kwargs)
+    assert (aggr_root / AGGREGATE_PROGRESS_PATH).exists()
+
+    with patch.object(aggregate, "execute_aggregation_job", wraps=execute_job) as resumed_job:
+        aggregate_datasets(**kwargs)
+    # Files written before the crash are not written again
+    assert not {call.args[0]["dst"] for call in resumed_job.call_args_list} & set(calls)
+    assert not (aggr_root / AGGREGATE_PROGRESS_PATH).exists()
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(aggr_root)
+        aggr_ds = LeRobotDataset(f"{DUMMY_REPO_ID}_resume_aggr", root=aggr_root)
+
+    assert_episode_and_frame_counts(aggr_ds, 8, 240)
+    assert_dataset_content_integrity(aggr_ds, *datasets)
+    assert_episode_indices_updated_correctly(aggr_ds, *datasets)
+    assert_video_frames_integrity(aggr_ds, *datasets)
+
+
+def test_aggregate_resumes_after_crash_before_destination_is_created(tmp_path, lerobot_dataset_factory):
+    datasets = [
+        lerobot_dataset_factory(
+            root=tmp_path / f"early_crash_{i}",
+            repo_id=f"{DUMMY_REPO_ID}_early_crash_{i}",
+            total_episodes=2,
+            total_frames=60,
+        )
+        for i in range(2)
+    ]
+    aggr_root = tmp_path / "early_crash_aggr"
+    kwargs = {
+        "repo_ids": [ds.repo_id for ds in datasets],
+        "roots": [ds.root for ds in datasets],
+        "aggr_repo_id": f"{DUMMY_REPO_ID}_early_crash_aggr",
+        "aggr_root": aggr_root,
+        "num_workers": 0,
+    }
+
+    with (
+        patch.object(aggregate.LeRobotDatasetMetadata, "create", side_effect=RuntimeError("crash")),
+        pytest.raises(RuntimeError),
+    ):
+        aggregate_datasets(**kwargs)
+    assert (aggr_root / AGGREGATE_PROGRESS_PATH).exists()
+
+    aggregate_datasets(**kwargs)
+    assert not (aggr_root / AGGREGATE_PROGRESS_PATH).exists()
+
+    # A complete dataset is not overwritten
+    with pytest.raises(FileExistsError):
+        aggregate_datasets(**kwargs)
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(aggr_root)
+        aggr_ds = LeRobotDataset(f"{DUMMY_REPO_ID}_early_crash_aggr", root=aggr_root)
+
+    assert_episode_and_frame_counts(aggr_ds, 4, 120)
+    assert_dataset_content_integrity(aggr_ds, *datasets)
@@ -20,6 +20,7 @@ import pytest
 
 from lerobot.datasets.compute_stats import (
     RunningQuantileStats,
+    StatsAccumulator,
     _assert_type_and_shape,
     aggregate_feature_stats,
     aggregate_stats,
@@ -317,6 +318,34 @@ def test_aggregate_stats():
         np.testing.assert_allclose(results[fkey]["count"], expected_agg_stats[fkey]["count"])
 
 
+def test_stats_accumulator_matches_aggregate_stats():
+    rng = np.random.default_rng(0)
+    all_stats = []
+    for ep_idx in range(5):
+        ep_stats = {
+            OBS_STATE: get_feature_stats(
+                rng.normal(loc=ep_idx, size=(20 + ep_idx, 3)), axis=0, keepdims=False
+            ),
+        }
+        # Only some of the episodes have this feature
+        if ep_idx % 2 == 0:
+            ep_stats["extra_key"] = get_feature_stats(rng.normal(size=(10, 2)), axis=0, keepdims=False)
+        all_stats.append(ep_stats)
+
+    accumulator = StatsAccumulator()
+    assert accumulator.get_stats() is None
+    for ep_stats in all_stats:
+        accumulator.add(ep_stats)
+
+    results = accumulator.get_stats()
+    expected = aggregate_stats(all_stats)
+    assert set(results) == set(expected)
+    for fkey in expected:
+        assert set(results[fkey]) == set(expected[fkey])
+        for k in expected[fkey]:
+            np.testing.assert_allclose(results[fkey][k], expected[fkey][k], rtol=1e-6)
+
+
 def test_running_quantile_stats_initialization():
     """Test proper initialization of RunningQuantileStats."""
     running_stats = RunningQuantileStats()
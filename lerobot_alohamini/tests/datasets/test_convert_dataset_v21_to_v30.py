@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from lerobot.datasets.v30.convert_dataset_v21_to_v30 import (
+    ConversionManifest,
+    plan_data_conversion,
+    run_conversion_jobs,
+)
+
+
+def write_text(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def fail(path: Path):
+    raise RuntimeError(f"Failed to write {path}")
+
+
+def make_legacy_data(root: Path, num_episodes: int):
+    (root / "meta").mkdir(parents=True)
+    (root / "meta" / "info.json").write_text('{"features": {}}')
+    for ep_idx in range(num_episodes):
+        path = root / "data" / "chunk-000" / f"episode_{ep_idx:06d}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({"index": list(range(ep_idx * 10, (ep_idx + 1) * 10))}).to_parquet(path)
+
+
+def test_plan_data_conversion(tmp_path):
+    root = tmp_path / "v21"
+    make_legacy_data(root, num_episodes=3)
+
+    episodes_metadata, jobs = plan_data_conversion(root, tmp_path / "v30", data_file_size_in_mb=100)
+
+    assert [ep["dataset_from_index"] for ep in episodes_metadata] == [0, 10, 20]
+    assert [ep["data/file_index"] for ep in episodes_metadata] == [0, 0, 0]
+    assert len(jobs) == 1
+    job_id, _, args = jobs[0]
+    assert job_id == "data/chunk-000/file-000.parquet"
+    assert len(args[0]) == 3
+
+
+def test_conversion_resumes_from_manifest(tmp_path):
+    settings = {"data_file_size_in_mb": 100}
+    jobs = [(f"file_{i}", write_text, (tmp_path / "out" / f"file_{i}", str(i))) for i in range(3)]
+    failing_jobs = [*jobs[:2], ("file_2", fail, (tmp_path / "out" / "file_2",))]
+
+    manifest = ConversionManifest(tmp_path, settings)
+    with pytest.raises(RuntimeError):
+        run_conversion_jobs(failing_jobs, manifest, num_workers=0)
+
+    resumed_manifest = ConversionManifest.load(tmp_path, settings)
+    assert resumed_manifest.completed == {"file_0", "file_1"}
+    assert ConversionManifest.load(tmp_path, {"data_file_size_in_mb": 50}) is None
+
+    # Completed jobs are not run again
+    (tmp_path / "out" / "file_0").unlink()
+    run_conversion_jobs(jobs, resumed_manifest, num_workers=0)
+    assert not (tmp_path / "out" / "file_0").exists()
+    assert (tmp_path / "out" / "file_2").read_text() == "2"
+    assert resumed_manifest.completed == {"file_0", "file_1", "file_2"}
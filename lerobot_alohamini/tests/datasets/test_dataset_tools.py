@@ -22,6 +22,7 @@ import pytest
 import torch
 
 from lerobot.datasets.dataset_tools import (
+    _plan_video_cuts,
     add_features,
     delete_episodes,
     merge_datasets,
@@ -29,6 +30,7 @@ from lerobot.datasets.dataset_tools import (
     remove_feature,
     split_dataset,
 )
+from lerobot.utils.recording_utils import append_recording_stats, load_recording_stats
 
 
 @pytest.fixture
@@ -86,6 +88,68 @@ def test_delete_single_episode(sample_dataset, tmp_path):
     assert len(new_dataset) == 40
 
 
+def test_delete_middle_episode_of_video(tmp_path, empty_lerobot_dataset_factory):
+    """The kept frames decode at their new timestamps, across stream copied and re-encoded segments."""
+    features = {
+        "action": {"dtype": "float32", "shape": (2,), "names": None},
+        "observation.images.cam": {"dtype": "video", "shape": (64, 64, 3), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "video_dataset", features=features)
+
+    # Odd episode lengths, so that the episode boundaries fall in the middle of GOPs. Each frame is filled with
+    # a value identifying it.
+    episode_lengths = [9, 8, 9]
+    values = []
+    for ep_length in episode_lengths:
+        for _ in range(ep_length):
+            values.append(len(values) * 8)
+            frame = {
+                "action": np.zeros(2, dtype=np.float32),
+                "observation.images.cam": np.full((64, 64, 3), values[-1], dtype=np.uint8),
+                "task": "task",
+            }
+            dataset.add_frame(frame)
+        dataset.save_episode()
+    dataset.finalize()
+
+    output_dir = tmp_path / "filtered"
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        new_dataset = delete_episodes(dataset, episode_indices=[1], output_dir=output_dir)
+
+    expected_values = values[:9] + values[17:]
+    assert len(new_dataset) == len(expected_values)
+    for i, expected_value in enumerate(expected_values):
+        item = new_dataset[i]
+        assert item["timestamp"].item() == pytest.approx(item["frame_index"].item() / dataset.fps)
+        image = item["observation.images.cam"]
+        assert image.shape == (3, 64, 64)
+        assert image.mean().item() * 255 == pytest.approx(expected_value, abs=4)
+
+
+def test_delete_episodes_remaps_recording_stats(sample_dataset, tmp_path):
+    for ep_idx in range(sample_dataset.meta.total_episodes):
+        append_recording_stats(sample_dataset.root, ep_idx, {"num_overruns": ep_idx})
+    output_dir = tmp_path / "filtered"
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        new_dataset = delete_episodes(sample_dataset, episode_indices=[1, 3], output_dir=output_dir)
+
+    stats = load_recording_stats(new_dataset.root)
+    assert [(s["episode_index"], s["num_overruns"]) for s in stats] == [(0, 0), (1, 2), (2, 4)]
+
+
 def test_delete_multiple_episodes(sample_dataset, tmp_path):
     """Test deleting multiple episodes."""
     output_dir = tmp_path / "filtered"
@@ -1047,3 +1111,20 @@ def test_modify_features_preserves_file_structure(sample_dataset, tmp_path):
         assert new_chunk_indices == original_chunk_indices, "Chunk indices should be preserved"
         assert new_file_indices == original_file_indices, "File indices should be preserved"
         assert "reward" in modified_dataset.meta.features
+
+
+@pytest.mark.parametrize(
+    "frame_ranges, expected",
+    [
+        # Whole video, every GOP is copied
+        ([(0, 40)], [("copy", 0, 40)]),
+        # Partial GOPs at both ends are re-encoded
+        ([(5, 35)], [("encode", 5, 10), ("copy", 10, 30), ("encode", 30, 35)]),
+        # Range within a single GOP
+        ([(12, 18)], [("encode", 12, 18)]),
+        # Contiguous ranges are merged, the gap between the kept episodes is dropped
+        ([(0, 10), (10, 25), (32, 40)], [("copy", 0, 20), ("encode", 20, 25), ("encode", 32, 40)]),
+    ],
+)
+def test_plan_video_cuts(frame_ranges, expected):
+    assert _plan_video_cuts(frame_ranges, keyframes=[0, 10, 20, 30], num_frames=40) == expected
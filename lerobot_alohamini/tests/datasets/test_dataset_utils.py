@@ -14,13 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
+import numpy as np
 import pytest
 import torch
 from datasets import Dataset
 from huggingface_hub import DatasetCard
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
-from lerobot.datasets.utils import combine_feature_dicts, create_lerobot_dataset_card, hf_transform_to_torch
+from lerobot.datasets.utils import (
+    EpisodeIndex,
+    build_absolute_to_relative_index,
+    combine_feature_dicts,
+    create_lerobot_dataset_card,
+    hf_transform_to_torch,
+)
 from lerobot.utils.constants import ACTION, OBS_IMAGES
 
 
@@ -131,3 +140,33 @@ def test_non_dict_passthrough_last_wins():
     out = combine_feature_dicts(g1, g2)
     # For non-dict entries the last one wins
     assert out["misc"] == 456
+
+
+def test_episode_index():
+    episodes = Dataset.from_dict(
+        {
+            "episode_index": [0, 1, 2],
+            "dataset_from_index": [0, 3, 8],
+            "dataset_to_index": [3, 8, 10],
+            "videos/cam/chunk_index": [0, 0, 1],
+            "videos/cam/file_index": [0, 1, 0],
+            "videos/cam/from_timestamp": [0.0, 0.1, 0.0],
+        }
+    )
+    episode_index = EpisodeIndex.from_episodes(episodes, video_keys=["cam"])
+
+    assert len(episode_index) == 3
+    assert episode_index.episode_of(0) == 0
+    assert episode_index.episode_of(3) == 1
+    np.testing.assert_array_equal(episode_index.episode_of(np.arange(10)), [0, 0, 0, 1, 1, 1, 1, 1, 2, 2])
+    np.testing.assert_array_equal(episode_index.video_file_index["cam"], [0, 1, 0])
+    assert episode_index.video_from_timestamp["cam"][1] == pytest.approx(0.1)
+
+    unpickled = pickle.loads(pickle.dumps(episode_index))
+    np.testing.assert_array_equal(unpickled.dataset_to_index, episode_index.dataset_to_index)
+
+
+def test_build_absolute_to_relative_index():
+    table = build_absolute_to_relative_index(np.array([3, 4, 5, 8, 9]))
+    np.testing.assert_array_equal(table[[3, 5, 8, 9]], [0, 2, 3, 4])
+    assert table[0] == -1
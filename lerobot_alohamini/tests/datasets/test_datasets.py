@@ -32,12 +32,14 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.image_writer import image_array_to_pil_image
 from lerobot.datasets.lerobot_dataset import (
     LeRobotDataset,
+    LeRobotDatasetMetadata,
     MultiLeRobotDataset,
 )
 from lerobot.datasets.utils import (
     DEFAULT_CHUNK_SIZE,
     DEFAULT_DATA_FILE_SIZE_IN_MB,
     DEFAULT_VIDEO_FILE_SIZE_IN_MB,
+    SESSION_JOURNAL_PATH,
     create_branch,
     get_hf_features_from_features,
     hf_transform_to_torch,
@@ -884,6 +886,60 @@ def test_multi_episode_metadata_consistency(tmp_path, empty_lerobot_dataset_fact
         cumulative_frames += frames_per_episode[episode_idx]
 
 
+def test_episodes_metadata_read_while_recording(tmp_path, empty_lerobot_dataset_factory):
+    """Test that reading the episodes metadata in between episodes doesn't corrupt the appended files."""
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=False)
+
+    frames_per_episode = [5, 8, 3, 6, 4]
+    for episode_idx, num_frames in enumerate(frames_per_episode):
+        for _ in range(num_frames):
+            dataset.add_frame({"state": torch.randn(2), "task": "pick"})
+        dataset.save_episode()
+
+        if episode_idx % 2 == 1:
+            # Episodes saved since the last read are only loaded when accessed
+            assert len(dataset.meta.episodes) == episode_idx + 1
+            assert dataset.meta.episodes[-1]["length"] == num_frames
+
+    dataset.finalize()
+
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root)
+    assert loaded_dataset.meta.total_episodes == len(frames_per_episode)
+    assert loaded_dataset.meta.episodes["length"] == frames_per_episode
+    assert loaded_dataset.meta.episodes[-1]["dataset_to_index"] == sum(frames_per_episode)
+
+
+def test_info_and_stats_recovered_from_session_journal(tmp_path, empty_lerobot_dataset_factory):
+    """Test that the episodes saved since info.json and stats.json were last written are recovered when the
+    recording session stops without finalizing."""
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=False)
+
+    frames_per_episode = [5, 8, 3]
+    for num_frames in frames_per_episode:
+        for _ in range(num_frames):
+            dataset.add_frame({"state": torch.randn(2), "task": "pick"})
+        dataset.save_episode()
+    expected_stats = dataset.meta.stats
+
+    # The session stops after the parquet files are closed, but before info.json and stats.json are written
+    dataset._close_writer()
+    dataset.meta._close_writer()
+    assert (dataset.root / SESSION_JOURNAL_PATH).exists()
+
+    meta = LeRobotDatasetMetadata(dataset.repo_id, root=dataset.root)
+    assert meta.total_episodes == len(frames_per_episode)
+    assert meta.total_frames == sum(frames_per_episode)
+    assert meta.stats["state"]["count"].item() == sum(frames_per_episode)
+    np.testing.assert_allclose(meta.stats["state"]["mean"], expected_stats["state"]["mean"], rtol=1e-6)
+
+    meta.finalize()
+    assert not (dataset.root / SESSION_JOURNAL_PATH).exists()
+    reloaded_meta = LeRobotDatasetMetadata(dataset.repo_id, root=dataset.root)
+    assert reloaded_meta.total_episodes == len(frames_per_episode)
+
+
 def test_data_consistency_across_episodes(tmp_path, empty_lerobot_dataset_factory):
     """Test that episodes have no gaps or overlaps in their data indices."""
     features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
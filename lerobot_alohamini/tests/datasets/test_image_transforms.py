@@ -18,10 +18,11 @@ import pytest
 import torch
 from packaging import version
 from safetensors.torch import load_file
-from torchvision.transforms import v2
+from torchvision.transforms import InterpolationMode, v2
 from torchvision.transforms.v2 import functional as F  # noqa: N812
 
 from lerobot.datasets.transforms import (
+    BatchedImageTransforms,
     ImageTransformConfig,
     ImageTransforms,
     ImageTransformsConfig,
@@ -429,3 +430,29 @@ def test_save_each_transform(img_tensor_factory, tmp_path):
             assert (transform_dir / file_name).exists(), (
                 f"{file_name} was not found in {transform} directory."
             )
+
+
+@pytest.mark.parametrize(
+    "tf_type, kwargs",
+    [
+        ("ColorJitter", {"brightness": (0.5, 0.5)}),
+        ("ColorJitter", {"contrast": (2.0, 2.0)}),
+        ("ColorJitter", {"saturation": (0.5, 0.5)}),
+        ("ColorJitter", {"hue": (0.25, 0.25)}),
+        ("SharpnessJitter", {"sharpness": (2.0, 2.0)}),
+        ("RandomAffine", {"degrees": (10.0, 10.0), "interpolation": InterpolationMode.BILINEAR}),
+    ],
+)
+def test_batched_image_transforms_match_per_sample(img_tensor_factory, tf_type, kwargs):
+    # Batch of 4 samples with a temporal window of 2 frames
+    batch = torch.stack([torch.stack([img_tensor_factory(), img_tensor_factory()]) for _ in range(4)])
+    tf_cfg = ImageTransformsConfig(enable=True, tfs={"tf": ImageTransformConfig(type=tf_type, kwargs=kwargs)})
+
+    expected = torch.stack([ImageTransforms(tf_cfg)(sample) for sample in batch])
+    actual = BatchedImageTransforms(tf_cfg)(batch)
+    torch.testing.assert_close(actual, expected, atol=1e-5, rtol=1e-5)
+
+
+def test_batched_image_transforms_disabled(img_tensor_factory):
+    batch = torch.stack([img_tensor_factory() for _ in range(3)])
+    torch.testing.assert_close(BatchedImageTransforms(ImageTransformsConfig())(batch), batch)
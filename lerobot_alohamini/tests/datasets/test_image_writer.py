@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import multiprocessing
 import queue
 import time
 from multiprocessing import queues
@@ -22,6 +23,7 @@ from PIL import Image
 
 from lerobot.datasets.image_writer import (
     AsyncImageWriter,
+    SharedFrameRing,
     image_array_to_pil_image,
     safe_stop_image_writer,
     write_image,
@@ -177,6 +179,43 @@ def test_save_image_numpy_multiprocessing(tmp_path, img_array_factory):
         writer.stop()
 
 
+def test_save_image_numpy_shared_frame_ring(tmp_path, img_array_factory):
+    # Slots fit the small images, the large one is sent through the queue
+    writer = AsyncImageWriter(
+        num_processes=1, num_threads=2, num_shared_slots=2, shared_slot_nbytes=32 * 32 * 3
+    )
+    try:
+        assert isinstance(writer.frame_ring, SharedFrameRing)
+        image_arrays = [img_array_factory(height=32, width=32) for _ in range(5)]
+        image_arrays.append(img_array_factory(height=64, width=64))
+        for i, image_array in enumerate(image_arrays):
+            writer.save_image(image_array, tmp_path / f"frame_{i}.png")
+        writer.wait_until_done()
+
+        for i, image_array in enumerate(image_arrays):
+            saved_image = np.array(Image.open(tmp_path / f"frame_{i}.png"))
+            assert np.array_equal(image_array, saved_image)
+
+        stats = writer.stats()
+        assert stats["slots_in_use"] == 0
+        assert 1 <= stats["max_slots_in_use"] <= 2
+        assert stats["max_latency_s"] > 0
+    finally:
+        writer.stop()
+
+
+def test_shared_frame_ring_put_raises_when_writers_exited(img_array_factory):
+    ring = SharedFrameRing(num_slots=1, slot_nbytes=32 * 32 * 3)
+    ring.put(img_array_factory(height=32, width=32))
+
+    # The only slot is never freed, the writer process has exited
+    writer_process = multiprocessing.Process(target=int)
+    writer_process.start()
+    writer_process.join()
+    with pytest.raises(RuntimeError, match="exited"):
+        ring.put(img_array_factory(height=32, width=32), writer_processes=[writer_process], timeout_s=0.01)
+
+
 def test_save_image_torch(tmp_path, img_tensor_factory):
     writer = AsyncImageWriter()
     try:
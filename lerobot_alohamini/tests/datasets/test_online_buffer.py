@@ -20,7 +20,7 @@ import numpy as np
 import pytest
 import torch
 
-from lerobot.datasets.online_buffer import OnlineBuffer, compute_sampler_weights
+from lerobot.datasets.online_buffer import OnlineBuffer, SamplerWeights, compute_sampler_weights
 
 # Some constants for OnlineBuffer tests.
 data_key = "data"
@@ -208,6 +208,52 @@ def test_delta_timestamps_outside_tolerance_outside_episode_range():
     )
 
 
+def test_get_batch_delta_timestamps_after_fifo_wrap():
+    """Check that a batch gathers, for every item, the closest frames of its own episode, including episodes
+    that wrapped around the end of the buffer."""
+    delta_timestamps = [-0.32, -0.1, 0, 0.2, 1.0]
+    buffer, _ = make_new_buffer(delta_timestamps={"index": delta_timestamps})
+    buffer.add_data(make_spoof_data_frames(n_episodes=3, n_frames_per_episode=30))
+    buffer.add_data(make_spoof_data_frames(n_episodes=2, n_frames_per_episode=30))
+
+    indices = np.arange(len(buffer))
+    batch = buffer.get_batch(indices)
+    assert batch[data_key].shape == (len(buffer), *data_shape)
+    assert batch["index"].shape == (len(buffer), len(delta_timestamps))
+
+    episode_indices = buffer._data[OnlineBuffer.EPISODE_INDEX_KEY]
+    timestamps = buffer._data[OnlineBuffer.TIMESTAMP_KEY]
+    for i in indices:
+        episode = np.flatnonzero(episode_indices == episode_indices[i])
+        query_ts = timestamps[i] + np.array(delta_timestamps)
+        dist = np.abs(query_ts[:, None] - timestamps[episode][None, :])
+        expected = buffer._data["index"][episode[dist.argmin(axis=1)]]
+        assert np.array_equal(batch["index"][i].numpy(), expected)
+        assert np.array_equal(batch["index_is_pad"][i].numpy(), dist.min(axis=1) > buffer.tolerance_s)
+        for k in buffer[i]:
+            assert torch.equal(buffer[i][k], batch[k][i])
+
+
+def test_sampler_weights_are_updated_when_adding_data(lerobot_dataset_factory, tmp_path):
+    offline_dataset = lerobot_dataset_factory(tmp_path, total_episodes=2, total_frames=6)
+    online_dataset, _ = make_new_buffer()
+    online_dataset.add_data(make_spoof_data_frames(n_episodes=3, n_frames_per_episode=20))
+    kwargs = {
+        "offline_drop_n_last_frames": 1,
+        "online_dataset": online_dataset,
+        "online_sampling_ratio": 0.5,
+        "online_drop_n_last_frames": 2,
+    }
+    sampler_weights = SamplerWeights(offline_dataset, **kwargs)
+    torch.testing.assert_close(sampler_weights.weights, compute_sampler_weights(offline_dataset, **kwargs))
+
+    # Wraps around the end of the buffer and overwrites the beginning of the first episode
+    online_dataset.add_data(make_spoof_data_frames(n_episodes=3, n_frames_per_episode=15))
+    weights = sampler_weights.weights
+    assert len(weights) == len(offline_dataset) + buffer_capacity
+    torch.testing.assert_close(weights, compute_sampler_weights(offline_dataset, **kwargs))
+
+
 # Arbitrarily set small dataset sizes, making sure to have uneven sizes.
 @pytest.mark.parametrize("offline_dataset_size", [1, 6])
 @pytest.mark.parametrize("online_dataset_size", [0, 4])
@@ -390,3 +390,33 @@ def test_frames_with_delta_consistency_with_shards(
         assert all(t[1] for t in key_checks), (
             f"Checking {list(filter(lambda t: not t[1], key_checks))[0][0]} left and right were found different (i: {i}, frame_idx: {frame_idx})"
         )
+
+
+def test_prefetching_preserves_frames_order(tmp_path, lerobot_dataset_factory):
+    """Frames read ahead by the shard readers are yielded in the same order as when read synchronously."""
+    local_path = tmp_path / "test"
+    repo_id = f"{DUMMY_REPO_ID}-prefetch"
+
+    lerobot_dataset_factory(
+        root=local_path,
+        repo_id=repo_id,
+        total_episodes=10,
+        total_frames=100,
+        data_files_size_in_mb=0.001,
+        chunks_size=1,
+    )
+
+    def stream_indices(prefetch_size):
+        streaming_ds = StreamingLeRobotDataset(
+            repo_id=repo_id,
+            root=local_path,
+            buffer_size=10,
+            seed=42,
+            shuffle=False,
+            max_num_shards=4,
+            prefetch_size=prefetch_size,
+            num_decode_workers=2,
+        )
+        return [frame["index"] for frame in streaming_ds]
+
+    assert stream_indices(prefetch_size=3) == stream_indices(prefetch_size=0)
@@ -75,6 +75,21 @@ def test_factory(env_name):
     env.close()
 
 
+def test_preprocess_observation_uint8_image_transfer():
+    rng = np.random.default_rng(0)
+    observation = {
+        "pixels": {"top": rng.integers(0, 256, size=(2, 8, 6, 3), dtype=np.uint8)},
+        "agent_pos": rng.normal(size=(2, 4)),
+    }
+
+    expected = preprocess_observation(observation)
+    obs = preprocess_observation(observation, image_device="cpu")
+    assert set(obs) == set(expected)
+    for key in obs:
+        assert obs[key].is_contiguous()
+        torch.testing.assert_close(obs[key], expected[key], rtol=0, atol=0)
+
+
 def test_factory_custom_gym_id():
     gym_id = "dummy_gym_pkg/DummyTask-v0"
     if gym_id in gym_registry:
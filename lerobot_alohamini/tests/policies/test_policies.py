@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import inspect
+import threading
 from copy import deepcopy
 from pathlib import Path
 
@@ -33,7 +34,7 @@ from lerobot.envs.factory import make_env, make_env_config
 from lerobot.envs.utils import preprocess_observation
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.act.configuration_act import ACTConfig
-from lerobot.policies.act.modeling_act import ACTTemporalEnsembler
+from lerobot.policies.act.modeling_act import ACTPolicy, ACTTemporalEnsembler
 from lerobot.policies.factory import (
     get_policy_class,
     make_policy,
@@ -41,7 +42,7 @@ from lerobot.policies.factory import (
     make_pre_post_processors,
 )
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 from lerobot.utils.random_utils import seeded_context
 from tests.artifacts.policies.save_policy_to_safetensors import get_policy_stats
 from tests.utils import DEVICE, require_cpu, require_env, require_x86_64_kernel
@@ -452,3 +453,107 @@ def test_act_temporal_ensembler():
         assert torch.all(offline_avg <= einops.reduce(seq_slice, "b s 1 -> b 1", "max"))
         # Selected atol=1e-4 keeping in mind actions in [-1, 1] and excepting 0.01% error.
         torch.testing.assert_close(online_avg, offline_avg, rtol=1e-4, atol=1e-4)
+
+
+def _make_prefetching_act_policy(predict_action_chunk, **config_kwargs):
+    config = ACTConfig(
+        input_features={OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(1,))},
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(1,))},
+        chunk_size=10,
+        n_action_steps=10,
+        dim_model=16,
+        n_heads=2,
+        dim_feedforward=32,
+        use_vae=False,
+        device="cpu",
+        **config_kwargs,
+    )
+    policy = ACTPolicy(config)
+    policy.predict_action_chunk = predict_action_chunk
+    return policy
+
+
+def test_act_async_prefetch_time_aligns_chunks():
+    """Prefetched chunks are predicted off the caller thread and aligned with the steps executed meanwhile."""
+    callers = []
+
+    def predict_action_chunk(batch):
+        callers.append(threading.current_thread() is threading.main_thread())
+        # The action predicted for step `step + i` is `step + i`
+        return (batch["step"] + torch.arange(10, dtype=torch.float32)).view(1, 10, 1)
+
+    policy = _make_prefetching_act_policy(predict_action_chunk, async_prefetch_low_water_mark=3)
+    for step in range(35):
+        action = policy.select_action({"step": torch.tensor(float(step))})
+        assert action.item() == step
+
+    # Only the very first chunk is predicted synchronously
+    assert callers[0] is True
+    assert len(callers) > 1
+    assert not any(callers[1:])
+
+
+def test_act_async_prefetch_blends_chunks():
+    calls = []
+
+    def predict_action_chunk(batch):
+        calls.append(batch)
+        return torch.full((1, 10, 1), float(len(calls) > 1))
+
+    policy = _make_prefetching_act_policy(
+        predict_action_chunk, async_prefetch_low_water_mark=3, async_prefetch_blend_steps=2
+    )
+    actions = []
+    for _ in range(11):
+        actions.append(policy.select_action({}).item())
+        if policy._prefetch is not None:
+            # Make the prefetched chunk available at the next step
+            policy._prefetch[0].result()
+
+    # The prefetch starts with 3 queued actions, the 2 left when it arrives are cross-faded into the new chunk
+    assert actions[:8] == [0.0] * 8
+    assert actions[8:] == pytest.approx([1 / 3, 2 / 3, 1.0])
+
+
+def test_act_async_prefetch_runs_in_caller_modes_and_is_released_on_reset():
+    inference_modes = []
+
+    def predict_action_chunk(batch):
+        inference_modes.append(torch.is_inference_mode_enabled())
+        return torch.zeros(1, 10, 1)
+
+    policy = _make_prefetching_act_policy(predict_action_chunk, async_prefetch_low_water_mark=9)
+    with torch.inference_mode():
+        policy.select_action({})
+        policy.select_action({})
+    policy._prefetch[0].result()
+    # The prefetch thread predicts in the inference mode of the caller
+    assert inference_modes == [True, True]
+
+    policy.reset()
+    assert policy._prefetch_executor is None
+    assert policy._prefetch is None
+
+    # Copies don't share the prefetch thread
+    policy.select_action({})
+    policy.select_action({})
+    policy._prefetch[0].result()
+    copy = deepcopy(policy)
+    assert copy._prefetch_executor is None
+    assert copy._prefetch is None
+    assert inference_modes[2:] == [False, False]
+
+
+def test_act_temporal_ensembler_reuses_its_buffer():
+    chunk_size = 4
+    ensembler = ACTTemporalEnsembler(0.01, chunk_size)
+    ensembler.update(torch.ones(2, chunk_size, 3))
+    buffer_ptr = ensembler.weighted_action_sums.data_ptr()
+    for _ in range(2 * chunk_size):
+        action = ensembler.update(torch.ones(2, chunk_size, 3))
+        torch.testing.assert_close(action, torch.ones(2, 3))
+    assert ensembler.weighted_action_sums.data_ptr() == buffer_ptr
+
+    # A new episode starts from an empty ensemble
+    ensembler.reset()
+    torch.testing.assert_close(ensembler.update(torch.full((2, chunk_size, 3), 5.0)), torch.full((2, 3), 5.0))
@@ -2128,3 +2128,36 @@ def test_stats_reconstruction_after_load_state_dict():
         new_result[TransitionKey.OBSERVATION][OBS_STATE],
     )
     torch.testing.assert_close(original_result[TransitionKey.ACTION], new_result[TransitionKey.ACTION])
+
+
+@pytest.mark.parametrize(
+    "norm_mode, stats",
+    [
+        (NormalizationMode.MEAN_STD, {"mean": np.array([0.5, -1.0, 0.0]), "std": np.array([0.2, 2.0, 0.0])}),
+        (NormalizationMode.MIN_MAX, {"min": np.array([-1.0, 0.0, 3.0]), "max": np.array([1.0, 10.0, 3.0])}),
+        (NormalizationMode.QUANTILES, {"q01": np.array([0.1, -0.8, 1.0]), "q99": np.array([0.9, 0.8, 1.0])}),
+        (NormalizationMode.QUANTILE10, {"q10": np.array([0.2, -0.5, 0.0]), "q90": np.array([0.8, 0.5, 4.0])}),
+    ],
+)
+@pytest.mark.parametrize("inverse", [False, True])
+def test_affine_params_match_transform(norm_mode, stats, inverse):
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (3,))}
+    step_cls = UnnormalizerProcessorStep if inverse else NormalizerProcessorStep
+    step = step_cls(features=features, norm_map={FeatureType.STATE: norm_mode}, stats={OBS_STATE: stats})
+
+    tensor = torch.tensor([[0.3, -2.0, 5.0], [1.5, 4.0, -1.0]])
+    scale, shift = step.affine_params(OBS_STATE, FeatureType.STATE, inverse=inverse)
+    expected = step._apply_transform(tensor, OBS_STATE, FeatureType.STATE, inverse=inverse)
+
+    assert torch.allclose(torch.addcmul(shift, tensor, scale), expected, rtol=1e-5, atol=1e-5)
+
+
+def test_affine_params_identity():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (2,))}
+    stats = {OBS_STATE: {"mean": np.zeros(2), "std": np.ones(2)}}
+    normalizer = NormalizerProcessorStep(
+        features=features, norm_map={FeatureType.STATE: NormalizationMode.IDENTITY}, stats=stats
+    )
+    assert normalizer.affine_params(OBS_STATE, FeatureType.STATE) is None
+    # Features without stats are left unchanged as well
+    assert normalizer.affine_params("observation.unknown", FeatureType.STATE) is None
@@ -103,6 +103,7 @@ def test_establish_learner_connection_failure():
 @require_package("grpc")
 def test_push_transitions_to_transport_queue():
     from lerobot.rl.actor import push_transitions_to_transport_queue
+    from lerobot.rl.buffer import batch_to_transitions
     from lerobot.transport.utils import bytes_to_transitions
     from tests.transport.test_transport_utils import assert_transitions_equal
 
@@ -129,7 +130,7 @@ def test_push_transitions_to_transport_queue():
     # Verify the data can be retrieved
     serialized_data = transitions_queue.get()
     assert isinstance(serialized_data, bytes)
-    deserialized_transitions = bytes_to_transitions(serialized_data)
+    deserialized_transitions = batch_to_transitions(bytes_to_transitions(serialized_data))
     assert len(deserialized_transitions) == len(transitions)
     for i, deserialized_transition in enumerate(deserialized_transitions):
         assert_transitions_equal(deserialized_transition, transitions[i])
@@ -97,6 +97,7 @@ def test_end_to_end_transitions_flow(cfg):
         push_transitions_to_transport_queue,
         send_transitions,
     )
+    from lerobot.rl.buffer import batch_to_transitions
     from lerobot.rl.learner import start_learner
     from lerobot.transport.utils import bytes_to_transitions
     from tests.transport.test_transport_utils import assert_transitions_equal
@@ -143,7 +144,9 @@ def test_end_to_end_transitions_flow(cfg):
 
     received_transitions = []
     while not transitions_learner_queue.empty():
-        received_transitions.extend(bytes_to_transitions(transitions_learner_queue.get()))
+        received_transitions.extend(
+            batch_to_transitions(bytes_to_transitions(transitions_learner_queue.get()))
+        )
 
     assert len(received_transitions) == len(input_transitions)
     for i, transition in enumerate(received_transitions):
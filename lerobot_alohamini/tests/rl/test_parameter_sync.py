@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_sync import (
+    ENCODING_DELTA,
+    ParameterReceiver,
+    ParameterSender,
+    decode_parameter_update_header,
+    drop_superseded_updates,
+    encode_parameter_update,
+    is_parameter_keyframe,
+    iter_parameter_update,
+)
+from lerobot.transport.utils import state_to_bytes
+
+
+def _make_modules(seed: int) -> dict[str, nn.Module]:
+    torch.manual_seed(seed)
+    encoder = nn.Linear(4, 8)
+    for param in encoder.parameters():
+        param.requires_grad = False
+    actor = nn.Sequential(encoder, nn.Linear(8, 2), nn.BatchNorm1d(2))
+    return {"policy": actor}
+
+
+def _assert_modules_equal(left: dict[str, nn.Module], right: dict[str, nn.Module], atol: float = 0.0):
+    for key in left:
+        left_state, right_state = left[key].state_dict(), right[key].state_dict()
+        for name in left_state:
+            torch.testing.assert_close(left_state[name], right_state[name], atol=atol, rtol=0)
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16, torch.int64, torch.bool])
+def test_encode_decode_roundtrip(dtype):
+    tensor = (torch.randn(3, 5) * 10).to(dtype)
+    buffer = encode_parameter_update(3, 2, False, [("a", "value", tensor), ("b", "value", tensor[:0])])
+
+    header = decode_parameter_update_header(buffer)
+    assert header.version == 3
+    assert header.base_version == 2
+    assert not header.keyframe
+
+    decoded = list(iter_parameter_update(buffer))
+    assert [name for name, _, _ in decoded] == ["a", "b"]
+    torch.testing.assert_close(decoded[0][2], tensor)
+    assert decoded[1][2].shape == (0, 5)
+
+
+def test_sender_sends_frozen_parameters_once_and_only_changed_tensors():
+    learner, actor = _make_modules(seed=0), _make_modules(seed=1)
+    sender = ParameterSender(learner, keyframe_interval=0)
+    receiver = ParameterReceiver(actor)
+
+    first = sender.encode_update()
+    assert receiver.apply(first)
+    _assert_modules_equal(learner, actor)
+
+    with torch.no_grad():
+        learner["policy"][1].weight.add_(1.0)
+
+    second = sender.encode_update()
+    names = [entry["name"] for entry in decode_parameter_update_header(second).tensors]
+    assert names == ["policy.1.weight"]
+    assert receiver.apply(second)
+    assert receiver.version == 1
+    _assert_modules_equal(learner, actor)
+
+
+def test_sender_sends_frozen_parameters_with_every_keyframe():
+    learner = _make_modules(seed=0)
+    sender = ParameterSender(learner, keyframe_interval=2)
+    frozen = {"policy.0.weight", "policy.0.bias"}
+
+    for version in range(5):
+        header = decode_parameter_update_header(sender.encode_update())
+        names = {entry["name"] for entry in header.tensors}
+        assert header.keyframe == (version % 2 == 0)
+        assert (frozen <= names) == header.keyframe
+
+
+def test_sender_deltas_in_reduced_precision_do_not_drift():
+    learner, actor = _make_modules(seed=0), _make_modules(seed=1)
+    sender = ParameterSender(learner, wire_dtype="bfloat16", use_deltas=True, keyframe_interval=0)
+    receiver = ParameterReceiver(actor)
+    receiver.apply(sender.encode_update())
+
+    for _ in range(20):
+        with torch.no_grad():
+            learner["policy"][1].weight.add_(torch.randn_like(learner["policy"][1].weight) * 1e-3)
+        update = sender.encode_update()
+        assert all(
+            entry["encoding"] == ENCODING_DELTA for entry in decode_parameter_update_header(update).tensors
+        )
+        receiver.apply(update)
+
+    # The receiver holds exactly what the sender believes it holds
+    torch.testing.assert_close(actor["policy"][1].weight, sender._sent["policy.1.weight"], atol=0, rtol=0)
+    torch.testing.assert_close(actor["policy"][1].weight, learner["policy"][1].weight, atol=0.05, rtol=0)
+
+
+def test_receiver_skips_updates_with_a_gap_until_next_keyframe():
+    learner, actor = _make_modules(seed=0), _make_modules(seed=1)
+    sender = ParameterSender(learner, keyframe_interval=3)
+    receiver = ParameterReceiver(actor)
+
+    updates = []
+    for _ in range(4):  # v0 (keyframe), v1, v2, v3 (keyframe)
+        with torch.no_grad():
+            learner["policy"][1].bias.add_(1.0)
+        updates.append(sender.encode_update())
+
+    assert receiver.apply(updates[0])
+    # v1 was lost
+    assert not receiver.apply(updates[2])
+    assert receiver.version == 0
+    assert receiver.apply(updates[3])
+    _assert_modules_equal(learner, actor)
+
+
+def test_drop_superseded_updates():
+    learner = _make_modules(seed=0)
+    sender = ParameterSender(learner, keyframe_interval=2)
+    updates = [sender.encode_update() for _ in range(4)]  # keyframes: v0, v2
+
+    assert [is_parameter_keyframe(update) for update in updates] == [True, False, True, False]
+    assert drop_superseded_updates(updates) == updates[2:]
+    # Full state dicts are self-contained
+    assert is_parameter_keyframe(state_to_bytes({"a": torch.ones(1)}))
@@ -20,7 +20,7 @@ from queue import Queue
 
 from torch.multiprocessing import Queue as TorchMPQueue
 
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.queue import get_all_items_from_queue, get_last_item_from_queue
 
 
 def test_get_last_item_single_item():
@@ -164,3 +164,26 @@ def test_get_last_item_blocking_waits_for_item():
 
     assert result == ["item2"]
     assert queue.empty()
+
+
+def test_get_all_items_keeps_insertion_order():
+    """Test that get_all_items_from_queue drains every item in order."""
+    queue = TorchMPQueue()
+    items = ["first", "second", "third"]
+
+    for item in items:
+        queue.put(item)
+
+    # Allow the feeder thread of the multiprocessing queue to flush
+    time.sleep(0.1)
+    result = get_all_items_from_queue(queue)
+
+    assert result == items
+
+
+def test_get_all_items_empty_queue():
+    """Test get_all_items_from_queue returns an empty list on timeout or without blocking."""
+    queue = Queue()
+
+    assert get_all_items_from_queue(queue, block=True, timeout=0.1) == []
+    assert get_all_items_from_queue(queue, block=False) == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import sys
+import types
+from types import SimpleNamespace
+
+import gymnasium as gym
+import torch
+
+from lerobot.configs.default import EvalConfig
+from lerobot.envs.configs import LiberoEnv
+from lerobot.scripts.lerobot_eval import (
+    _TrajectoryBuffer,
+    aggregate_task_metrics,
+    load_eval_results,
+    make_task_env,
+    merge_shard_results,
+)
+
+
+def test_trajectory_buffer_grows_and_matches_stack():
+    buffer = _TrajectoryBuffer(max_length=11, initial_length=2)
+    steps = [
+        {"observation.state": torch.randn(3, 4), "done": torch.tensor([False, i > 5, i > 8])}
+        for i in range(11)
+    ]
+    for i, values in enumerate(steps):
+        buffer.write(i, values)
+
+    assert buffer.tensors["observation.state"].shape[1] == 11
+    data = buffer.get()
+    for key in steps[0]:
+        torch.testing.assert_close(data[key], torch.stack([step[key] for step in steps], dim=1))
+
+
+def test_trajectory_buffer_copies_values():
+    buffer = _TrajectoryBuffer(max_length=4)
+    value = torch.zeros(2, 3)
+    buffer.write(0, {"action": value})
+    value += 1
+    buffer.write(1, {"action": value})
+
+    torch.testing.assert_close(buffer.get()["action"][:, 0], torch.zeros(2, 3))
+    torch.testing.assert_close(buffer.get()["action"][:, 1], torch.ones(2, 3))
+
+
+def test_shard_results_are_merged_in_episode_order(tmp_path):
+    def shard(task_id, episode_start, successes):
+        metrics = {"sum_rewards": [1.0] * len(successes), "max_rewards": [1.0] * len(successes)}
+        metrics.update(successes=successes, video_paths=[])
+        return {"task_group": "suite", "task_id": task_id, "episode_start": episode_start, "metrics": metrics}
+
+    results_path = tmp_path / "eval_results.jsonl"
+    with open(results_path, "w") as f:
+        for result in [shard(1, 0, [True]), shard(0, 2, [False, False]), shard(0, 0, [True, True])]:
+            f.write(json.dumps(result) + "\n")
+        # Line truncated by an interrupted evaluation
+        f.write('{"task_group": "suite", "task_')
+
+    per_task_infos = merge_shard_results(load_eval_results(results_path))
+    assert [info["task_id"] for info in per_task_infos] == [0, 1]
+    assert per_task_infos[0]["metrics"]["successes"] == [True, True, False, False]
+
+    info = aggregate_task_metrics(per_task_infos, start_t=0.0)
+    assert info["overall"]["n_episodes"] == 5
+    assert info["overall"]["pc_success"] == 60.0
+    assert info["per_group"]["suite"]["n_episodes"] == 5
+
+
+def test_make_task_env_builds_single_libero_task(monkeypatch):
+    calls = []
+
+    class FakeVecEnv:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def create_libero_envs(task, n_envs, gym_kwargs, env_cls, **kwargs):
+        calls.append({"task": task, "n_envs": n_envs, "gym_kwargs": gym_kwargs, "env_cls": env_cls})
+        return {task: {tid: FakeVecEnv() for tid in gym_kwargs["task_ids"]}}
+
+    fake_libero = types.ModuleType("lerobot.envs.libero")
+    fake_libero.create_libero_envs = create_libero_envs
+    monkeypatch.setitem(sys.modules, "lerobot.envs.libero", fake_libero)
+
+    cfg = SimpleNamespace(env=LiberoEnv(task="libero_10"), eval=EvalConfig(n_episodes=2, batch_size=2))
+    env = make_task_env(cfg, "libero_spatial", 3)
+
+    assert isinstance(env, FakeVecEnv) and not env.closed
+    assert calls == [
+        {
+            "task": "libero_spatial",
+            "n_envs": 2,
+            "gym_kwargs": {**cfg.env.gym_kwargs, "task_ids": [3]},
+            "env_cls": gym.vector.SyncVectorEnv,
+        }
+    ]
+    # The config itself is left untouched
+    assert cfg.env.task == "libero_10"
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DeviceProcessorStep,
+    IdentityProcessorStep,
+    NormalizerProcessorStep,
+    PolicyAction,
+    PolicyProcessorPipeline,
+    RenameObservationsProcessorStep,
+    UnnormalizerProcessorStep,
+)
+from lerobot.processor.converters import policy_action_to_transition, transition_to_policy_action
+from lerobot.utils.constants import ACTION, OBS_STATE
+from lerobot.utils.control_utils import PolicyInferenceSession, predict_action
+
+IMAGE_KEY = "observation.images.front"
+
+
+class DummyPolicy:
+    """Policy whose action depends on the state and on the image, and that keeps the batches it received."""
+
+    def __init__(self):
+        self.batches = []
+
+    def reset(self):
+        self.batches.clear()
+
+    def predict_action_chunk(self, batch):
+        return batch[OBS_STATE][:, :2] + batch[IMAGE_KEY].mean(dim=(2, 3))[:, :2]
+
+    def select_action(self, batch):
+        self.batches.append(batch)
+        return self.predict_action_chunk(batch)
+
+
+def make_processors(extra_step=None):
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (3,)),
+        IMAGE_KEY: PolicyFeature(FeatureType.VISUAL, (3, 4, 6)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (2,)),
+    }
+    norm_map = {
+        FeatureType.STATE: NormalizationMode.MEAN_STD,
+        FeatureType.VISUAL: NormalizationMode.MEAN_STD,
+        FeatureType.ACTION: NormalizationMode.MIN_MAX,
+    }
+    stats = {
+        OBS_STATE: {"mean": np.array([0.1, -0.2, 0.3]), "std": np.array([0.5, 2.0, 1.0])},
+        IMAGE_KEY: {"mean": np.full((3, 1, 1), 0.5), "std": np.full((3, 1, 1), 0.25)},
+        ACTION: {"min": np.array([-1.0, 0.0]), "max": np.array([1.0, 4.0])},
+    }
+    input_steps = [
+        RenameObservationsProcessorStep(rename_map={}),
+        AddBatchDimensionProcessorStep(),
+        DeviceProcessorStep(device="cpu"),
+        NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+    ]
+    if extra_step is not None:
+        input_steps.append(extra_step)
+    output_steps = [
+        UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+        DeviceProcessorStep(device="cpu"),
+    ]
+    preprocessor = PolicyProcessorPipeline[dict[str, Any], dict[str, Any]](steps=input_steps)
+    postprocessor = PolicyProcessorPipeline[PolicyAction, PolicyAction](
+        steps=output_steps,
+        to_transition=policy_action_to_transition,
+        to_output=transition_to_policy_action,
+    )
+    return preprocessor, postprocessor
+
+
+def make_observation(seed):
+    rng = np.random.default_rng(seed)
+    return {
+        OBS_STATE: rng.normal(size=3).astype(np.float32),
+        IMAGE_KEY: rng.integers(0, 256, size=(4, 6, 3), dtype=np.uint8),
+    }
+
+
+@pytest.mark.parametrize("extra_step", [None, IdentityProcessorStep()])
+def test_inference_session_matches_predict_action(extra_step):
+    preprocessor, postprocessor = make_processors(extra_step)
+    policy = DummyPolicy()
+    session = PolicyInferenceSession(policy, preprocessor, postprocessor, device=torch.device("cpu"))
+    # Unknown processor steps disable the fused path
+    assert session.is_fused == (extra_step is None)
+
+    for seed in range(3):
+        observation = make_observation(seed)
+        expected = predict_action(
+            observation, policy, torch.device("cpu"), preprocessor, postprocessor, use_amp=False
+        )
+        action = session(observation)
+        assert action.device.type == "cpu"
+        torch.testing.assert_close(action, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_inference_session_does_not_alias_inputs_across_ticks():
+    preprocessor, postprocessor = make_processors()
+    policy = DummyPolicy()
+    session = PolicyInferenceSession(policy, preprocessor, postprocessor, device=torch.device("cpu"))
+
+    session(make_observation(0))
+    first_batch = {key: value.clone() for key, value in policy.batches[0].items() if torch.is_tensor(value)}
+    session(make_observation(1))
+
+    # Overwriting the input buffers at the second tick must not change what the policy received at the first
+    for key, value in first_batch.items():
+        torch.testing.assert_close(policy.batches[0][key], value)
+
+
+def test_inference_session_latency_stats():
+    preprocessor, postprocessor = make_processors()
+    session = PolicyInferenceSession(DummyPolicy(), preprocessor, postprocessor, device=torch.device("cpu"))
+
+    stats = session.latency_stats()
+    assert set(stats) == set(PolicyInferenceSession.STAGES)
+    assert all(stage_stats["max_s"] == 0.0 for stage_stats in stats.values())
+
+    for seed in range(4):
+        session(make_observation(seed))
+
+    for stage in PolicyInferenceSession.STAGES:
+        assert len(session.latencies_s[stage]) == 4
+        assert session.latency_stats()[stage]["max_s"] >= session.latency_stats()[stage]["mean_s"] >= 0.0
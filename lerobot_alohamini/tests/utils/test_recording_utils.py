@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from lerobot.utils.recording_utils import (
+    FrameConsumer,
+    LoopTimingStats,
+    append_recording_stats,
+    load_recording_stats,
+    remap_recording_stats,
+)
+
+
+def test_frame_consumer_consumes_all_items_in_order():
+    consumed = []
+    consumer = FrameConsumer(consumed.append, name="test_consumer", maxsize=2)
+    for i in range(20):
+        assert consumer.put(i)
+    consumer.close()
+
+    assert consumed == list(range(20))
+
+
+def test_frame_consumer_drops_when_full():
+    release = threading.Event()
+    consumed = []
+
+    def slow_consume(item):
+        release.wait()
+        consumed.append(item)
+
+    consumer = FrameConsumer(slow_consume, name="test_consumer", maxsize=1, drop_when_full=True)
+    results = [consumer.put(i) for i in range(10)]
+    release.set()
+    consumer.close()
+
+    # At most one item is being consumed and one is waiting in the queue
+    assert results.count(True) <= 2
+    assert consumer.num_dropped == results.count(False) >= 8
+    assert len(consumed) == results.count(True)
+
+
+def test_frame_consumer_reraises_errors():
+    def fail(item):
+        raise ValueError(f"invalid frame {item}")
+
+    consumer = FrameConsumer(fail, name="test_consumer", maxsize=4)
+    consumer.put(0)
+    with pytest.raises(RuntimeError, match="test_consumer failed"):
+        consumer.close()
+
+
+def test_loop_timing_stats():
+    stats = LoopTimingStats(fps=10)
+    stats.record_iteration(busy_s=0.05, period_s=None)
+    stats.record_iteration(busy_s=0.05, period_s=0.1)
+    # A slow iteration delays the next one by two periods
+    stats.record_iteration(busy_s=0.25, period_s=0.1)
+    stats.record_iteration(busy_s=0.05, period_s=0.3)
+
+    metadata = stats.to_episode_metadata()
+    assert metadata["num_overruns"] == 1
+    assert metadata["num_dropped_frames"] == 2
+    assert metadata["period_max_s"] == pytest.approx(0.3)
+    assert metadata["period_mean_s"] == pytest.approx(0.5 / 3)
+
+
+def test_append_and_load_recording_stats(tmp_path):
+    assert load_recording_stats(tmp_path) == []
+
+    append_recording_stats(tmp_path, 0, LoopTimingStats(fps=30).to_episode_metadata())
+    append_recording_stats(tmp_path, 1, {"num_overruns": 3})
+
+    stats = load_recording_stats(tmp_path)
+    assert [s["episode_index"] for s in stats] == [0, 1]
+    assert stats[0]["fps"] == 30
+    assert stats[1]["num_overruns"] == 3
+
+
+def test_remap_recording_stats(tmp_path):
+    src_roots = [tmp_path / "a", tmp_path / "b"]
+    for ep_idx in range(3):
+        append_recording_stats(src_roots[0], ep_idx, {"num_overruns": ep_idx})
+    append_recording_stats(src_roots[1], 0, {"num_overruns": 10})
+
+    # Episode 1 of the first dataset is dropped, the second dataset follows the first one
+    remap_recording_stats(src_roots, [{0: 0, 2: 1}, {0: 2}], tmp_path / "dst")
+    stats = load_recording_stats(tmp_path / "dst")
+    assert [(s["episode_index"], s["num_overruns"]) for s in stats] == [(0, 0), (1, 2), (2, 10)]
+
+    # No stats left, the file is not written
+    remap_recording_stats(src_roots, [{}, {}], tmp_path / "empty")
+    assert load_recording_stats(tmp_path / "empty") == []
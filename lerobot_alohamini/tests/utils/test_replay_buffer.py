@@ -21,8 +21,18 @@ import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    _allocate_staging,
+    _fill_staging_slot,
+    _select_rows,
+    batch_to_transitions,
+    random_crop_vectorized,
+    transitions_to_batch,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
+from lerobot.utils.transition import Transition
 from tests.fixtures.constants import DUMMY_REPO_ID
 
 
@@ -236,6 +246,158 @@ def test_add_over_capacity():
     assert replay_buffer.truncateds[0], "Truncated should be True for the first transition."
 
 
+def create_dummy_transitions(count: int) -> list[Transition]:
+    return [
+        Transition(
+            state=create_dummy_state(),
+            action=create_dummy_action(),
+            reward=float(i),
+            next_state=create_dummy_state(),
+            done=i == count - 1,
+            truncated=False,
+            complementary_info={"discrete_penalty": torch.tensor([float(i)])},
+        )
+        for i in range(count)
+    ]
+
+
+def test_transitions_to_batch_roundtrip():
+    transitions = create_dummy_transitions(4)
+    batch = transitions_to_batch(transitions)
+
+    assert batch["state"][OBS_IMAGE].dtype == torch.uint8
+    assert batch["state"][OBS_IMAGE].shape == (4, 3, 84, 84)
+    assert batch["state"][OBS_STATE].dtype == torch.float32
+    assert batch[ACTION].shape == (4, 4)
+    assert batch["reward"].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert batch["done"].tolist() == [False, False, False, True]
+    assert batch["complementary_info"]["discrete_penalty"].shape == (4,)
+
+    for original, reconstructed in zip(transitions, batch_to_transitions(batch), strict=True):
+        torch.testing.assert_close(
+            reconstructed["state"][OBS_IMAGE], original["state"][OBS_IMAGE], atol=1 / 255, rtol=0
+        )
+        assert torch.equal(reconstructed["state"][OBS_STATE], original["state"][OBS_STATE])
+        assert torch.equal(reconstructed[ACTION], original[ACTION])
+
+
+def test_add_batch_matches_add():
+    transitions = create_dummy_transitions(7)
+    batch = transitions_to_batch(transitions, images_to_uint8=False)
+
+    batched_buffer = create_empty_replay_buffer()
+    batched_buffer.add_batch(**batch)
+
+    buffer = create_empty_replay_buffer()
+    for transition in transitions:
+        buffer.add(**transition)
+
+    assert len(batched_buffer) == len(buffer) == 7
+    assert batched_buffer.position == buffer.position
+    for key in state_dims():
+        assert torch.equal(batched_buffer.states[key][:7], buffer.states[key][:7])
+        assert torch.equal(batched_buffer.next_states[key][:7], buffer.next_states[key][:7])
+    assert torch.equal(batched_buffer.actions[:7], buffer.actions[:7])
+    assert torch.equal(batched_buffer.rewards[:7], buffer.rewards[:7])
+    assert torch.equal(batched_buffer.dones[:7], buffer.dones[:7])
+    assert torch.equal(
+        batched_buffer.complementary_info["discrete_penalty"][:7],
+        buffer.complementary_info["discrete_penalty"][:7],
+    )
+
+
+def test_add_batch_wraps_around():
+    replay_buffer = create_empty_replay_buffer()  # capacity 10
+    first = transitions_to_batch(create_dummy_transitions(8), images_to_uint8=False)
+    second = transitions_to_batch(create_dummy_transitions(5), images_to_uint8=False)
+
+    replay_buffer.add_batch(**first)
+    replay_buffer.add_batch(**second)
+
+    assert len(replay_buffer) == 10
+    assert replay_buffer.position == 3
+    assert torch.equal(replay_buffer.actions[8:10], second[ACTION][:2])
+    assert torch.equal(replay_buffer.actions[:3], second[ACTION][2:])
+    assert torch.equal(replay_buffer.actions[3:8], first[ACTION][3:8])
+
+
+def test_add_batch_bigger_than_capacity_keeps_most_recent():
+    replay_buffer = create_empty_replay_buffer()  # capacity 10
+    batch = transitions_to_batch(create_dummy_transitions(13))
+
+    replay_buffer.add_batch(**batch)
+
+    assert len(replay_buffer) == 10
+    assert replay_buffer.position == 0
+    assert torch.equal(replay_buffer.actions, batch[ACTION][3:])
+    # uint8 images are converted back to floats in [0, 1]
+    torch.testing.assert_close(replay_buffer.states[OBS_IMAGE], batch["state"][OBS_IMAGE][3:].float() / 255)
+
+
+def create_episodes_transitions(episode_lengths: list[int]) -> list[Transition]:
+    """Contiguous episodes, the reward holds the index of the transition."""
+    transitions = []
+    for length in episode_lengths:
+        states = [create_dummy_state() for _ in range(length + 1)]
+        for i in range(length):
+            transitions.append(
+                Transition(
+                    state=states[i],
+                    action=create_dummy_action(),
+                    reward=float(len(transitions)),
+                    next_state=states[i + 1],
+                    done=i == length - 1,
+                    truncated=False,
+                    complementary_info=None,
+                )
+            )
+    return transitions
+
+
+def test_uint8_image_storage_derives_next_state_across_episodes():
+    transitions = create_episodes_transitions([4, 6, 4])
+    replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, store_images_as_uint8=True)
+
+    for transition in transitions[:4]:
+        replay_buffer.add(**transition)
+    replay_buffer.add_batch(**transitions_to_batch(transitions[4:], images_to_uint8=False))
+
+    assert len(replay_buffer) == 10
+    assert replay_buffer.states[OBS_IMAGE].dtype == torch.uint8
+    assert replay_buffer.states[OBS_STATE].dtype == torch.float32
+    # Only the ends of the two remaining episodes can't be read at the following index
+    assert sorted(replay_buffer.next_state_overrides) == [3, 9]
+
+    batch = replay_buffer.sample(10)
+    assert batch["state"][OBS_IMAGE].dtype == torch.float32
+    for i, reward in enumerate(batch["reward"].tolist()):
+        transition = transitions[int(reward)]
+        for key in ("state", "next_state"):
+            torch.testing.assert_close(batch[key][OBS_STATE][i], transition[key][OBS_STATE])
+            torch.testing.assert_close(
+                batch[key][OBS_IMAGE][i], transition[key][OBS_IMAGE], rtol=0, atol=0.5 / 255 + 1e-6
+            )
+
+
+def test_memory_footprint():
+    replay_buffer = create_empty_replay_buffer()  # capacity 10
+    assert replay_buffer.memory_footprint() == {}
+
+    replay_buffer.add(**create_dummy_transitions(1)[0])
+    footprint = replay_buffer.memory_footprint()
+    assert footprint[f"state.{OBS_IMAGE}"] == 10 * 3 * 84 * 84 * 4
+    assert footprint[f"next_state.{OBS_IMAGE}"] == 10 * 3 * 84 * 84 * 4
+    assert footprint[ACTION] == 10 * 4 * 4
+
+    uint8_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, store_images_as_uint8=True)
+    uint8_buffer.add(**create_dummy_transitions(1)[0])
+    uint8_footprint = uint8_buffer.memory_footprint()
+    assert uint8_footprint[f"state.{OBS_IMAGE}"] == 10 * 3 * 84 * 84
+    assert f"next_state.{OBS_IMAGE}" not in uint8_footprint
+    assert uint8_footprint["next_state_overrides"] > 0
+    assert sum(uint8_footprint.values()) < sum(footprint.values()) / 4
+
+
 def test_sample_from_empty_buffer(replay_buffer):
     with pytest.raises(RuntimeError, match="Cannot sample from an empty buffer"):
         replay_buffer.sample(1)
@@ -679,3 +841,110 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def test_multiprocess_iterator_shapes_basic():
+    buffer = _populate_buffer_for_async_test()
+    batch_size = 2
+    iterator = buffer.get_iterator(batch_size=batch_size, queue_size=1, num_workers=2)
+
+    for _ in range(3):
+        batch = next(iterator)
+        assert batch["state"][OBS_IMAGE].shape == (batch_size, 3, 128, 128)
+        assert batch["state"][OBS_STATE].shape == (batch_size, 11)
+        assert batch["next_state"][OBS_IMAGE].shape == (batch_size, 3, 128, 128)
+        assert batch["next_state"][OBS_STATE].shape == (batch_size, 11)
+
+    iterator.close()
+
+
+def test_multiprocess_iterator_sees_new_transitions_and_episode_ends():
+    transitions = create_episodes_transitions([3, 3, 3])
+    replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, store_images_as_uint8=True)
+    replay_buffer.add_batch(**transitions_to_batch(transitions[:3], images_to_uint8=False))
+
+    iterator = replay_buffer.get_iterator(batch_size=4, queue_size=1, num_workers=1)
+    next(iterator)
+    assert replay_buffer.states[OBS_IMAGE].is_shared()
+
+    # Transitions added after the workers started are sampled as well
+    replay_buffer.add_batch(**transitions_to_batch(transitions[3:], images_to_uint8=False))
+    sampled = set()
+    for _ in range(50):
+        batch = next(iterator)
+        for i, reward in enumerate(batch["reward"].tolist()):
+            transition = transitions[int(reward)]
+            sampled.add(int(reward))
+            torch.testing.assert_close(batch["next_state"][OBS_STATE][i], transition["next_state"][OBS_STATE])
+    iterator.close()
+
+    assert max(sampled) > 2
+
+
+def test_worker_rows_stay_valid_when_transitions_are_added_before_collate():
+    transitions = create_episodes_transitions([6])
+    replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, optimize_memory=True)
+    for transition in transitions[:3]:
+        replay_buffer.add(**transition)
+    replay_buffer.share_memory_()
+
+    # Gather rows the way a sampler worker does
+    storage = replay_buffer._storage()
+    staging = _allocate_staging(storage, batch_size=64)
+    count = _fill_staging_slot(
+        storage,
+        replay_buffer._shared_cursor,
+        replay_buffer._slot_generations,
+        replay_buffer.capacity,
+        staging,
+        next_state_overrides=replay_buffer._shared_next_state_overrides,
+        has_next_state_override=replay_buffer.has_next_state_override,
+    )
+
+    # The learner keeps adding transitions before collating the rows, which drops the override of the
+    # transition that was the newest one when the rows were gathered
+    for transition in transitions[3:]:
+        replay_buffer.add(**transition)
+
+    rows = _select_rows(staging, slice(0, count))
+    batch = replay_buffer._collate_on_device(rows, rows["index"], copy=True)
+
+    sampled = {int(reward) for reward in batch["reward"].tolist()}
+    assert sampled == {0, 1}
+    for i, reward in enumerate(batch["reward"].tolist()):
+        for key in state_dims():
+            torch.testing.assert_close(
+                batch["next_state"][key][i], transitions[int(reward)]["next_state"][key]
+            )
+
+
+def test_worker_regathers_rows_of_slots_being_written():
+    transitions = create_episodes_transitions([4, 6])
+    replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, optimize_memory=True)
+    replay_buffer.add_batch(**transitions_to_batch(transitions))
+    replay_buffer.share_memory_()
+
+    # Slots 0 to 2 are being written by the learner
+    replay_buffer._slot_generations[:3] += 1
+
+    storage = replay_buffer._storage()
+    staging = _allocate_staging(storage, batch_size=64)
+    count = _fill_staging_slot(
+        storage,
+        replay_buffer._shared_cursor,
+        replay_buffer._slot_generations,
+        replay_buffer.capacity,
+        staging,
+        next_state_overrides=replay_buffer._shared_next_state_overrides,
+        has_next_state_override=replay_buffer.has_next_state_override,
+    )
+
+    rows = _select_rows(staging, slice(0, count))
+    assert count == 9
+    # The newest transition (slot 9) is never sampled, slot 3 ends an episode and has its next_state restored
+    assert set(rows["index"].tolist()) <= {3, 4, 5, 6, 7, 8}
+    for i, reward in enumerate(rows["reward"].tolist()):
+        for key in state_dims():
+            torch.testing.assert_close(
+                rows["next_state"][key][i], transitions[int(reward)]["next_state"][key]
+            )
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from lerobot.utils import robot_utils
+from lerobot.utils.robot_utils import RateScheduler
+
+
+class FakeClock:
+    """Replaces the `time` module of `robot_utils`: sleeps are exact and each reading takes `read_cost_s`."""
+
+    def __init__(self, read_cost_s: float = 1e-9):
+        self.now = 100.0
+        self.read_cost_s = read_cost_s
+        self.sleeps = []
+
+    def perf_counter(self) -> float:
+        self.now += self.read_cost_s
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(robot_utils, "time", clock)
+    return clock
+
+
+def test_rate_scheduler_keeps_phase(clock):
+    scheduler = RateScheduler(fps=10, spin_budget_s=0.0)
+    scheduler.start()
+    start = clock.now
+
+    for i in range(1, 101):
+        clock.now += 0.01 * (i % 7)  # variable work
+        scheduler.sleep()
+        assert clock.now == pytest.approx(start + i * 0.1)
+
+    assert scheduler.num_ticks == 100
+    assert scheduler.num_missed_deadlines == 0
+    assert scheduler.jitter_histogram[0] == 100
+
+
+def test_rate_scheduler_skips_missed_ticks(clock):
+    scheduler = RateScheduler(fps=10, spin_budget_s=0.0)
+    scheduler.start()
+    start = clock.now
+
+    # Overrun by one and a half period: the deadlines at 0.1 and 0.2 are missed
+    clock.now += 0.25
+    jitter = scheduler.sleep()
+    assert jitter == pytest.approx(0.15)
+    assert clock.now == pytest.approx(start + 0.25)
+    assert scheduler.num_missed_deadlines == 2
+    assert scheduler.jitter_histogram[-1] == 1
+
+    # The next tick is back on the original phase
+    clock.now += 0.01
+    scheduler.sleep()
+    assert clock.now == pytest.approx(start + 0.3)
+    assert scheduler.stats()["num_ticks"] == 2
+
+
+def test_rate_scheduler_spins_before_deadline(monkeypatch):
+    clock = FakeClock(read_cost_s=0.0001)
+    monkeypatch.setattr(robot_utils, "time", clock)
+    scheduler = RateScheduler(fps=50, spin_budget_s=0.005)
+    scheduler.start()
+    deadline = scheduler.next_deadline()
+
+    scheduler.sleep()
+
+    assert len(clock.sleeps) == 1
+    # Sleeps until the spin budget, then spins until the deadline
+    assert clock.sleeps[0] == pytest.approx(0.015, abs=0.001)
+    assert deadline <= clock.now < deadline + 0.001
+
+
+def test_rate_scheduler_rejects_invalid_fps():
+    with pytest.raises(ValueError):
+        RateScheduler(fps=0)
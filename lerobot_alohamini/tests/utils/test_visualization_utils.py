@@ -33,10 +33,28 @@ def mock_rerun(monkeypatch):
     """
     calls = []
 
+    class DummyColumns:
+        def __init__(self, scalars):
+            self.scalars = np.asarray(scalars)
+            self.lengths = None
+
+        def partition(self, lengths):
+            self.lengths = list(lengths)
+            return self
+
     class DummyScalar:
         def __init__(self, value):
             self.value = float(value)
 
+        @staticmethod
+        def columns(scalars):
+            return DummyColumns(scalars)
+
+    class DummyTimeColumn:
+        def __init__(self, timeline, timestamp):
+            self.timeline = timeline
+            self.timestamp = np.asarray(timestamp)
+
     class DummyImage:
         def __init__(self, arr):
             self.arr = arr
@@ -44,10 +62,20 @@ def mock_rerun(monkeypatch):
     def dummy_log(key, obj, **kwargs):
         calls.append((key, obj, kwargs))
 
+    def dummy_send_columns(key, indexes, columns):
+        calls.append((key, columns, {"indexes": indexes}))
+
+    def dummy_set_time(timeline, **kwargs):
+        dummy_rr.times.append((timeline, kwargs))
+
     dummy_rr = SimpleNamespace(
         Scalars=DummyScalar,
         Image=DummyImage,
+        TimeColumn=DummyTimeColumn,
         log=dummy_log,
+        send_columns=dummy_send_columns,
+        set_time=dummy_set_time,
+        times=[],
         init=lambda *a, **k: None,
         spawn=lambda *a, **k: None,
     )
@@ -224,3 +252,52 @@ def test_log_rerun_data_kwargs_only(mock_rerun):
     a = _obj_for(calls, "action.a")
     assert type(a).__name__ == "DummyScalar"
     assert a.value == pytest.approx(1.0)
+
+
+def test_rerun_sink_batches_scalars_into_columns(mock_rerun):
+    vu, calls = mock_rerun
+
+    sink = vu.RerunSink(flush_interval_s=1e9)
+    for i in range(3):
+        sink.log(
+            observation={"temp": float(i), "observation.vec": np.array([i, 10 + i], dtype=np.float32)},
+            action={"a": np.full((2, 2), i, dtype=np.float32)},
+        )
+    sink.close()
+
+    # One columnar update per entity, 1-D arrays are not split per element
+    assert sorted(_keys(calls)) == ["action.a", "observation.temp", "observation.vec"]
+    assert sink.num_dropped == 0
+
+    temp = _obj_for(calls, "observation.temp")
+    np.testing.assert_allclose(temp.scalars, [0.0, 1.0, 2.0])
+    assert temp.lengths == [1, 1, 1]
+
+    vec = _obj_for(calls, "observation.vec")
+    np.testing.assert_allclose(vec.scalars, [0, 10, 1, 11, 2, 12])
+    assert vec.lengths == [2, 2, 2]
+
+    (time_column,) = _kwargs_for(calls, "observation.vec")["indexes"]
+    assert time_column.timeline == "log_time"
+    assert len(time_column.timestamp) == 3
+    assert np.all(np.diff(time_column.timestamp) >= 0)
+
+    assert _obj_for(calls, "action.a").lengths == [4, 4, 4]
+
+
+def test_rerun_sink_downsamples_and_throttles_images(mock_rerun):
+    vu, calls = mock_rerun
+
+    sink = vu.RerunSink(max_image_size=5, image_fps=1e-6)
+    for _ in range(3):
+        sink.log(observation={"observation.camera": np.zeros((3, 10, 20), dtype=np.uint8)})
+    sink.close()
+
+    # Only the first image is logged at this rate, transposed to HWC and strided to fit in 5 pixels
+    assert _keys(calls) == ["observation.camera"]
+    assert _obj_for(calls, "observation.camera").arr.shape == (3, 5, 3)
+    # On the timeline of the scalars, not as a static image
+    assert _kwargs_for(calls, "observation.camera").get("static", False) is False
+    ((timeline, time_kwargs),) = vu.rr.times
+    assert timeline == "log_time"
+    assert time_kwargs["timestamp"] > 0